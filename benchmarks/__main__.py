@@ -0,0 +1,87 @@
+"""
+Набор бенчмарков горячих путей отрисовки и логики.
+
+Запуск из корня репозитория:
+    python -m benchmarks --output results.json
+    python -m benchmarks --output new.json --compare results.json --threshold 0.10
+    python -m benchmarks --only card_draw,screen --quick
+
+При --compare бенчмарки, чья медиана выросла больше чем на threshold,
+помечаются как регрессии, и процесс завершается с кодом 1.
+"""
+import argparse
+import json
+import platform
+import sys
+import time
+import pygame
+from benchmarks import ai, card_animation, card_draw, kiosk, net_load, screen, startup
+
+SUITES = {"ai": ai, "card_draw": card_draw, "card_animation": card_animation, "screen": screen,
+          "kiosk": kiosk, "net_load": net_load, "startup": startup}
+
+
+def run_suites(names, quick=False):
+    results = {}
+    for name in names:
+        results.update(SUITES[name].run(quick))
+    return {
+        "meta": {
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "python": platform.python_version(),
+            "pygame": pygame.version.ver,
+            "platform": platform.platform(),
+            "quick": quick,
+        },
+        "results": results,
+    }
+
+
+def compare(current, baseline, threshold):
+    """
+    Сравнивает медианы с базовым прогоном.
+
+    :return: Список строк (имя, старое, новое, отношение, регрессия ли).
+    """
+    rows = []
+    for name, stats in current["results"].items():
+        old = baseline["results"].get(name)
+        if not old:
+            continue
+        ratio = stats["median_us"] / old["median_us"] if old["median_us"] else float("inf")
+        rows.append((name, old["median_us"], stats["median_us"], ratio, ratio > 1 + threshold))
+    return rows
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Бенчмарки игры на память")
+    parser.add_argument("--output", help="Файл для результатов в JSON")
+    parser.add_argument("--compare", help="JSON предыдущего прогона для поиска регрессий")
+    parser.add_argument("--threshold", type=float, default=0.10,
+                        help="Допустимое замедление медианы (0.10 = 10%%)")
+    parser.add_argument("--only", help="Наборы через запятую: " + ", ".join(SUITES))
+    parser.add_argument("--quick", action="store_true", help="Меньше повторов (для быстрой проверки)")
+    args = parser.parse_args(argv)
+
+    names = args.only.split(",") if args.only else list(SUITES)
+    current = run_suites(names, args.quick)
+    for name, stats in current["results"].items():
+        print(f"{name:<40} {stats['median_us']:12.2f} us")
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(current, f, indent=2)
+
+    if not args.compare:
+        return 0
+    with open(args.compare, encoding="utf-8") as f:
+        baseline = json.load(f)
+    rows = compare(current, baseline, args.threshold)
+    print()
+    for name, old, new, ratio, regressed in rows:
+        print(f"{name:<40} {old:12.2f} -> {new:12.2f} us  x{ratio:5.2f}  {'REGRESSION' if regressed else ''}")
+    return 1 if any(row[4] for row in rows) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,47 @@
+"""
+Компьютерный игрок: время одного решения MemoryAI на поле 20x20.
+
+Решение должно занимать O(1) независимо от размера поля, чтобы компьютер
+(и подсказка) укладывался в кадр даже на самых больших полях:
+    start      — ничего не известно, выбирается случайная невиданная карта;
+    known_pair — известна пара, она и выбирается;
+    crowded    — почти все невиданные карты заняты (редкий полный перебор).
+"""
+import random
+from benchmarks.common import measure
+from game.memory_ai import MemoryAI
+from game.memory_settings import MemorySettings
+from game.simulation import GameEngine
+
+
+def make_engine():
+    settings = MemorySettings()
+    settings.custom_rows = settings.custom_cols = 20
+    settings.set_difficulty("custom")
+    return GameEngine(settings, seed=0)
+
+
+def make_case(case):
+    engine = make_engine()
+    ai = MemoryAI(random.Random(0))
+    ai.choose(engine, 0.0)  # Поле известно ИИ с первого хода
+    faces = engine.faces
+    if case == "known_pair":
+        first = 0
+        second = faces.index(faces[first], first + 1)
+        ai.seen(first, faces[first])
+        ai.seen(second, faces[second])
+    elif case == "crowded":
+        # Все невиданные карты, кроме одной, ещё переворачиваются
+        engine.busy_until = [1] * len(faces)
+        engine.busy_until[-1] = 0
+    return engine, ai
+
+
+def run(quick=False):
+    number = 200 if quick else 2000
+    results = {}
+    for case in ("start", "known_pair", "crowded"):
+        engine, ai = make_case(case)
+        results[f"ai.choose.20x20.{case}"] = measure(lambda: ai.choose(engine, 0.5), number=number)
+    return results
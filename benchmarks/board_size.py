@@ -0,0 +1,107 @@
+"""
+Бенчмарк кадра игры на полях разного размера (вплоть до 20x20).
+
+Запускается без окна и звука (драйверы SDL dummy). Для каждого поля
+измеряет время update + draw + display.update в двух сценариях:
+    idle  — ничего не анимируется;
+    worst — все карты угаданы и пульсируют (перерисовываются каждый кадр).
+Поле «держит» целевой FPS, если 95-й перцентиль кадра укладывается в 1/fps.
+
+Пример запуска (из корня репозитория):
+    python -m benchmarks.board_size --frames 300 --output board_size.json
+"""
+import argparse
+import json
+import random
+import sys
+import time
+
+from benchmarks.common import init_display, percentile
+import pygame
+from game.memory_settings import MemorySettings
+from game.memory_objects.game_screen import GameScreen
+
+BOARDS = [("easy", None), ("medium", None), ("hard", None), ("insane", None),
+          ("custom", (10, 10)), ("custom", (16, 16)), ("custom", (20, 20))]
+
+
+def make_settings(difficulty, size):
+    settings = MemorySettings()
+    if size:
+        settings.custom_rows, settings.custom_cols = size
+    settings.set_difficulty(difficulty)
+    settings.difficulty = difficulty
+    return settings
+
+
+def measure(screen, settings, scenario, frames):
+    """Время кадров (мс) для одного поля и сценария"""
+    random.seed(0)
+    game = GameScreen(screen, settings)
+    if scenario == "worst":
+        for card in game.cards:
+            card.revealed = True
+            card.mark_matched()
+    pygame.display.update(game.draw())  # Первый кадр рисуется целиком
+
+    times = []
+    for _ in range(frames):
+        start = time.perf_counter()
+        game.update(settings.time_limit)
+        rects = game.draw()
+        if rects:
+            pygame.display.update(rects)
+        times.append((time.perf_counter() - start) * 1000)
+    return times
+
+
+def run(frames=300, fps=None):
+    """
+    Прогоняет все поля и сценарии.
+
+    :return: Список результатов (словари с mean/p95 и признаком укладывания в бюджет).
+    """
+    base = MemorySettings()
+    fps = fps or base.fps
+    budget = 1000 / fps
+    screen = init_display(base.screen_width, base.screen_height)
+
+    results = []
+    for difficulty, size in BOARDS:
+        settings = make_settings(difficulty, size)
+        for scenario in ("idle", "worst"):
+            times = measure(screen, settings, scenario, frames)
+            p95 = percentile(times, 0.95)
+            results.append({
+                "board": f"{settings.rows}x{settings.cols}",
+                "difficulty": difficulty,
+                "scenario": scenario,
+                "cards": settings.total_cards,
+                "mean_ms": sum(times) / len(times),
+                "p95_ms": p95,
+                "budget_ms": budget,
+                "within_budget": p95 <= budget,
+            })
+    pygame.quit()
+    return results
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Время кадра на полях разного размера")
+    parser.add_argument("--frames", type=int, default=300)
+    parser.add_argument("--fps", type=int, default=None, help="Целевой FPS (по умолчанию из настроек)")
+    parser.add_argument("--output", help="Файл для результатов в JSON")
+    args = parser.parse_args(argv)
+
+    results = run(args.frames, args.fps)
+    for row in results:
+        print(f"{row['board']:>6} {row['scenario']:<5} mean {row['mean_ms']:6.2f} ms  "
+              f"p95 {row['p95_ms']:6.2f} ms  {'OK' if row['within_budget'] else 'SLOW'}")
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(results, f, ensure_ascii=False, indent=2)
+    return 0 if all(row["within_budget"] for row in results) else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,54 @@
+"""
+Шаг анимации всех карт поля: цикл Card.update_animation против пакетного шага NumPy.
+
+Сценарии:
+    idle     — ничего не анимируется;
+    pulsing  — все карты угаданы и пульсируют;
+    flipping — все карты переворачиваются (переворот перезапускается по окончании).
+"""
+import pygame
+from benchmarks.common import init_display, measure
+from game.memory_objects.card import Card
+from game.memory_objects.card_animator import CardAnimator, np
+
+CARD_COUNTS = (48, 200, 400)
+
+
+def make_cards(count, scenario):
+    image = pygame.Surface((40, 40))
+    cards = [Card(pygame.Rect(0, 0, 40, 40), image, id=i // 2) for i in range(count)]
+    if scenario == "pulsing":
+        for card in cards:
+            card.revealed = True
+            card.mark_matched()
+    elif scenario == "flipping":
+        for card in cards:
+            card.start_flip_animation()
+    return cards
+
+
+def frame(animator, scenario):
+    """Один кадр: шаг анимации и сброс флагов, как это делает отрисовка"""
+    def step():
+        for slot in animator.step():
+            card = animator.cards[slot]
+            card.dirty = False
+            if scenario == "flipping" and not card.animating:
+                card.start_flip_animation()
+        animator.take_changed()
+    return step
+
+
+def run(quick=False):
+    init_display()
+    number = 100 if quick else 1000
+    modes = ("loop", "numpy") if np is not None else ("loop",)
+    results = {}
+    for count in CARD_COUNTS:
+        for scenario in ("idle", "pulsing", "flipping"):
+            for mode in modes:
+                animator = CardAnimator(make_cards(count, scenario), vectorized=mode == "numpy")
+                animator.take_changed()
+                results[f"card_animation.{scenario}.{count}.{mode}"] = measure(frame(animator, scenario),
+                                                                              number=number)
+    return results
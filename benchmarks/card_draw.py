@@ -0,0 +1,103 @@
+"""
+Пропускная способность Card.draw в разных состояниях анимации и отрисовки
+полного поля (по одной карте или одним blits, с приведением формата и без).
+"""
+import math
+import pygame
+from benchmarks.common import init_display, measure
+from game.memory_objects.card import Card
+from game.render_backend import backend
+
+# Значения, которые анимации реально проходят, — чтобы замерять и попадания в кэш спрайтов
+FLIP_ANGLES = [0.2 * step for step in range(math.ceil((math.pi / 2) / 0.2))]
+PULSE_SCALES = [1.0 + 0.01 * step for step in range(-10, 11)]
+FADE_ALPHAS = list(range(255, 0, -5))
+
+
+def make_card(state):
+    image = backend.prepare(pygame.Surface((75, 75)))  # Лицевые стороны приходят в формате экрана
+    image.fill((200, 120, 60))
+    card = Card(pygame.Rect(10, 10, 75, 75), image, id=0)
+    if state == "idle":
+        card.revealed = True
+    elif state == "flipping":
+        card.animating = True
+    elif state == "pulsing":
+        card.revealed = True
+        card.matched = True
+    elif state == "fading":
+        card.revealed = True
+        card.matched = True
+        card.fading = True
+    return card
+
+
+def cycle(card, attribute, values):
+    """Функция, которая на каждом вызове ставит следующее значение анимации и рисует карту"""
+    state = {"i": 0}
+
+    def step(surface):
+        setattr(card, attribute, values[state["i"] % len(values)])
+        state["i"] += 1
+        card.draw(surface)
+    return step
+
+
+def run(quick=False):
+    screen = init_display()
+    number = 200 if quick else 2000
+    results = {}
+    for state, attribute, values in (("idle", None, None),
+                                     ("flipping", "animation_angle", FLIP_ANGLES),
+                                     ("pulsing", "scale", PULSE_SCALES),
+                                     ("fading", "fade_alpha", FADE_ALPHAS)):
+        card = make_card(state)
+        if attribute:
+            step = cycle(card, attribute, values)
+            results[f"card_draw.{state}"] = measure(lambda: step(screen), number=number)
+        else:
+            results[f"card_draw.{state}"] = measure(lambda: card.draw(screen), number=number)
+    results.update(run_board(screen, number // 10))
+    return results
+
+
+
+def board():
+    """48 открытых карт поля 6x8"""
+    cards = []
+    for index in range(48):
+        image = backend.prepare(pygame.Surface((75, 75)))
+        image.fill((200, 120, 60))
+        card = Card(pygame.Rect(10 + index % 8 * 85, 10 + index // 8 * 85, 75, 75), image, id=index)
+        card.revealed = True
+        cards.append(card)
+    return cards
+
+
+def draw_each(cards, surface):
+    for card in cards:
+        card.draw(surface)
+
+
+def draw_batched(cards, surface):
+    items = [card.render_item() for card in cards]
+    backend.blit_many(surface, [item for item in items if item is not None])
+
+
+def run_board(screen, number):
+    """
+    Полное поле: цикл card.draw против одного blits, а также blit поверхностей
+    в чужом формате (24 бита) против приведённых к формату экрана.
+    """
+    cards = board()
+    results = {
+        "card_draw.board_loop": measure(lambda: draw_each(cards, screen), number=number),
+        "card_draw.board_blits": measure(lambda: draw_batched(cards, screen), number=number),
+    }
+    raw = pygame.Surface((75, 75), 0, 24)
+    raw.fill((200, 120, 60))
+    for name, image in (("unconverted", raw), ("converted", backend.prepare(raw))):
+        sequence = [(image, card.rect.topleft) for card in cards]
+        results[f"card_draw.board_format.{name}"] = measure(lambda: backend.blit_many(screen, sequence),
+                                                           number=number)
+    return results
@@ -0,0 +1,55 @@
+"""
+Общие помощники бенчмарков: безголовый pygame и замер времени.
+"""
+import os
+import statistics
+import time
+
+# Без окна и звука: бенчмарки должны работать на CI без дисплея
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import pygame
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))  # Корень репозитория
+DIFFICULTIES = ("easy", "medium", "hard", "insane")
+
+
+def init_display(width=800, height=600):
+    """Инициализирует pygame с фиктивным дисплеем и возвращает экран"""
+    pygame.init()
+    return pygame.display.set_mode((width, height))
+
+
+def measure(fn, number=100, repeat=5, setup=None):
+    """
+    Замеряет время вызова fn.
+
+    :param fn: Замеряемая функция без аргументов.
+    :param number: Вызовов в одном прогоне.
+    :param repeat: Количество прогонов.
+    :param setup: Функция, вызываемая перед каждым прогоном (не замеряется).
+    :return: Словарь с медианой, минимумом и средним временем одного вызова (мкс).
+    """
+    for _ in range(max(1, number // 10)):
+        fn()  # Прогрев: кэши спрайтов и текста, ветвления интерпретатора
+    runs = []
+    for _ in range(repeat):
+        if setup:
+            setup()
+        start = time.perf_counter()
+        for _ in range(number):
+            fn()
+        runs.append((time.perf_counter() - start) / number * 1e6)
+    return {
+        "median_us": statistics.median(runs),
+        "min_us": min(runs),
+        "mean_us": statistics.fmean(runs),
+        "number": number,
+        "repeat": repeat,
+    }
+
+
+def percentile(values, fraction):
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * fraction))]
@@ -0,0 +1,47 @@
+"""
+Киоск: время кадра (шаг логики + отрисовка) в зависимости от количества полей.
+
+Все поля в окне 1600x1200, на каждом пульсирует пара совпавших карт и
+переворачивается ещё одна, так что каждое поле рисует изменения каждый
+кадр. При линейном росте per_board почти не меняется с числом полей.
+"""
+import pygame
+from benchmarks.common import measure
+from game.kiosk import KioskScene
+
+BOARD_COUNTS = (1, 2, 4, 8, 16)
+
+
+def make_kiosk(screen, boards):
+    kiosk = KioskScene(screen, "medium", boards, seed=0)
+    for board in kiosk.boards:
+        game = board.game
+        order = sorted(range(len(game.cards)), key=lambda i: game.cards[i].id)
+        for index in order[:2]:
+            game.cards[index].revealed = True
+            game.cards[index].mark_matched()  # Пульсирует, пока идёт замер
+    kiosk.draw()  # Первый кадр — целиком
+    return kiosk
+
+
+def frame(kiosk):
+    for board in kiosk.boards:
+        card = board.game.cards[-1]
+        if not card.animating:
+            card.start_flip_animation()  # Переворот без конца, как при постоянных кликах
+    kiosk.step()
+    kiosk.draw()
+
+
+def run(quick=False):
+    pygame.init()
+    screen = pygame.Surface((1600, 1200))  # Окно не нужно: поля рисуют в подповерхности
+    number = 20 if quick else 200
+    results = {}
+    for boards in BOARD_COUNTS:
+        kiosk = make_kiosk(screen, boards)
+        stats = measure(lambda: frame(kiosk), number=number)
+        results[f"kiosk.frame.boards_{boards}"] = stats
+        per_board = {key: value / boards for key, value in stats.items() if key.endswith("_us")}
+        results[f"kiosk.frame_per_board.boards_{boards}"] = {**stats, **per_board}
+    return results
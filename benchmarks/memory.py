@@ -0,0 +1,167 @@
+"""
+Отчёт о памяти поля по уровням сложности (tracemalloc).
+
+Для каждого поля считает:
+    card_bytes   — память Python на одну карту (объект Card с его прямоугольниками);
+    dict_card_bytes — то же для карты с __dict__ (те же поля без __slots__) — база
+                   для сравнения: насколько __slots__ уменьшили карту;
+    board_bytes  — память Python на всё поле: GameScreen, карты, модель, аниматор;
+    face_bytes   — пиксели лицевых сторон (поверхности SDL tracemalloc не видит,
+                   поэтому они считаются по размеру и глубине цвета);
+    erase_bytes  — прочие поверхности поля (фон, которым стираются карты);
+    cache_bytes  — пиксели в кэше спрайтов после кадра со всеми открытыми картами;
+    frame_peak   — пик временных выделений Python за кадр, когда все карты анимируются.
+
+Пример запуска (из корня репозитория):
+    python -m benchmarks.memory --output memory.json
+"""
+import argparse
+import json
+import sys
+import tracemalloc
+
+from benchmarks.common import DIFFICULTIES, init_display
+import pygame
+from game.memory_settings import MemorySettings
+from game.memory_objects.card import Card
+from game.memory_objects.game_screen import GameScreen
+from game.memory_objects.sprite_cache import sprite_cache
+
+BOARDS = [(difficulty, None) for difficulty in DIFFICULTIES] + [("custom", (20, 20))]
+FRAMES = 60
+
+
+class DictCard:
+    """Карта с теми же полями, но в __dict__ — как Card без __slots__"""
+    __init__ = Card.__init__
+
+
+def make_settings(difficulty, size):
+    settings = MemorySettings()
+    if size:
+        settings.custom_rows, settings.custom_cols = size
+    settings.set_difficulty(difficulty)
+    settings.difficulty = difficulty
+    return settings
+
+
+def traced(fn):
+    """:return: (результат fn, байт Python, выделенных и не освобождённых за вызов)"""
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    result = fn()
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return result, after - before
+
+
+def surface_bytes(surface):
+    width, height = surface.get_size()
+    return width * height * surface.get_bytesize()
+
+
+def face_owners(game):
+    """Поверхности с пикселями лицевых сторон: подповерхности атласа дают один атлас"""
+    owners = {}
+    for card in game.cards:
+        image = card.image
+        owner = image.get_parent() or image
+        owners[id(owner)] = owner
+    return list(owners.values())
+
+
+def erase_bytes(game):
+    """Прочие поверхности поля, кроме экрана и лицевых сторон"""
+    skip = {id(game.screen)} | {id(owner) for owner in face_owners(game)}
+    return sum(surface_bytes(value) for value in vars(game).values()
+               if isinstance(value, pygame.Surface) and id(value) not in skip)
+
+
+def cache_bytes(game):
+    """Пиксели, которые кэш спрайтов держит для открытых карт поля"""
+    sprite_cache.clear()
+    for card in game.cards:
+        card.revealed = True
+        card.dirty = True
+    game.full_redraw = True
+    game.draw()
+    return sprite_cache.stats()["bytes"]
+
+
+def card_bytes(game, card_class=Card):
+    """Память Python на одну карту: те же карты поля, созданные заново как card_class"""
+    args = [(card.rect.copy(), card.image, card.id) for card in game.cards]
+    cards, size = traced(lambda: [card_class(rect, image, id) for rect, image, id in args])
+    return size / len(cards)
+
+
+def frame_peak(game):
+    """Пик временных выделений Python за кадр при анимации всех карт"""
+    for card in game.cards:
+        card.revealed = True
+        card.mark_matched()  # Все карты пульсируют и перерисовываются каждый кадр
+    game.draw()
+    for _ in range(FRAMES * 4):
+        game.update(game.settings.time_limit)
+        game.draw()  # Прогрев кэша спрайтов: полный цикл пульсации
+    tracemalloc.start()
+    peak = 0
+    for _ in range(FRAMES):
+        tracemalloc.reset_peak()
+        base = tracemalloc.get_traced_memory()[0]
+        game.update(game.settings.time_limit)
+        game.draw()
+        peak = max(peak, tracemalloc.get_traced_memory()[1] - base)
+    tracemalloc.stop()
+    return peak
+
+
+def report():
+    base = MemorySettings()
+    screen = init_display(base.screen_width, base.screen_height)
+    GameScreen(screen, make_settings("easy", None), seed=0)  # Общие шрифты и звуки — не в счёт поля
+    for _ in range(100):
+        DictCard(pygame.Rect(0, 0, 10, 10), None, 0)  # Общие ключи __dict__ и прогрев интерпретатора
+
+    rows = []
+    for difficulty, size in BOARDS:
+        settings = make_settings(difficulty, size)
+        game, board = traced(lambda: GameScreen(screen, settings, seed=0))
+        rows.append({
+            "board": f"{settings.rows}x{settings.cols}",
+            "difficulty": difficulty,
+            "cards": len(game.cards),
+            "card_bytes": card_bytes(game),
+            "dict_card_bytes": card_bytes(game, DictCard),
+            "board_bytes": board,
+            "face_bytes": sum(map(surface_bytes, face_owners(game))),
+            "erase_bytes": erase_bytes(game),
+            "cache_bytes": cache_bytes(game),
+            "frame_peak": frame_peak(game),
+        })
+    pygame.quit()
+    return rows
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Память поля по уровням сложности")
+    parser.add_argument("--output", help="Файл для результатов в JSON")
+    args = parser.parse_args(argv)
+
+    rows = report()
+    print(f"{'поле':>6} {'карт':>5} {'Б/карту':>8} {'с dict':>7} {'меньше':>7} {'поле, КБ':>9} {'лица, КБ':>9} {'фон, КБ':>8} "
+          f"{'кэш, КБ':>8} {'кадр, КБ':>9}")
+    for row in rows:
+        saved = 1 - row["card_bytes"] / row["dict_card_bytes"]
+        print(f"{row['board']:>6} {row['cards']:>5} {row['card_bytes']:8.0f} {row['dict_card_bytes']:7.0f} "
+              f"{saved:7.0%} {row['board_bytes'] / 1024:9.1f} "
+              f"{row['face_bytes'] / 1024:9.1f} {row['erase_bytes'] / 1024:8.1f} {row['cache_bytes'] / 1024:8.1f} "
+              f"{row['frame_peak'] / 1024:9.1f}")
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(rows, f, ensure_ascii=False, indent=2)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
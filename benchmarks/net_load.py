@@ -0,0 +1,148 @@
+"""
+Нагрузочный тест сетевой игры: сервер, игрок-бот и N зрителей в одном процессе.
+
+Бот кликает случайные закрытые карты (по своей копии состояния, как настоящий
+клиент), зрители только читают рассылки. Замеряются задержка доставки STATE
+от кодирования на сервере до применения у зрителя (p50/p95/p99), кадры и байты
+в секунду, а также пропуски рассылок из-за переполненных буферов клиентов.
+Всё идёт через loopback, поэтому задержка — это цена сервера и цикла asyncio,
+а не сети.
+
+Пример запуска (из корня репозитория):
+    python -m benchmarks.net_load --spectators 1,10,100 --duration 5 --output net_load.json
+"""
+import argparse
+import asyncio
+import json
+import random
+import statistics
+import sys
+import time
+
+from benchmarks.common import percentile
+from game import protocol
+from game.memory_settings import MemorySettings
+from game.server import GameClient, GameServer
+
+SPECTATORS = (1, 10, 100)
+
+
+async def spectate(client, latencies):
+    while True:
+        kind, sent_us = await client.receive()
+        if sent_us is not None:
+            latencies.append(protocol.latency_us(sent_us))
+
+
+async def play(client, rng, interval):
+    """Бот: раз в interval секунд кликает случайную закрытую карту"""
+    while True:
+        await asyncio.sleep(interval)
+        state = client.state
+        if client.game is None or state.result:
+            continue
+        total = client.game["rows"] * client.game["cols"]
+        closed = [index for index in range(total) if not (state.revealed | state.matched) >> index & 1]
+        if closed:
+            await client.click(rng.choice(closed))
+
+
+async def load(spectators, duration, difficulty="medium", click_interval=0.05, seed=0):
+    """
+    Один прогон нагрузки.
+
+    :param spectators: Количество зрителей.
+    :param duration: Длительность замера (сек).
+    :param difficulty: Сложность партий на сервере.
+    :param click_interval: Пауза между кликами бота (сек).
+    :return: Словарь с задержками (мкс), кадрами и байтами в секунду.
+    :raises RuntimeError: Если зрителям не доставлено ни одного STATE.
+    """
+    settings = MemorySettings()
+    settings.server_restart_delay = 0.5  # Партии идут одна за другой
+    server = GameServer(settings, difficulty, seed, host="127.0.0.1", port=0)
+    port = await server.start()
+
+    latencies = []
+    clients = []
+    tasks = []
+    for _ in range(spectators):
+        client = GameClient(protocol.SPECTATOR)
+        await client.connect("127.0.0.1", port)
+        clients.append(client)
+        tasks.append(asyncio.create_task(spectate(client, latencies)))
+    player = GameClient(protocol.PLAYER)
+    await player.connect("127.0.0.1", port)
+    clients.append(player)
+    tasks.append(asyncio.create_task(spectate(player, [])))
+    tasks.append(asyncio.create_task(play(player, random.Random(seed), click_interval)))
+
+    await asyncio.sleep(0.2)  # Снимки при подключении в замер не входят
+    latencies.clear()
+    frames, sent = server.frames_sent, server.bytes_sent
+    started = time.perf_counter()
+    await asyncio.sleep(duration)
+    elapsed = time.perf_counter() - started
+    frames, sent = server.frames_sent - frames, server.bytes_sent - sent
+
+    for task in tasks:
+        task.cancel()
+    for client in clients:
+        await client.close()
+    await server.close()
+    if not latencies:
+        raise RuntimeError(f"{spectators} зрителей: за {duration} с не доставлено ни одного STATE")
+    return {
+        "spectators": spectators,
+        "min_us": min(latencies),
+        "mean_us": statistics.fmean(latencies),
+        "p50_us": percentile(latencies, 0.50),
+        "p95_us": percentile(latencies, 0.95),
+        "p99_us": percentile(latencies, 0.99),
+        "frames_per_s": frames / elapsed,
+        "bytes_per_s": sent / elapsed,
+        "games": server.game_id,
+        "skipped": server.skipped,
+        "deliveries": len(latencies),
+    }
+
+
+def run(quick=False):
+    """Задержка доставки для набора бенчмарков (median_us — p50)"""
+    results = {}
+    for spectators in SPECTATORS[:2] if quick else SPECTATORS:
+        row = asyncio.run(load(spectators, 1 if quick else 3))
+        results[f"net_load.latency.spectators_{spectators}"] = {
+            "median_us": row["p50_us"],
+            "number": row["deliveries"],
+            "repeat": 1,
+            **row,
+        }
+    return results
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Нагрузочный тест сервера сетевой игры")
+    parser.add_argument("--spectators", default=",".join(map(str, SPECTATORS)),
+                        help="Количество зрителей через запятую")
+    parser.add_argument("--duration", type=float, default=5, help="Длительность каждого прогона (сек)")
+    parser.add_argument("--difficulty", default="medium")
+    parser.add_argument("--click-interval", type=float, default=0.05, help="Пауза между кликами бота (сек)")
+    parser.add_argument("--output", help="Файл для результатов в JSON")
+    args = parser.parse_args(argv)
+
+    results = []
+    for spectators in map(int, args.spectators.split(",")):
+        row = asyncio.run(load(spectators, args.duration, args.difficulty, args.click_interval))
+        results.append(row)
+        print(f"{spectators:>5} зрителей  p50 {row['p50_us'] / 1000:6.2f} ms  p95 {row['p95_us'] / 1000:6.2f} ms  "
+              f"p99 {row['p99_us'] / 1000:6.2f} ms  {row['frames_per_s']:8.0f} кадров/с  "
+              f"{row['bytes_per_s'] / 1024:7.1f} КБ/с  пропусков {row['skipped']}")
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(results, f, ensure_ascii=False, indent=2)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
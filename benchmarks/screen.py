@@ -0,0 +1,41 @@
+"""
+GameScreen: полная отрисовка, update за кадр и генерация поля для каждой сложности.
+"""
+import random
+from benchmarks.common import DIFFICULTIES, init_display, measure
+from game.memory_settings import MemorySettings
+from game.memory_objects.game_screen import GameScreen
+
+
+def make_game(screen, difficulty, render_mode="dirty"):
+    random.seed(0)
+    settings = MemorySettings(difficulty)
+    settings.render_mode = render_mode
+    return GameScreen(screen, settings)
+
+
+def run(quick=False):
+    screen = init_display()
+    number = 20 if quick else 200
+    results = {}
+    for difficulty in DIFFICULTIES:
+        # Полная перерисовка экрана (режим "full")
+        game = make_game(screen, difficulty, "full")
+        results[f"screen_draw.full.{difficulty}"] = measure(game.draw, number=number)
+
+        # Перерисовка изменившихся областей, когда ничего не анимируется
+        game = make_game(screen, difficulty)
+        game.draw()
+        results[f"screen_draw.dirty_idle.{difficulty}"] = measure(game.draw, number=number)
+
+        # Логика кадра в покое и когда все карты пульсируют
+        time_limit = game.settings.time_limit
+        results[f"screen_update.idle.{difficulty}"] = measure(lambda: game.update(time_limit), number=number)
+        for card in game.cards:
+            card.revealed = True
+            card.mark_matched()
+        results[f"screen_update.pulsing.{difficulty}"] = measure(lambda: game.update(time_limit), number=number)
+
+        # Генерация поля
+        results[f"generate_cards.{difficulty}"] = measure(game._generate_cards, number=max(1, number // 10))
+    return results
@@ -0,0 +1,58 @@
+"""
+Время холодного старта: от запуска процесса run.py до первого кадра меню.
+
+Для сравнения замеряется и голый import pygame: разница — доля самой игры.
+"""
+import os
+import statistics
+import subprocess
+import sys
+import time
+from benchmarks.common import ROOT
+
+# Дочерний процесс печатает момент первого вывода кадра на экран и сразу завершается
+PROBE = """
+import os, sys, time
+sys.path.insert(0, {root!r})
+import pygame
+
+def first_frame(*args, **kwargs):
+    print(time.time(), flush=True)
+    os._exit(0)
+
+pygame.display.flip = first_frame
+pygame.display.update = first_frame
+import run
+run.run_game()
+"""
+
+# Только запуск интерпретатора и импорт pygame
+PYGAME_PROBE = """
+import time
+import pygame
+print(time.time(), flush=True)
+"""
+
+
+def startup_time(probe=PROBE):
+    """Одно измерение (сек) от запуска интерпретатора до первого кадра меню (или до конца probe)"""
+    env = dict(os.environ, SDL_VIDEODRIVER="dummy", SDL_AUDIODRIVER="dummy",
+               PYGAME_HIDE_SUPPORT_PROMPT="1")
+    started = time.time()
+    output = subprocess.run([sys.executable, "-c", probe.format(root=ROOT)], cwd=ROOT, env=env,
+                            capture_output=True, text=True, check=True).stdout
+    return float(output.strip().splitlines()[-1]) - started
+
+
+def run(quick=False):
+    results = {}
+    for name, probe in (("startup.first_menu_frame", PROBE), ("startup.import_pygame", PYGAME_PROBE)):
+        runs = [startup_time(probe) * 1e6 for _ in range(2 if quick else 5)]
+        results[name] = {
+            "median_us": statistics.median(runs),
+            "min_us": min(runs),
+            "mean_us": statistics.fmean(runs),
+            "number": 1,
+            "repeat": len(runs),
+        }
+    return results
@@ -1,2 +1,12 @@
-from .memory_settings import MemorySettings
-from .main import MainMenu
\ No newline at end of file
+# Модули пакета грузятся при первом обращении (PEP 562): run.py не ждёт
+# импорта игрового экрана, карт и экрана статистики до первого кадра меню
+_LAZY = {"MemorySettings": ".memory_settings", "MainMenu": ".main"}
+
+
+def __getattr__(name):
+    if name not in _LAZY:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    from importlib import import_module
+    value = getattr(import_module(_LAZY[name], __name__), name)
+    globals()[name] = value  # Следующие обращения — без __getattr__
+    return value
@@ -0,0 +1,156 @@
+import os
+import threading
+import time
+import pygame
+
+PACKAGE_DIR = os.path.dirname(os.path.abspath(__file__))  # Папка пакета game
+
+
+class SilentSound:
+    """Заглушка для отсутствующего звука: все методы ничего не делают"""
+
+    def play(self, *args, **kwargs):
+        return None
+
+    def stop(self):
+        pass
+
+    def set_volume(self, value):
+        pass
+
+    def get_length(self):
+        return 0.0
+
+
+class AssetManager:
+    """
+    Общий менеджер ресурсов.
+
+    Загружает каждый звук один раз (по желанию — в фоновом потоке при старте)
+    и раздаёт общие объекты всем экранам. Пути считаются относительно пакета
+    game, а не текущей папки. Отсутствующие или повреждённые файлы заменяются
+    тишиной (SilentSound), чтобы игра не падала.
+    """
+
+    def __init__(self):
+        self._sounds = {}  # Полный путь -> Sound или SilentSound
+        self._pending = {}  # Полный путь -> Event, пока звук загружается
+        self._lock = threading.Lock()
+        self.load_times = {}  # Полный путь -> время загрузки (сек)
+        self.missing = set()  # Файлы, которые не удалось загрузить
+
+    def init_audio(self, frequency=0, buffer=0):
+        """
+        Включает звук (pygame.mixer), если он ещё не включен.
+
+        Открытие аудиоустройства бывает медленным, поэтому меню вызывает этот
+        метод после первого кадра. Звуки, загруженные до него, были бы тишиной.
+
+        :param frequency: Частота дискретизации, Гц (0 — по умолчанию pygame).
+        :param buffer: Размер буфера в сэмплах (0 — по умолчанию pygame).
+        :return: True, если звук доступен.
+        """
+        if not pygame.mixer.get_init():
+            try:
+                pygame.mixer.init(frequency, buffer=buffer)
+            except pygame.error:
+                return False
+        return True
+
+    def resolve(self, path):
+        """Превращает путь относительно пакета game в абсолютный"""
+        if os.path.isabs(path):
+            return path
+        return os.path.join(PACKAGE_DIR, path)
+
+    def preload_sounds(self, paths):
+        """
+        Загружает звуки в фоновом потоке, не блокируя отрисовку.
+
+        :param paths: Пути к звуковым файлам.
+        :return: Запущенный поток (его можно дождаться через join).
+        """
+        queued = []
+        with self._lock:
+            for path in map(self.resolve, paths):
+                if path not in self._sounds and path not in self._pending:
+                    self._pending[path] = threading.Event()
+                    queued.append(path)
+
+        thread = threading.Thread(target=self._load_all, args=(queued,), daemon=True)
+        thread.start()
+        return thread
+
+    def _load_all(self, paths):
+        for path in paths:
+            self._load_sound(path)
+
+    def get_sound(self, path):
+        """
+        Возвращает общий объект звука. Если звук ещё грузится в фоне — ждёт его.
+
+        :param path: Путь к звуковому файлу.
+        """
+        path = self.resolve(path)
+        with self._lock:
+            sound = self._sounds.get(path)
+            if sound is not None:
+                return sound
+            event = self._pending.get(path)
+            if event is None:
+                # Никто не загружает — грузим сами в этом потоке
+                self._pending[path] = threading.Event()
+
+        if event is not None:
+            event.wait()
+            return self._sounds[path]
+        return self._load_sound(path)
+
+    def _load_sound(self, path):
+        """Загружает звук с диска, при ошибке подставляет тишину"""
+        start = time.perf_counter()
+        try:
+            sound = pygame.mixer.Sound(path)
+        except (pygame.error, FileNotFoundError):
+            sound = SilentSound()  # Нет файла или звук не инициализирован
+            self.missing.add(path)
+
+        with self._lock:
+            self._sounds[path] = sound
+            self.load_times[path] = time.perf_counter() - start
+            event = self._pending.pop(path)
+        event.set()
+        return sound
+
+    def play_music(self, path, volume=1.0, loops=-1):
+        """
+        Запускает фоновую музыку (потоково, без загрузки в память целиком).
+
+        :return: False, если файла нет или звук недоступен.
+        """
+        path = self.resolve(path)
+        if path in self.missing or not pygame.mixer.get_init():
+            return False
+        try:
+            pygame.mixer.music.load(path)
+        except (pygame.error, FileNotFoundError):
+            self.missing.add(path)
+            return False
+        pygame.mixer.music.set_volume(volume)
+        pygame.mixer.music.play(loops)
+        return True
+
+    def report(self):
+        """Сводка по загруженным ресурсам и времени загрузки"""
+        with self._lock:
+            load_times = dict(self.load_times)
+        return {
+            "loaded": len(load_times) - len(self.missing & load_times.keys()),
+            "missing": sorted(self.missing),
+            "total_time": sum(load_times.values()),
+            "load_times": load_times,
+        }
+
+
+# Менеджер ресурсов, общий для всего процесса
+assets = AssetManager()
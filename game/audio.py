@@ -0,0 +1,116 @@
+import time
+import pygame
+from game.asset_manager import assets
+
+# Счётчики категории звуков (см. AudioMixer.stats)
+COUNTERS = ("played", "merged", "stolen", "peak")
+
+
+class AudioMixer:
+    """
+    Каналы микшера по категориям звуков и отсев повторов.
+
+    Каждой категории (ui, card, result) отдаются свои зарезервированные каналы,
+    так что частые перевороты карт не заглушают звук победы, а наведение на
+    кнопки меню — звуки карт. Если все каналы категории заняты, новый звук
+    вытесняет самый старый в ней. Повтор того же звука раньше, чем через
+    throttle секунд, сливается с уже играющим (не запускается).
+
+    Фоновая музыка идёт потоком pygame.mixer.music и каналов не занимает.
+    play не ждёт аудиоустройство: выбор канала — O(каналов категории).
+    """
+
+    def __init__(self, time_source=time.monotonic):
+        """
+        :param time_source: Часы для отсева повторов (секунды).
+        """
+        self.time_source = time_source
+        self.throttle = 0.0
+        self.buffer = 0  # Размер буфера микшера (сэмплов) после setup
+        self.channels = {}  # Категория -> список pygame.mixer.Channel
+        self.counters = {}  # Категория -> {"played", "merged", "stolen", "peak"}
+        self._started = {}  # Канал -> время запуска звука на нём
+        self._last = {}  # (категория, звук) -> время последнего запуска
+
+    def setup(self, settings):
+        """
+        Включает звук с частотой и буфером из настроек и резервирует каналы категорий.
+
+        :param settings: MemorySettings (audio_frequency, audio_buffer, audio_channels, sound_throttle).
+        :return: True, если звук доступен.
+        """
+        if not assets.init_audio(settings.audio_frequency, settings.audio_buffer):
+            return False
+        self.throttle = settings.sound_throttle
+        self.buffer = settings.audio_buffer
+        total = sum(settings.audio_channels.values())
+        pygame.mixer.set_num_channels(total)
+        pygame.mixer.set_reserved(total)  # Sound.play() без категории не займёт каналы категорий
+        first = 0
+        self.channels = {}
+        for category, count in settings.audio_channels.items():
+            self.channels[category] = [pygame.mixer.Channel(first + i) for i in range(count)]
+            self.counters[category] = dict.fromkeys(COUNTERS, 0)
+            first += count
+        return True
+
+    def play(self, sound, category):
+        """
+        Запускает звук на канале категории.
+
+        :param sound: pygame.mixer.Sound (SilentSound и звуки до setup молча пропускаются).
+        :param category: Категория из settings.audio_channels.
+        :return: Канал или None, если звук не запускался.
+        """
+        channels = self.channels.get(category)
+        if not channels or not isinstance(sound, pygame.mixer.Sound):
+            return None
+        counters = self.counters[category]
+        now = self.time_source()
+        key = (category, sound)
+        last = self._last.get(key)
+        if last is not None and now - last < self.throttle:
+            counters["merged"] += 1  # Тот же звук только что запущен — второй не слышен
+            return None
+        self._last[key] = now
+
+        busy = 0
+        channel = None
+        for candidate in channels:
+            if candidate.get_busy():
+                busy += 1
+            elif channel is None:
+                channel = candidate
+        if channel is None:
+            # Все каналы заняты: вытесняем звук, который играет дольше всех
+            channel = min(channels, key=lambda candidate: self._started.get(candidate, 0))
+            counters["stolen"] += 1
+        else:
+            busy += 1
+        channel.play(sound)
+        self._started[channel] = now
+        counters["played"] += 1
+        counters["peak"] = max(counters["peak"], busy)
+        return channel
+
+    def stats(self):
+        """Нагрузка на микшер: формат, занятые каналы и счётчики по категориям"""
+        if not self.channels or not pygame.mixer.get_init():
+            return {"enabled": False}
+        frequency, size, output_channels = pygame.mixer.get_init()
+        return {
+            "enabled": True,
+            "frequency": frequency,
+            "format": size,
+            "output_channels": output_channels,
+            "buffer": self.buffer,
+            "latency_ms": self.buffer / frequency * 1000,  # Задержка звука одним буфером
+            "busy": {category: sum(channel.get_busy() for channel in channels)
+                     for category, channels in self.channels.items()},
+            "music": bool(pygame.mixer.music.get_busy()),
+            "categories": {category: dict(counters) for category, counters in self.counters.items()},
+        }
+
+
+# Микшер, общий для меню и игрового экрана
+audio = AudioMixer()
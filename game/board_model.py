@@ -0,0 +1,101 @@
+class BoardModel:
+    """
+    Состояние игрового поля без pygame: лицевые стороны карт, битовые маски
+    открытых и угаданных карт и счетчик ходов.
+
+    Все операции (открыть карту, сравнить пару, проверить победу) выполняются
+    за O(1). Представления (GameScreen) подписываются на события модели через
+    subscribe и получают вызовы listener(event, *indexes), где event —
+    "reveal", "match" или "mismatch".
+    """
+
+    __slots__ = ("faces", "total", "revealed", "matched", "matched_count",
+                 "first", "second", "moves", "remaining_moves", "_listeners")
+
+    def __init__(self, faces, max_moves):
+        """
+        :param faces: Номер лицевой стороны для каждой карты (каждый номер встречается дважды).
+        :param max_moves: Лимит ходов.
+        """
+        self.faces = tuple(faces)
+        self.total = len(self.faces)
+        self.revealed = 0  # Бит i — карта i открыта
+        self.matched = 0  # Бит i — карта i угадана
+        self.matched_count = 0
+        self.first = None  # Индекс первой открытой карты хода
+        self.second = None  # Индекс второй открытой карты хода
+        self.moves = 0
+        self.remaining_moves = max_moves
+        self._listeners = []
+
+    def subscribe(self, listener):
+        """Подписывает представление на события модели"""
+        self._listeners.append(listener)
+
+    def _emit(self, event, *indexes):
+        for listener in self._listeners:
+            listener(event, *indexes)
+
+    def is_revealed(self, index):
+        return self.revealed >> index & 1 == 1
+
+    def is_matched(self, index):
+        return self.matched >> index & 1 == 1
+
+    def can_reveal(self, index):
+        """Можно ли открыть карту: ход ещё не закончен и карта закрыта"""
+        return (self.second is None and self.remaining_moves > 0 and
+                not (self.revealed | self.matched) >> index & 1)
+
+    def reveal(self, index):
+        """
+        Открывает карту. Вторая открытая карта засчитывается как ход.
+
+        :return: True, если карта открыта.
+        """
+        if not self.can_reveal(index):
+            return False
+        self.revealed |= 1 << index
+        if self.first is None:
+            self.first = index
+        else:
+            self.second = index
+            self.moves += 1
+            self.remaining_moves -= 1
+        self._emit("reveal", index)
+        return True
+
+    def pair_ready(self):
+        """Открыты ли обе карты хода"""
+        return self.second is not None
+
+    def resolve_pair(self):
+        """
+        Сравнивает открытую пару: совпавшие карты помечаются угаданными,
+        несовпавшие закрываются.
+
+        :return: True, если карты совпали.
+        """
+        first, second = self.first, self.second
+        self.first = None
+        self.second = None
+        if self.faces[first] == self.faces[second]:
+            self.matched |= 1 << first | 1 << second
+            self.matched_count += 2
+            self._emit("match", first, second)
+            return True
+        self.revealed &= ~(1 << first | 1 << second)
+        self._emit("mismatch", first, second)
+        return False
+
+    def is_won(self):
+        """Все карты угаданы"""
+        return self.matched_count == self.total
+
+    def copy(self):
+        """Быстрая копия состояния без подписчиков (для повторов и симуляции)"""
+        clone = BoardModel.__new__(BoardModel)
+        for name in BoardModel.__slots__:
+            setattr(clone, name, getattr(self, name))
+        clone._listeners = []
+        return clone
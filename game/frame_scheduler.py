@@ -0,0 +1,83 @@
+import pygame
+from collections import deque
+
+
+class FrameScheduler:
+    """
+    Общий планировщик кадров для всех экранов игры.
+
+    Ограничивает частоту кадров целевым FPS, а когда на экране ничего
+    не анимируется — снижает её до idle_fps (или блокируется в ожидании
+    события). Заодно измеряет время кадра, чтобы можно было сравнивать
+    нагрузку на процессор.
+    """
+
+    def __init__(self, settings, history=120):
+        """
+        :param settings: Объект MemorySettings (fps, idle_fps, vsync, idle_wait).
+        :param history: Сколько последних кадров хранить для статистики.
+        """
+        self.target_fps = settings.fps  # 0 — без ограничения
+        self.idle_fps = settings.idle_fps
+        self.vsync = settings.vsync  # Синхронизацию делает дисплей, сами не ждём
+        self.idle_wait = settings.idle_wait  # Блокироваться в pygame.event.wait в простое
+        self.clock = pygame.time.Clock()
+        self.frame_time = 0  # Полное время последнего кадра (мс)
+        self.busy_time = 0  # Время работы без учёта ожидания (мс)
+        self.frame_times = deque(maxlen=history)
+        self.busy_times = deque(maxlen=history)
+
+    def tick(self, animating=True):
+        """
+        Завершает кадр: ждёт до следующего кадра и обновляет замеры.
+
+        :param animating: Есть ли на экране анимация. Если нет — кадры реже.
+        :return: Время прошедшего кадра в секундах.
+        """
+        waited = 0
+        if animating:
+            fps = 0 if self.vsync else self.target_fps
+        else:
+            fps = self.idle_fps
+            if self.idle_wait and fps:
+                waited = self._wait_for_event(1000 // fps)
+                fps = 0  # Уже подождали, повторно не ограничиваем
+
+        self.clock.tick(fps)
+        self.frame_time = self.clock.get_time()
+        self.busy_time = max(0, self.clock.get_rawtime() - waited)
+        self.frame_times.append(self.frame_time)
+        self.busy_times.append(self.busy_time)
+        return self.frame_time / 1000
+
+    def _wait_for_event(self, timeout):
+        """
+        Спит до прихода события (но не дольше timeout мс), не теряя его.
+
+        :return: Сколько миллисекунд прошло в ожидании.
+        """
+        start = pygame.time.get_ticks()
+        event = pygame.event.wait(timeout)
+        if event.type != pygame.NOEVENT:
+            # wait забрало первое событие из очереди. Возвращаем его вместе с пришедшими
+            # следом в прежнем порядке: post ставит в конец, а нажатие должно остаться
+            # перед отпусканием, клавиша — перед закрытием окна
+            for queued in [event] + pygame.event.get():
+                pygame.event.post(queued)
+        return pygame.time.get_ticks() - start
+
+    def average_frame_time(self):
+        """Среднее время кадра (мс) за последние кадры"""
+        if not self.frame_times:
+            return 0
+        return sum(self.frame_times) / len(self.frame_times)
+
+    def average_busy_time(self):
+        """Среднее время работы кадра (мс) без ожидания — мера загрузки CPU"""
+        if not self.busy_times:
+            return 0
+        return sum(self.busy_times) / len(self.busy_times)
+
+    def get_fps(self):
+        """Измеренная частота кадров"""
+        return self.clock.get_fps()
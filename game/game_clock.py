@@ -0,0 +1,85 @@
+import time
+
+
+class GameClock:
+    """
+    Монотонные игровые часы.
+
+    Время берётся из time.monotonic (или подставного источника), поэтому
+    переводы системных часов не влияют на лимит времени. Поддерживает паузу
+    (время на паузе не идёт), дельту между кадрами и фиксированный шаг
+    обновления: логика и анимации продвигаются одинаковыми шагами, с какой бы
+    частотой ни рисовался экран.
+    """
+
+    def __init__(self, time_source=time.monotonic, max_frame_time=0.25, max_steps=15):
+        """
+        :param time_source: Функция, возвращающая текущее время в секундах.
+        :param max_frame_time: Наибольшая дельта за кадр (защита от рывков после зависаний).
+        :param max_steps: Наибольшее количество фиксированных шагов за кадр.
+        """
+        self.time_source = time_source
+        self.max_frame_time = max_frame_time
+        self.max_steps = max_steps
+        self._start = time_source()
+        self._paused_total = 0.0  # Сколько времени часы простояли на паузе
+        self._paused_at = None
+        self._last_tick = self.now()
+        self._accumulator = 0.0
+
+    @property
+    def paused(self):
+        return self._paused_at is not None
+
+    def now(self):
+        """Игровое время (сек) с момента создания часов, без учёта пауз"""
+        if self._paused_at is not None:
+            return self._paused_at - self._start - self._paused_total
+        return self.time_source() - self._start - self._paused_total
+
+    def pause(self):
+        if self._paused_at is None:
+            self._paused_at = self.time_source()
+
+    def resume(self):
+        if self._paused_at is not None:
+            self._paused_total += self.time_source() - self._paused_at
+            self._paused_at = None
+
+    def toggle_pause(self):
+        """Ставит часы на паузу или снимает с неё; возвращает новое состояние"""
+        if self.paused:
+            self.resume()
+        else:
+            self.pause()
+        return self.paused
+
+    def tick(self):
+        """
+        Завершает кадр: считает дельту с прошлого вызова и копит её для фиксированных шагов.
+
+        :return: Дельта игрового времени (сек), не больше max_frame_time.
+        """
+        now = self.now()
+        dt = min(now - self._last_tick, self.max_frame_time)
+        self._last_tick = now
+        self._accumulator += dt
+        return dt
+
+    def sync(self):
+        """Начинает отсчёт кадров заново: время с прошлого tick и накопленный остаток отбрасываются"""
+        self._last_tick = self.now()
+        self._accumulator = 0.0
+
+    def steps(self, step):
+        """
+        Сколько фиксированных шагов длиной step нужно выполнить в этом кадре.
+
+        Остаток меньше шага переносится на следующий кадр.
+        """
+        count = int(self._accumulator // step)
+        self._accumulator -= count * step
+        if count > self.max_steps:
+            count = self.max_steps
+            self._accumulator = 0.0  # Не догоняем отставание бесконечно
+        return count
@@ -0,0 +1,107 @@
+import pygame
+
+# События, которые нужны игре; остальные отбрасываются ещё в очереди SDL
+DEFAULT_EVENTS = (pygame.QUIT, pygame.KEYDOWN, pygame.MOUSEBUTTONDOWN,
+                  pygame.MOUSEMOTION, pygame.WINDOWEXPOSED)
+
+
+class InputManager:
+    """
+    Слой ввода между очередью pygame и экранами.
+
+    Отсекает ненужные типы событий через pygame.event.set_allowed, сливает
+    подряд идущие MOUSEMOTION в одно событие и раздаёт события только тем
+    экранам, которые на них подписаны. За кадр обрабатывается не больше
+    max_events событий: при лавине ввода старые события отбрасываются
+    (кроме QUIT). Положение курсора берётся из самих событий (pointer),
+    а не из pygame.mouse.get_pos(), поэтому ввод можно записать и воспроизвести.
+    """
+
+    def __init__(self, allowed=DEFAULT_EVENTS, max_events=128):
+        """
+        :param allowed: Типы событий, которые пропускаются в очередь.
+        :param max_events: Наибольшее количество событий за один кадр.
+        """
+        self.allowed = list(allowed)
+        self.max_events = max_events
+        self.pointer = (-1, -1)  # Последнее известное положение курсора
+        self._handlers = []  # (обработчик, типы событий)
+        self.received = 0  # Событий получено из очереди
+        self.coalesced = 0  # Событий MOUSEMOTION слито с соседними
+        self.dropped = 0  # Событий отброшено из-за переполнения
+
+    def install(self):
+        """Включает фильтр событий и запоминает текущее положение курсора"""
+        pygame.event.set_blocked(None)
+        pygame.event.set_allowed(self.allowed)
+        self.pointer = pygame.mouse.get_pos()
+
+    def allow(self, *event_types):
+        """Добавляет типы событий к пропускаемым (например, свои таймеры)"""
+        for event_type in event_types:
+            if event_type not in self.allowed:
+                self.allowed.append(event_type)
+        pygame.event.set_allowed(list(event_types))
+
+    def subscribe(self, handler, event_types):
+        """
+        Подписывает обработчик на типы событий.
+
+        :param handler: Функция, принимающая событие.
+        :param event_types: Типы событий, которые нужны обработчику.
+        """
+        self._handlers.append((handler, frozenset(event_types)))
+
+    def unsubscribe(self, handler):
+        self._handlers = [(h, types) for h, types in self._handlers if h != handler]
+
+    def poll(self):
+        """
+        Забирает события из очереди, сливая подряд идущие движения мыши.
+
+        :return: Список событий.
+        """
+        events = []
+        for event in pygame.event.get():
+            self.received += 1
+            if event.type == pygame.MOUSEMOTION:
+                if events and events[-1].type == pygame.MOUSEMOTION:
+                    # Одно движение вместо нескольких: последняя позиция, суммарное смещение
+                    previous = events[-1]
+                    rel = (previous.rel[0] + event.rel[0], previous.rel[1] + event.rel[1])
+                    events[-1] = pygame.event.Event(pygame.MOUSEMOTION, pos=event.pos, rel=rel,
+                                                    buttons=event.buttons)
+                    self.coalesced += 1
+                else:
+                    events.append(event)
+                self.pointer = event.pos
+            else:
+                if event.type == pygame.MOUSEBUTTONDOWN:
+                    self.pointer = event.pos
+                events.append(event)
+
+        if len(events) > self.max_events:
+            # Оставляем самые свежие события, но закрытие окна не теряем
+            dropped = events[:-self.max_events]
+            events = events[-self.max_events:]
+            self.dropped += len(dropped)
+            if any(event.type == pygame.QUIT for event in dropped):
+                events.append(pygame.event.Event(pygame.QUIT))
+        return events
+
+    def dispatch(self, events):
+        """Передаёт события подписанным обработчикам"""
+        for event in events:
+            for handler, event_types in self._handlers:
+                if event.type in event_types:
+                    handler(event)
+
+    def pump(self):
+        """poll + dispatch; события возвращаются для обработки самим циклом (QUIT, клавиши)"""
+        events = self.poll()
+        self.dispatch(events)
+        return events
+
+
+# Слой ввода, общий для всех экранов
+input_manager = InputManager()
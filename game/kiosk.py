@@ -0,0 +1,230 @@
+"""
+Киоск: несколько независимых полей в одном окне (стена-экран, демо, игра вчетвером).
+
+Каждое поле — обычный GameScreen, рисующий в свою подповерхность окна.
+Все поля обновляются в одном цикле сцен общими фиксированными шагами и
+делят кэши спрайтов, надписей, шрифтов и звуков (общие объекты процесса).
+Клик уходит полю под курсором в его собственных координатах. Законченное
+поле показывает итог и через kiosk_restart_delay секунд начинается заново.
+С --ai поля играет компьютер (демо-режим витрины).
+
+Пример запуска (из корня репозитория):
+    python -m game.kiosk --boards 4 --difficulty medium --width 1600 --height 1200
+    python -m game.kiosk --boards 16 --difficulty custom --ai 80
+"""
+import argparse
+import math
+import random
+import sys
+import pygame
+from game.audio import audio
+from game.memory_ai import AIController, MemoryAI
+from game.memory_settings import MemorySettings
+from game.memory_objects.game_screen import GameScreen
+from game.memory_objects.grid_index import GridIndex
+from game.memory_objects.sprite_cache import sprite_cache
+from game.memory_objects.text_cache import get_font, render_text
+from game.render_backend import backend
+from game.results_log import ResultsLog, leaderboard_key
+from game.rules import FIXED_STEP, WIN
+from game.scene_manager import Scene, SceneManager
+
+
+class Board:
+    """Одно поле киоска: партия на своём участке окна"""
+
+    def __init__(self, index, rect, surface):
+        """
+        :param index: Номер поля (слева направо, сверху вниз).
+        :param rect: Участок окна (в координатах окна).
+        :param surface: Подповерхность окна на этом участке.
+        """
+        self.index = index
+        self.rect = rect
+        self.surface = surface
+        self.game = None
+        self.ai = None  # AIController, если поле играет компьютер
+        self.finished_at = None  # Время киоска, когда партия закончилась
+        self.banner_drawn = False  # Итог законченной партии уже на экране
+        self.games = 0  # Сыграно партий на этом поле
+
+
+class KioskScene(Scene):
+    """Несколько GameScreen в подповерхностях одного окна"""
+
+    event_types = (pygame.KEYDOWN, pygame.MOUSEBUTTONDOWN, pygame.WINDOWEXPOSED)
+
+    def __init__(self, screen, difficulty="easy", boards=4, results=None, restart_delay=5.0, seed=None, ai=None):
+        """
+        :param screen: Поверхность окна.
+        :param difficulty: Сложность всех полей.
+        :param boards: Количество полей (раскладываются почти квадратной сеткой).
+        :param results: Журнал партий (ResultsLog); None — итоги не записываются.
+            Партии компьютера (ai) не записываются: это демо, а не рекорды.
+        :param restart_delay: Через сколько секунд законченное поле начинается заново.
+        :param seed: Сид для сидов партий (одинаковый сид — одинаковые раскладки).
+        :param ai: Точность памяти компьютера (%), который играет на всех полях; None — играют люди.
+        """
+        super().__init__()
+        self.screen = screen
+        self.difficulty = difficulty
+        self.results = results
+        self.restart_delay = restart_delay
+        self.ai = ai
+        self.rng = random.Random(seed)
+        self.time = 0.0  # Время киоска — сумма шагов, как у GameScreen
+
+        cols = math.ceil(math.sqrt(boards))
+        rows = math.ceil(boards / cols)
+        width, height = screen.get_width() // cols, screen.get_height() // rows
+        self.grid = GridIndex(0, 0, width, height, width, height, rows, cols)
+        self.boards = []
+        for index in range(boards):
+            rect = pygame.Rect(self.grid.cell_rect(index))
+            self.boards.append(Board(index, rect, screen.subsurface(rect)))
+
+        # Лицевые стороны у полей свои: кэш спрайтов растёт вместе с числом полей,
+        # иначе поля вытесняли бы спрайты друг друга
+        sprite_cache.max_size = max(sprite_cache.max_size, 1024 * boards)
+        self.font = get_font(48)
+        self.full_redraw = True
+        for board in self.boards:
+            self._start(board)
+
+    def _start(self, board):
+        """Новая партия на поле"""
+        settings = MemorySettings(self.difficulty)
+        board.game = GameScreen(board.surface, settings, seed=self.rng.getrandbits(32))
+        if self.ai is not None:
+            ai = MemoryAI(random.Random(self.rng.getrandbits(32)), self.ai)
+            board.ai = AIController(board.game, ai, settings.ai_move_delay)
+        board.finished_at = None
+
+    def _finish(self, board):
+        game = board.game
+        board.finished_at = self.time
+        board.banner_drawn = False
+        board.games += 1
+        if self.results is not None and board.ai is None and game.game_over_type != "back":
+            settings = game.settings
+            self.results.record(leaderboard_key(settings), game.game_over_type == WIN,
+                                game.moves, int(game.time), game.score, game.seed)
+
+    def handle_event(self, event):
+        if event.type == pygame.KEYDOWN:
+            if event.key == pygame.K_ESCAPE:
+                self.manager.pop()
+            elif event.key == pygame.K_p and self.manager.clock.toggle_pause():
+                for board in self.boards:
+                    board.game.show_message("Пауза", 0)
+            return
+        if event.type == pygame.WINDOWEXPOSED:
+            self.redraw()
+            return
+        if self.manager.clock.paused:
+            return  # На паузе клики по полям не принимаются
+
+        # Клик — полю под курсором, в координатах его подповерхности
+        index = self.grid.cell_at(event.pos)
+        if index is None or index >= len(self.boards):
+            return
+        board = self.boards[index]
+        if board.finished_at is not None or board.ai is not None:
+            return
+        x, y = event.pos
+        board.game.handle_event(pygame.event.Event(event.type, pos=(x - board.rect.x, y - board.rect.y),
+                                                   button=event.button))
+
+    def update(self, dt):
+        for _ in range(self.manager.clock.steps(FIXED_STEP)):
+            self.step()
+
+    def step(self, dt=FIXED_STEP):
+        """Один общий шаг всех полей"""
+        self.time += dt
+        for board in self.boards:
+            if board.finished_at is None:
+                if board.ai is not None:
+                    board.ai.step(dt)  # Клик компьютера — тем же click_card, что и мышь
+                board.game.advance(dt)
+                if board.game.is_game_over():
+                    self._finish(board)
+            elif self.time - board.finished_at >= self.restart_delay or board.game.game_over_type == "back":
+                self._start(board)  # «Назад» на поле — сразу новая партия
+
+    def draw(self):
+        """
+        Рисует изменившиеся области всех полей.
+
+        :return: Прямоугольники в координатах окна.
+        """
+        rects = []
+        if self.full_redraw:
+            self.screen.fill((0, 0, 0))  # Полосы между полями, если окно не делится ровно
+            rects.append(self.screen.get_rect())
+            for board in self.boards:
+                board.game.full_redraw = True
+                board.banner_drawn = False
+            self.full_redraw = False
+
+        for board in self.boards:
+            game = board.game
+            if board.finished_at is not None and game.game_over_type != "back":
+                if not board.banner_drawn:
+                    rects.append(self._draw_result(board))
+                continue
+            offset = board.rect.topleft
+            rects.extend(rect.move(offset) for rect in game.draw())
+        return rects
+
+    def _draw_result(self, board):
+        """Итог партии поверх поля до её перезапуска"""
+        game = board.game
+        game.draw()  # Последнее состояние поля под надписью
+        board.banner_drawn = True
+        text = render_text(self.font, f"{game.game_over_type} {game.score}", (255, 255, 0))
+        board.surface.blit(text, text.get_rect(center=board.surface.get_rect().center))
+        return board.rect
+
+    def redraw(self):
+        self.full_redraw = True
+
+    def is_animating(self):
+        # Ожидание перезапуска не требует полного FPS: часы идут и в простое.
+        # На паузе анимации стоят — цикл может спать, как у GameScene
+        if self.manager.clock.paused:
+            return False
+        return any(board.finished_at is None and board.game.is_animating() for board in self.boards)
+
+
+def main(argv=None):
+    settings = MemorySettings()
+    parser = argparse.ArgumentParser(description="Несколько полей игры в одном окне")
+    parser.add_argument("--boards", type=int, default=settings.kiosk_boards, help="Количество полей")
+    parser.add_argument("--difficulty", default="easy")
+    parser.add_argument("--width", type=int, default=settings.screen_width, help="Ширина окна")
+    parser.add_argument("--height", type=int, default=settings.screen_height, help="Высота окна")
+    parser.add_argument("--restart-delay", type=float, default=settings.kiosk_restart_delay,
+                        help="Через сколько секунд законченное поле начинается заново")
+    parser.add_argument("--seed", type=int, default=None)
+    parser.add_argument("--ai", type=int, nargs="?", const=settings.ai_accuracy, default=None,
+                        help="На полях играет компьютер с такой точностью памяти (%%)")
+    args = parser.parse_args(argv)
+    if args.boards < 1:
+        parser.error("--boards: нужно хотя бы одно поле")
+
+    settings.screen_width, settings.screen_height = args.width, args.height
+    pygame.display.init()
+    pygame.font.init()
+    screen = backend.create_screen(settings, "Memory Game — киоск")
+    audio.setup(settings)  # Звуки всех полей — через общие каналы с отсевом повторов
+    results = ResultsLog(settings.results_path, top_n=settings.leaderboard_size)
+    kiosk = KioskScene(screen, args.difficulty, args.boards, results, args.restart_delay, args.seed, args.ai)
+    SceneManager(screen, settings).run(kiosk)
+    results.close()  # Дописываем журнал на диск
+    pygame.quit()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,105 +1,161 @@
 import pygame  # Импортируем библиотеку Pygame для создания графического интерфейса
 from game import MemorySettings
-from game.memory_game import start_memory_game
-
-class MainMenu:
-    def __init__(self, screen):
+from game.memory_objects.text_cache import get_font, render_text
+from game.asset_manager import assets, SilentSound
+from game.audio import audio
+from game.memory_objects.grid_index import GridIndex
+from game.input_manager import input_manager
+from game.scene_manager import Scene
+from game.results_log import ResultsLog, leaderboard_key
+
+class MainMenu(Scene):
+    # Клики по кнопкам и перекрытие окна; положение курсора — из input_manager.pointer
+    event_types = (pygame.MOUSEBUTTONDOWN, pygame.WINDOWEXPOSED)
+
+    def __init__(self, screen, settings=None):
         """
         Конструктор главного меню.
-        Принимает экран (объект Surface), на котором будет отображаться меню.
+        Принимает экран (объект Surface), на котором будет отображаться меню,
+        и, при необходимости, уже созданные настройки.
         """
-        self.settings = MemorySettings() # Добавляем настройки
+        super().__init__()
+        self.settings = settings or MemorySettings() # Добавляем настройки
         self.screen = screen  # Сохраняем экран
-        self.font = pygame.font.SysFont(None, 48)  # Шрифт для текста кнопок
+        self.font = get_font(48)  # Шрифт для текста кнопок
+        self.record_font = get_font(24)  # Шрифт рекордов рядом с кнопками
+        # Журнал партий; рекорды для меню берутся из его индекса без чтения журнала
+        self.results = ResultsLog(self.settings.results_path, top_n=self.settings.leaderboard_size)
         # Список кнопок с текстом и соответствующим уровнем сложности
         self.buttons = [
             {"text": "Легкий", "difficulty": "easy"},
             {"text": "Средний", "difficulty": "medium"},
             {"text": "Сложный", "difficulty": "hard"},
             {"text": "Невозможный", "difficulty": "insane"},
+            {"text": "Огромное поле", "difficulty": "custom"},  # Поле custom_rows x custom_cols
             {"text": "Выход", "difficulty": None}  # Кнопка для выхода из игры
         ]
-
-        # Загрузка звуков
-        self.button_sound = pygame.mixer.Sound(self.settings.sound_button)
+        for btn in self.buttons:
+            if btn["difficulty"]:  # Ключ таблицы рекордов (для своего поля — с размером)
+                btn["key"] = leaderboard_key(MemorySettings(btn["difficulty"]))
+        self.button_top = 160  # Центр первой кнопки по оси Y
+        self.button_step = 72  # Расстояние между кнопками
+        # Кнопки стоят в один столбец: полоса высотой button_step на каждую
+        self.button_grid = GridIndex(0, self.button_top - self.button_step // 2,
+                                     self.screen.get_width(), self.button_step,
+                                     self.screen.get_width(), self.button_step,
+                                     len(self.buttons), 1)
+
+        # Звук включается после первого кадра меню (_start_audio), до этого — тишина
+        self.button_sound = SilentSound()
+        self.audio_started = False
         self.hover_sound_played = False
         self.last_hovered_button = None
+        self.hovered_button = None  # Кнопка под курсором в этом кадре
+        self.needs_redraw = True  # Меню перерисовывается, только когда что-то изменилось
+        self.drawn = False  # Первый кадр уже на экране
 
-    def run(self):
-        """
-        Основной цикл отображения меню.
-        Обрабатывает события и обновляет экран.
-        """
-
-        pygame.mixer.music.load(self.settings.sound_background)
-        pygame.mixer.music.set_volume(0.3)
-        pygame.mixer.music.play(-1)  # Зацикливаем фоновую музыку
-
-        while True:
-            self.screen.fill(self.settings.bg_color)  # Заливаем экран тёмно-синим цветом
-            self._draw_buttons()  # Рисуем кнопки
-
-            mouse_pos = pygame.mouse.get_pos()
-            self._handle_hover(mouse_pos)
+    def enter(self):
+        self.needs_redraw = True  # Вернулись из игры: рекорды могли измениться
 
-            # Обрабатываем события
-            for event in pygame.event.get():
-                if event.type == pygame.QUIT:  # Если пользователь закрыл окно
-                    return  # Выход из меню
-                if event.type == pygame.MOUSEBUTTONDOWN:  # Клик мыши
-                    self._handle_click(*event.pos)  # Обработка клика по кнопке
-
-            pygame.display.flip()  # Обновляем экран
-
-    def _handle_hover(self, mouse_pos):
+    def handle_event(self, event):
+        if event.type == pygame.MOUSEBUTTONDOWN:  # Клик мыши
+            self._handle_click(*event.pos)  # Обработка клика по кнопке
+        else:
+            self.needs_redraw = True  # Окно перекрывали — рисуем заново
+
+    def update(self, dt):
+        if self.drawn and not self.audio_started:
+            self._start_audio()  # Первый кадр уже на экране — теперь можно медленное
+
+        # Положение курсора берём из событий, а не опрашиваем мышь
+        hovered_button = self._button_at(input_manager.pointer)  # Один поиск кнопки на кадр
+        if hovered_button is not self.hovered_button:
+            self.hovered_button = hovered_button
+            self.needs_redraw = True  # Сменилась подсвеченная кнопка
+        self._handle_hover(hovered_button)
+
+    def draw(self):
+        if not self.needs_redraw:
+            return []  # Ничего не изменилось — кадр не выводим
+        self.needs_redraw = False
+        self.drawn = True
+        self.screen.fill(self.settings.bg_color)  # Заливаем экран тёмно-синим цветом
+        self._draw_buttons(self.hovered_button)  # Рисуем кнопки
+        return None  # Весь экран
+
+    def redraw(self):
+        self.needs_redraw = True
+
+    def _start_audio(self):
+        """Включает звук, запускает фоновую загрузку эффектов и музыку"""
+        self.audio_started = True
+        if audio.setup(self.settings):  # Частота, буфер и каналы категорий — из настроек
+            # Все эффекты грузятся в фоне; звук кнопки — первым, его ждём сразу
+            assets.preload_sounds(self.settings.sound_paths())
+            self.button_sound = assets.get_sound(self.settings.sound_button)
+        # Зацикливаем фоновую музыку (если файла нет — играем без неё)
+        assets.play_music(self.settings.sound_background, volume=0.3)
+
+    def _button_at(self, pos):
+        """Возвращает кнопку под точкой pos или None"""
+        index = self.button_grid.cell_at(pos)
+        if index is None:
+            return None
+        btn = self.buttons[index]
+        if btn.get("rect") and btn["rect"].collidepoint(pos):
+            return btn
+        return None
+
+    def _handle_hover(self, hovered_button):
         """Обработка наведения на кнопки со звуковым эффектом"""
-        hovered_button = None
-        for btn in self.buttons:
-            if btn.get("rect") and btn["rect"].collidepoint(mouse_pos):
-                hovered_button = btn
-                break
-
         if hovered_button and hovered_button != self.last_hovered_button:
             if not self.hover_sound_played:
-                self.button_sound.play()
+                audio.play(self.button_sound, "ui")
                 self.hover_sound_played = True
         else:
             self.hover_sound_played = False
 
         self.last_hovered_button = hovered_button
 
-    def _draw_buttons(self):
+    def _draw_buttons(self, hovered_button=None):
         """
         Рисует все кнопки на экране и сохраняет их позиции.
+
+        :param hovered_button: Кнопка под курсором (подсвечивается).
         """
         center_x = self.screen.get_rect().centerx  # Центр экрана по оси X
-        mouse_pos = pygame.mouse.get_pos() # Центр экрана по оси Y
 
         for i, btn in enumerate(self.buttons):
             color = (255, 255, 255)  # Белый цвет по умолчанию
 
             # Если курсор над кнопкой - меняем цвет
-            if btn.get("rect") and btn["rect"].collidepoint(mouse_pos):
+            if btn is hovered_button:
                 color = (255, 255, 0)  # Желтый цвет при наведении
 
             # Создаем текст кнопки
-            text = self.font.render(btn["text"], True, color)
+            text = render_text(self.font, btn["text"], color)
             # Получаем прямоугольник текста и выравниваем по центру
-            rect = text.get_rect(center=(center_x, 200 + i * 80))
+            rect = text.get_rect(center=(center_x, self.button_top + i * self.button_step))
             self.screen.blit(text, rect)  # Отображаем текст на экране
             btn["rect"] = rect  # Сохраняем прямоугольник для обработки кликов
 
+            # Рекорд сложности справа от кнопки
+            best = self.results.best(btn["key"]) if btn["difficulty"] else None
+            if best:
+                record = render_text(self.record_font, f"Рекорд: {best['s']}", (160, 160, 200))
+                self.screen.blit(record, record.get_rect(midleft=(rect.right + 20, rect.centery)))
+
     def _handle_click(self, x, y):
         """
         Проверяет, нажал ли пользователь на какую-либо кнопку.
         Если нажал — выполняет соответствующее действие.
         """
-        for btn in self.buttons:
-            # Проверяем, существует ли прямоугольник и попадает ли в него курсор
-            if btn.get("rect") and btn["rect"].collidepoint(x, y):
-                self.button_sound.play()  # Звук при нажатии
-                if btn["difficulty"]:  # Если это не кнопка "Выход"
-                    start_memory_game(self.screen, btn["difficulty"])
-                else:
-                    pygame.quit()  # Закрываем Pygame
-                    exit()  # Выходим из программы
+        btn = self._button_at((x, y))  # Кнопка под курсором
+        if btn:
+            audio.play(self.button_sound, "ui")  # Звук при нажатии
+            if btn["difficulty"]:  # Если это не кнопка "Выход"
+                from game.memory_game import GameScene  # Игра грузится при первом запуске
+                self.manager.push(GameScene(self.screen, btn["difficulty"], self.results))
+            else:
+                self.results.close()  # Дописываем журнал на диск
+                self.manager.quit()  # Цикл сцен завершится, pygame закроет run.py
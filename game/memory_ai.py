@@ -0,0 +1,181 @@
+"""
+Компьютерный игрок и подсказки.
+
+MemoryAI запоминает увиденные карты в словарях (лицевая сторона -> индекс)
+и выбирает ход за O(1): известную пару, пару к открытой карте или случайную
+невиданную карту. Точность памяти настраивается: при accuracy < 100 часть
+увиденных карт не запоминается, и компьютер ошибается, как живой игрок.
+
+Один и тот же MemoryAI работает и с GameScreen (через AIController — теми же
+click_card, что и мышь), и с GameEngine безголовой симуляции (игрок "ai").
+"""
+import time
+from game.rules import FIXED_STEP
+
+# Сколько случайных невиданных карт пробуется, прежде чем перебрать их все
+PICK_ATTEMPTS = 8
+
+
+class MemoryAI:
+    """
+    Память компьютерного игрока.
+
+    Интерфейс игрока симуляции: choose(engine, now) и seen(index, face), где
+    engine — GameEngine или GameScreen (нужны model и can_click(index, now)).
+    """
+
+    def __init__(self, rng, accuracy=100):
+        """
+        :param rng: Генератор случайных чисел (выбор невиданных карт и забывание).
+        :param accuracy: Вероятность (в процентах) запомнить увиденную карту.
+        """
+        self.rng = rng
+        self.accuracy = accuracy
+        self.single = {}  # Лицевая сторона -> индекс карты, пара к которой ещё не видна
+        self.partner = {}  # Индекс -> индекс второй карты известной пары
+        self.pairs = []  # Известные пары (индексы), ещё не угаданные
+        self.unseen = []  # Индексы незапомненных карт (порядок не важен)
+        self._position = None  # Индекс карты -> позиция в unseen; None — поле ещё не известно
+
+    def watch(self, model):
+        """Запоминает карты, которые открываются на поле BoardModel (любым игроком)"""
+        self._start(model.total)
+
+        def on_board_event(event, *indexes):
+            if event == "reveal":
+                self.seen(indexes[0], model.faces[indexes[0]])
+
+        model.subscribe(on_board_event)
+
+    def _start(self, total):
+        self.unseen = list(range(total))
+        self._position = {index: index for index in self.unseen}
+
+    def _forget_unseen(self, index):
+        """Убирает карту из unseen: на её место встаёт последняя"""
+        position = self._position.pop(index)
+        last = self.unseen.pop()
+        if last != index:
+            self.unseen[position] = last
+            self._position[last] = position
+
+    def seen(self, index, face):
+        """Карта index открылась лицевой стороной face"""
+        if self._position is None or index not in self._position:
+            return  # Уже запомнена
+        if self.accuracy < 100 and self.rng.random() * 100 >= self.accuracy:
+            return  # Не запомнилась
+        self._forget_unseen(index)
+        other = self.single.pop(face, None)
+        if other is None:
+            self.single[face] = index
+        else:
+            self.partner[index] = other
+            self.partner[other] = index
+            self.pairs.append((other, index))
+
+    def choose(self, engine, now):
+        """
+        Следующая карта для клика.
+
+        :param engine: GameEngine или GameScreen.
+        :param now: Текущее время по часам engine.
+        :return: Индекс карты или None — подождать (карты ещё переворачиваются).
+        """
+        model = engine.model
+        if self._position is None:
+            self._start(model.total)  # Симуляция: поле известно с первого хода
+
+        if model.first is not None:
+            # Знаем пару к открытой карте — открываем её
+            other = self._partner_of(model)
+            if other is not None:
+                return other if engine.can_click(other, now) else None
+        else:
+            # Знаем обе карты пары — открываем первую
+            while self.pairs:
+                first, second = self.pairs[-1]
+                if model.is_matched(first):
+                    self.pairs.pop()  # Угадана (в том числе другим игроком)
+                    continue
+                if engine.can_click(first, now) and engine.can_click(second, now):
+                    return first
+                break
+        return self._pick_unseen(engine, now)
+
+    def _partner_of(self, model):
+        """Запомненная пара к открытой карте model.first (её лицо сейчас видно)"""
+        first = model.first
+        other = self.partner.get(first)
+        if other is None:
+            other = self.single.get(model.faces[first])  # Сама открытая карта могла не запомниться
+        if other is None or other == first or model.is_matched(other):
+            return None
+        return other
+
+    def _pick_unseen(self, engine, now):
+        """Случайная незапомненная карта, которую можно открыть"""
+        model = engine.model
+        for _ in range(PICK_ATTEMPTS):
+            if not self.unseen:
+                return None
+            index = self.unseen[self.rng.randrange(len(self.unseen))]
+            if model.is_matched(index):
+                self._forget_unseen(index)  # Угадана, хотя мы её не запомнили
+            elif engine.can_click(index, now):
+                return index
+        # Почти все незапомненные карты заняты — редкий полный перебор
+        options = [index for index in self.unseen if engine.can_click(index, now)]
+        return self.rng.choice(options) if options else None
+
+    def hint(self, engine, now):
+        """Карта, которую стоит открыть, или None, если пара по памяти неизвестна"""
+        model = engine.model
+        if model.first is not None:
+            return self._partner_of(model)
+        for first, _ in reversed(self.pairs):
+            if not model.is_matched(first):
+                return first
+        return None
+
+
+class AIController:
+    """
+    Компьютер играет партию GameScreen: кликает через click_card, как мышь.
+
+    Решение принимается не чаще раза в move_delay секунд игрового времени и
+    занимает O(1), так что укладывается в кадр и на поле 20x20.
+    """
+
+    def __init__(self, game, ai, move_delay=0.5):
+        """
+        :param game: GameScreen.
+        :param ai: MemoryAI (начинает запоминать карты поля сразу).
+        :param move_delay: Пауза между кликами (сек игрового времени).
+        """
+        self.game = game
+        self.ai = ai
+        self.move_delay = move_delay
+        self.wait = move_delay
+        self.decisions = 0
+        self.max_us = 0.0  # Самое долгое решение (мкс)
+        ai.watch(game.model)
+
+    def step(self, dt=FIXED_STEP):
+        """
+        Вызывается перед каждым шагом игры.
+
+        :return: Индекс открытой карты или None.
+        """
+        self.wait -= dt
+        game = self.game
+        if self.wait > 0 or not game.accepts_input():
+            return None
+        started = time.perf_counter()
+        index = self.ai.choose(game, game.time)
+        self.max_us = max(self.max_us, (time.perf_counter() - started) * 1e6)
+        self.decisions += 1
+        if index is None or not game.click_card(index):
+            return None
+        self.wait = self.move_delay
+        return index
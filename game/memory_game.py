@@ -1,42 +1,133 @@
-import pygame
+import os
+import random
 import time
+import pygame
 from game import MemorySettings  # Импорт класса с настройками игры
+from game.memory_ai import MemoryAI  # Память для подсказок
 from game.memory_objects.game_screen import GameScreen  # Импорт игрового экрана
+from game.memory_objects.stats_screen import StatsScreen  # Экран статистики после партии
+from game.scene_manager import Scene, SceneManager  # Стек экранов с общим циклом
+from game.rules import FIXED_STEP, WIN
+from game.results_log import leaderboard_key  # Ключ таблицы рекордов для настроек
+from game.replay import InputRecorder, Replay, ReplayPlayer  # Запись и повтор партий
 
-def start_memory_game(screen, difficulty):
+class GameScene(Scene):
     """
-    Запускает основную игровую петлю для игры на память.
+    Партия в стеке сцен: ввод, шаги логики и отрисовка GameScreen.
 
-    :param screen: Поверхность Pygame, на которой происходит отрисовка.
-    :param difficulty: Уровень сложности игры (easy, medium, hard, insane).
+    Логика и анимации продвигаются фиксированными шагами FIXED_STEP по общим
+    часам менеджера, поэтому скорость игры не зависит от частоты кадров.
+    P — пауза, H — подсказка, ESC — назад в меню. Законченная партия сохраняется и
+    заменяется экраном статистики.
     """
-    settings = MemorySettings(difficulty)  # Создаем объект с настройками игры на основе выбранной сложности
-    game = GameScreen(screen, settings)    # Создаем игровой экран, передаём ему настройки и экран
-    start_time = time.time()               # Сохраняем момент начала игры
-
-    while True:
-        # Вычисляем прошедшее время и оставшееся (в секундах)
-        elapsed = time.time() - start_time
-        remaining = max(settings.time_limit - int(elapsed), 0)  # Не допускаем отрицательного времени
 
-        # Обрабатываем все события (нажатия, закрытие окна и т.д.)
-        for event in pygame.event.get():
-            if event.type == pygame.QUIT or (event.type == pygame.KEYDOWN and event.key == pygame.K_ESCAPE):
-                return  # Выход из игры при закрытии окна или нажатии ESC
-            game.handle_event(event)  # Передаём событие в игровой экран для обработки
+    def __init__(self, screen, difficulty, results=None, replay=None):
+        """
+        :param screen: Поверхность Pygame, на которой происходит отрисовка.
+        :param difficulty: Уровень сложности игры (easy, medium, hard, insane).
+        :param results: Журнал партий (ResultsLog), куда записывается законченная игра.
+        :param replay: Записанная партия (Replay) — показать её вместо игры с мышью.
+        """
+        super().__init__()
+        self.screen = screen
+        self.results = results
+        self.replay = replay
+        if replay is not None:
+            self.settings = replay.settings()  # Поле и лимиты записанной партии
+            self.game = GameScreen(screen, self.settings, seed=replay.header["seed"])
+            self.player = ReplayPlayer(replay)
+            # Клики мыши в повторе не принимаются
+            self.event_types = (pygame.KEYDOWN, pygame.WINDOWEXPOSED)
+        else:
+            self.settings = MemorySettings(difficulty)  # Создаем объект с настройками игры на основе выбранной сложности
+            recorder = InputRecorder() if self.settings.record_replays else None
+            self.game = GameScreen(screen, self.settings, recorder=recorder)  # Создаем игровой экран
+            self.player = None
+            # Подсказки помнят только карты, которые игрок уже видел
+            self.hints = MemoryAI(random.Random())
+            self.hints.watch(self.game.model)
+            # Игровой экран получает только клики и перекрытие окна, клавиши — сама сцена
+            self.event_types = (pygame.KEYDOWN, pygame.MOUSEBUTTONDOWN, pygame.WINDOWEXPOSED)
 
-        # Обновляем состояние игры (например, проверка пар и времени)
-        game.update(remaining)
+    def leave(self):
+        self.manager.clock.resume()  # Пауза партии не переходит на другие экраны
 
-        # Рисуем текущее состояние игры на экран
-        game.draw()
+    def handle_event(self, event):
+        if event.type == pygame.KEYDOWN:
+            if event.key == pygame.K_ESCAPE:
+                self.manager.pop()  # Выход из игры в меню без сохранения
+            elif event.key == pygame.K_p:
+                if self.manager.clock.toggle_pause():  # На паузе не идут ни время, ни анимации
+                    self.game.show_message("Пауза", 0)  # Исчезнет в первом обновлении после паузы
+            elif event.key == pygame.K_h and self.player is None:
+                self._hint()
+            return
+        if (event.type == pygame.MOUSEBUTTONDOWN and self.manager.clock.paused and
+                not self.game.back_button_rect.collidepoint(event.pos)):
+            return  # На паузе клики по полю не принимаются; «Назад» и прочие события — да
+        self.game.handle_event(event)
 
-        # Обновляем окно
-        pygame.display.flip()
+    def _hint(self):
+        """Подсвечивает карту из уже виденной пары (подсказка не делает ход)"""
+        index = self.hints.hint(self.game, self.game.time)
+        if index is None:
+            self.game.show_message("Пара ещё не найдена", 1.5)
+        else:
+            self.game.show_hint(index)
 
-        # Проверка завершения игры
+    def update(self, dt):
+        game = self.game
         if game.is_game_over():
-            if game.game_over_type == "back":  # Если игрок нажал "Назад", просто выходим
-                return
-            game.show_stats_screen(int(elapsed))  # Показываем статистику после победы/поражения
+            # Последнее состояние уже на экране: «Назад» — в меню, иначе — к статистике
+            self._finish()
+            return
+        for _ in range(self.manager.clock.steps(FIXED_STEP)):
+            if self.player is not None:
+                self.player.apply(game)  # Клики повтора — точно на тех шагах, где они были
+            game.advance(FIXED_STEP)
+            if game.is_game_over():
+                break
+
+    def _finish(self):
+        game = self.game
+        if game.game_over_type == "back":
+            self.manager.pop()
             return
+        if self.replay is None:
+            _save_game(self.settings, game, self.results)
+        self.manager.replace(StatsScreen(self.screen, game.score, game.game_over_type,
+                                         game.moves, int(game.time)))
+
+    def draw(self):
+        return self.game.draw()  # Только изменившиеся области
+
+    def redraw(self):
+        self.game.full_redraw = True
+
+    def is_animating(self):
+        # Законченная партия сменится статистикой в следующем кадре — без ожидания
+        return self.game.is_game_over() or (self.game.is_animating() and not self.manager.clock.paused)
+
+
+def start_memory_game(screen, difficulty, results=None, replay=None):
+    """
+    Запускает отдельную партию (без меню) в своём цикле сцен, например — показ повтора.
+
+    :param screen: Поверхность Pygame, на которой происходит отрисовка.
+    :param difficulty: Уровень сложности игры (easy, medium, hard, insane).
+    :param results: Журнал партий (ResultsLog), куда записывается законченная игра.
+    :param replay: Записанная партия (Replay) — показать её вместо игры с мышью.
+    """
+    settings = replay.settings() if replay is not None else MemorySettings(difficulty)
+    SceneManager(screen, settings).run(GameScene(screen, difficulty, results, replay))
+
+
+def _save_game(settings, game, results):
+    """Сохраняет повтор законченной партии и записывает её в журнал"""
+    replay_name = None
+    if game.recorder is not None:
+        replay_name = f"{int(time.time())}-{game.seed}.mtr"
+        Replay.from_game(game, game.recorder).save(os.path.join(settings.replays_dir, replay_name))
+    if results is not None:
+        results.record(leaderboard_key(settings), game.game_over_type == WIN,
+                       game.moves, int(game.time), game.score, game.seed, replay_name)
@@ -1,115 +1,151 @@
-import pygame
 import math
+from game.memory_objects.sprite_cache import sprite_cache  # Общий кэш спрайтов
+from game.rules import FLIP_SPEED, PULSE_SPEED, FADE_SPEED, FIXED_STEP  # Скорости анимаций в секунду
 
 
 class Card:
+    # Без __dict__: на поле 20x20 и в киоске карт сотни и тысячи
+    __slots__ = ("rect", "image", "id", "revealed", "matched", "animation_angle", "animating", "scale",
+                 "pulse_direction", "fade_alpha", "fading", "dirty", "dirty_rect", "animator", "slot")
+
+    # Одинаковые у всех карт — атрибуты класса, а не каждой карты
+    back_color = (100, 100, 200)
+    back_key = ("back", back_color)  # Ключ рубашки в кэше спрайтов
+    animation_speed = FLIP_SPEED  # рад/с
+
     def __init__(self, rect, image, id):
+        """
+        :param rect: Место карты на поверхности поля.
+        :param image: Лицевая сторона (подповерхность атласа GameScreen, в формате экрана).
+        :param id: Номер лицевой стороны (одинаковый у карт пары).
+        """
         self.rect = rect
         self.image = image
         self.id = id
         self.revealed = False
         self.matched = False
-        self.back_color = (100, 100, 200)
         self.animation_angle = 0
         self.animating = False
-        self.animation_speed = 0.2
         self.scale = 1.0
-        self.pulse_direction = 0.01
+        self.pulse_direction = PULSE_SPEED  # Скорость и направление пульсации, 1/с
         self.fade_alpha = 255  # Прозрачность для эффекта исчезновения
         self.fading = False  # Флаг процесса исчезновения
+        self.dirty = True  # Внешний вид изменился и карту нужно перерисовать
+        # Область, которую карта может занять (с запасом на пульсацию до 1.1)
+        pad = int(rect.width * 0.1) + 2
+        self.dirty_rect = rect.inflate(pad, pad)
+        self.animator = None  # CardAnimator поля, если анимации карт идут пакетом
+        self.slot = 0  # Индекс карты в массивах аниматора
+
+    def _changed(self):
+        """Отмечает смену состояния и сообщает о ней аниматору поля"""
+        self.dirty = True
+        if self.animator is not None:
+            self.animator.load(self)
 
     def start_flip_animation(self):
         self.animating = True
         self.animation_angle = 0
+        self._changed()
 
     def start_fade_out(self):
         """Начинает анимацию исчезновения карты"""
         self.fading = True
         self.fade_alpha = 255
+        self._changed()
+
+    def update_animation(self, dt=FIXED_STEP):
+        """
+        Продвигает анимации карты на dt секунд (скорость не зависит от FPS).
 
-    def update_animation(self):
+        :param dt: Прошедшее игровое время.
+        """
         if self.animating:
-            self.animation_angle += self.animation_speed
+            self.animation_angle += self.animation_speed * dt
             if self.animation_angle >= math.pi / 2:
                 self.animating = False
                 self.revealed = not self.revealed
                 self.animation_angle = 0
+            self.dirty = True
 
-        if self.matched and not self.animating:
-            # Анимация пульсации для совпавших карт
-            self.scale += self.pulse_direction
+        if self.matched and not self.animating and not self.fading and self.fade_alpha > 0:
+            # Анимация пульсации для совпавших карт; исчезающая карта рисуется
+            # без пульсации, поэтому и масштаб у неё стоит
+            self.scale += self.pulse_direction * dt
             if self.scale > 1.1 or self.scale < 0.9:
+                self.scale = min(1.1, max(0.9, self.scale))
                 self.pulse_direction *= -1
+            self.dirty = True
 
         if self.fading:
-            self.fade_alpha -= 5
+            self.fade_alpha -= FADE_SPEED * dt
             if self.fade_alpha <= 0:
                 self.fading = False
                 self.fade_alpha = 0
+            self.dirty = True
 
-    def draw(self, screen):
+    def render_item(self):
+        """
+        Спрайт карты и позиция для пакетной отрисовки (blits), снимает флаг dirty.
+
+        :return: (спрайт, позиция) или None, если карту не видно.
+        """
+        self.dirty = False
         if self.fade_alpha == 0:
-            return  # Полностью прозрачная карта - не рисуем
+            return None  # Полностью прозрачная карта - не рисуем
 
         if self.matched and not self.animating and not self.fading:
             # Анимация пульсации для совпавших карт
+            if not self.revealed:
+                return None
             scaled_width = int(self.rect.width * self.scale)
             scaled_height = int(self.rect.height * self.scale)
             offset_x = (self.rect.width - scaled_width) // 2
             offset_y = (self.rect.height - scaled_height) // 2
+            scaled_image = sprite_cache.get(self.image, scaled_width, scaled_height)
+            return scaled_image, (self.rect.x + offset_x, self.rect.y + offset_y)
 
-            if self.revealed:
-                scaled_image = pygame.transform.scale(self.image, (scaled_width, scaled_height))
-                if self.fading:
-                    scaled_image.set_alpha(self.fade_alpha)
-                screen.blit(scaled_image, (self.rect.x + offset_x, self.rect.y + offset_y))
-            return
-
-        # Остальная логика отрисовки без изменений
         if self.animating:
+            rect = self.rect
             progress = math.sin(self.animation_angle)
-            width = max(1, int(self.rect.width * (1 - abs(progress))))
-            temp_rect = pygame.Rect(0, 0, width, self.rect.height)
-            temp_rect.center = self.rect.center
+            width = max(1, int(rect.width * (1 - abs(progress))))
 
-            if not self.revealed:
-                if progress < 0:
-                    pygame.draw.rect(screen, self.back_color, temp_rect)
-                    pygame.draw.rect(screen, (255, 255, 255), temp_rect, 2)
-                else:
-                    temp_img = pygame.transform.scale(self.image, (width, self.rect.height))
-                    screen.blit(temp_img, temp_rect)
-            else:
-                if progress < 0:
-                    temp_img = pygame.transform.scale(self.image, (width, self.rect.height))
-                    screen.blit(temp_img, temp_rect)
-                else:
-                    pygame.draw.rect(screen, self.back_color, temp_rect)
-                    pygame.draw.rect(screen, (255, 255, 255), temp_rect, 2)
-        else:
-            if self.revealed:
-                img = self.image.copy()
-                if self.fading:
-                    img.set_alpha(self.fade_alpha)
-                screen.blit(img, self.rect)
-            else:
-                back = pygame.Surface((self.rect.width, self.rect.height))
-                back.fill(self.back_color)
-                if self.fading:
-                    back.set_alpha(self.fade_alpha)
-                screen.blit(back, self.rect)
-                pygame.draw.rect(screen, (255, 255, 255), self.rect, 2)
+            # Первая половина переворота показывает текущую сторону, вторая — обратную
+            show_face = self.revealed == (progress < 0)
+            source = self.image if show_face else self.back_key
+            # Сжатая по ширине карта по центру исходной (без временного Rect)
+            return sprite_cache.get(source, width, rect.height), (rect.centerx - width // 2, rect.y)
+
+        alpha = int(self.fade_alpha) // 5 * 5 if self.fading else 255  # Шаг 5 — меньше спрайтов в кэше
+        source = self.image if self.revealed else self.back_key
+        return sprite_cache.get(source, self.rect.width, self.rect.height, alpha), self.rect.topleft
+
+    def draw(self, screen):
+        """
+        Рисует карту на экране.
+
+        :return: Прямоугольник, который карта могла изменить (dirty_rect).
+        """
+        item = self.render_item()
+        if item is not None:
+            screen.blit(*item)
+        return self.dirty_rect
+
+    def can_click(self, pos=None):
+        """Можно ли перевернуть карту (pos — если нужно проверить попадание курсора)"""
+        return ((pos is None or self.rect.collidepoint(pos)) and  # Клик попал внутрь карты
+                not self.revealed and                   # Карта еще не была открыта
+                not self.matched and                    # И не совпала ранее
+                not self.animating and                  # И не в процессе анимации
+                self.fade_alpha == 255)                 # И не исчезает
 
     def handle_click(self, pos):
         """Обрабатывает клик по карте"""
-        if (self.rect.collidepoint(pos) and         # Клик попал внутрь карты
-            not self.revealed and                   # Карта еще не была открыта
-            not self.matched and                    # И не совпала ранее
-            not self.animating and                  # И не в процессе анимации
-            self.fade_alpha == 255):                # И не исчезает
+        if self.can_click(pos):
             self.start_flip_animation()
             return True
         return False
+
     def hide(self):
         """Закрывает карту, если она не была угадана"""
         if not self.matched and self.revealed:
@@ -118,3 +154,4 @@ class Card:
     def mark_matched(self):
         """Помечает карту как угаданную"""
         self.matched = True
+        self._changed()
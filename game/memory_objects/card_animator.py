@@ -0,0 +1,170 @@
+import math
+from game.rules import FADE_SPEED, FIXED_STEP
+
+try:
+    import numpy as np
+except ImportError:  # NumPy необязателен: без него карты анимируются по одной
+    np = None
+
+# С какого количества карт пакетный шаг быстрее цикла по объектам
+# (см. python -m benchmarks --only card_animation). Нужен NumPy — необязательная
+# зависимость (закомментирована в requirements.txt): pip install numpy
+VECTORIZE_MIN_CARDS = 200
+
+
+class CardAnimator:
+    """
+    Пакетная анимация всех карт поля.
+
+    Угол переворота, масштаб, направление пульсации, прозрачность и флаги
+    состояния всех карт хранятся в непрерывных массивах NumPy и продвигаются
+    одним векторным шагом за кадр. Карты получают обратно только изменившиеся
+    значения, а step возвращает индексы карт, которые нужно перерисовать.
+
+    Массивы — источник истины для анимаций; карты сообщают о начале новой
+    анимации через load (это делают методы Card). Без NumPy или на маленьких
+    полях используется обычный цикл Card.update_animation.
+    """
+
+    def __init__(self, cards, vectorized=None):
+        """
+        :param cards: Список карт поля (индекс в списке = индекс в массивах).
+        :param vectorized: Использовать NumPy; по умолчанию — если он есть и карт
+                           не меньше VECTORIZE_MIN_CARDS.
+        """
+        if vectorized is None:
+            vectorized = len(cards) >= VECTORIZE_MIN_CARDS
+        self.cards = cards
+        self.vectorized = vectorized and np is not None
+        self._changed = set()  # Карты, изменившиеся с прошлой отрисовки
+
+        if self.vectorized:
+            count = len(cards)
+            self.angle = np.zeros(count)
+            self.speed = np.array([card.animation_speed for card in cards], dtype=float)
+            self.scale = np.array([card.scale for card in cards], dtype=float)
+            self.pulse = np.array([card.pulse_direction for card in cards], dtype=float)
+            self.alpha = np.zeros(count)
+            self.animating = np.zeros(count, dtype=bool)
+            self.revealed = np.zeros(count, dtype=bool)
+            self.matched = np.zeros(count, dtype=bool)
+            self.fading = np.zeros(count, dtype=bool)
+
+        for slot, card in enumerate(cards):
+            card.animator = self
+            card.slot = slot
+            self.load(card)
+
+    def load(self, card):
+        """Переносит состояние карты в массивы (после начала переворота, совпадения, исчезновения)"""
+        self._changed.add(card.slot)
+        if not self.vectorized:
+            return
+        slot = card.slot
+        self.angle[slot] = card.animation_angle
+        self.alpha[slot] = card.fade_alpha
+        self.animating[slot] = card.animating
+        self.revealed[slot] = card.revealed
+        self.matched[slot] = card.matched
+        self.fading[slot] = card.fading
+
+    def step(self, dt=FIXED_STEP):
+        """
+        Продвигает анимации всех карт на dt секунд.
+
+        :return: Индексы карт, чей внешний вид изменился.
+        """
+        if not self.vectorized:
+            changed = []
+            for slot, card in enumerate(self.cards):
+                card.update_animation(dt)
+                if card.dirty:
+                    changed.append(slot)
+            self._changed.update(changed)
+            return changed
+
+        animating, fading, matched = self.animating, self.fading, self.matched
+        visible = self.alpha > 0  # Полностью исчезнувшие карты не видны
+        visible &= ~fading  # Исчезающая карта рисуется без пульсации — масштаб стоит, как в Card
+        pulsing = matched & visible
+        pulsing &= ~animating
+        flipping = animating.copy()
+        fade = fading.copy()
+        any_flip, any_fade = flipping.any(), fade.any()
+        if not (any_flip or any_fade or pulsing.any()):
+            return []  # Поле в покое: дальше никаких операций над массивами
+
+        # Переворот: угол растёт до pi/2, затем карта меняет сторону
+        if any_flip:
+            np.add(self.angle, self.speed * dt, out=self.angle, where=flipping)
+            done = flipping & (self.angle >= math.pi / 2)
+            animating ^= done
+            self.revealed ^= done
+            np.copyto(self.angle, 0.0, where=done)
+            done &= matched
+            done &= visible
+            pulsing |= done  # Переворот кончился — начинается пульсация
+
+        # Пульсация совпавших карт: масштаб ходит между 0.9 и 1.1
+        np.add(self.scale, self.pulse * dt, out=self.scale, where=pulsing)
+        bounce = (self.scale > 1.1) | (self.scale < 0.9)
+        np.clip(self.scale, 0.9, 1.1, out=self.scale)
+        np.negative(self.pulse, out=self.pulse, where=bounce)
+
+        # Исчезновение
+        if any_fade:
+            np.subtract(self.alpha, FADE_SPEED * dt, out=self.alpha, where=fade)
+            gone = fade & (self.alpha <= 0)
+            fading ^= gone
+            np.copyto(self.alpha, 0.0, where=gone)
+
+        self._store(flipping, pulsing, fade)
+        changed = np.flatnonzero(flipping | pulsing | fade).tolist()
+        self._changed.update(changed)
+        return changed
+
+    def _store(self, flipping, pulsing, fade):
+        """Возвращает картам изменившиеся значения и помечает их для перерисовки"""
+        # tolist один раз на массив: обращение к элементам NumPy по одному медленнее
+        cards = self.cards
+        if flipping.any():
+            angle, animating, revealed = self.angle.tolist(), self.animating.tolist(), self.revealed.tolist()
+            for slot in np.flatnonzero(flipping).tolist():
+                card = cards[slot]
+                card.animation_angle = angle[slot]
+                card.animating = animating[slot]
+                card.revealed = revealed[slot]
+                card.dirty = True
+        if pulsing.any():
+            scale, pulse = self.scale.tolist(), self.pulse.tolist()
+            for slot in np.flatnonzero(pulsing).tolist():
+                card = cards[slot]
+                card.scale = scale[slot]
+                card.pulse_direction = pulse[slot]
+                card.dirty = True
+        if fade.any():
+            alpha, fading = self.alpha.tolist(), self.fading.tolist()
+            for slot in np.flatnonzero(fade).tolist():
+                card = cards[slot]
+                card.fade_alpha = alpha[slot]
+                card.fading = fading[slot]
+                card.dirty = True
+
+    def take_changed(self):
+        """
+        Забирает карты, изменившиеся с прошлого вызова (в step или через load).
+
+        :return: Отсортированный список индексов (порядок отрисовки как в цикле по картам).
+        """
+        if not self._changed:
+            return []
+        slots = sorted(self._changed)
+        self._changed.clear()
+        return slots
+
+    def is_animating(self):
+        """Идёт ли переворот, исчезновение или пульсация видимой карты"""
+        if not self.vectorized:
+            return any(card.animating or card.fading or (card.matched and card.fade_alpha > 0)
+                       for card in self.cards)
+        return bool((self.animating | self.fading | (self.matched & (self.alpha > 0))).any())
@@ -1,27 +1,79 @@
 import pygame
 import random
-import time
+import colorsys
+import math
 from game.memory_objects.card import Card  # Класс карты
-from game.memory_objects.stats_screen import show_stats_screen  # Функция для отображения экрана результатов
+from game.memory_objects.card_animator import CardAnimator  # Анимации всех карт одним шагом
+from game.memory_objects.grid_index import GridIndex  # Поиск карты под курсором за O(1)
+from game.memory_objects.text_cache import get_font, render_text  # Общие шрифты и кэш надписей
+from game.asset_manager import assets  # Общий менеджер ресурсов
+from game.audio import audio  # Каналы микшера по категориям звуков
+from game.board_model import BoardModel  # Состояние поля без pygame
+from game.profiler import profiler  # Замер времени отрисовки каждой карты
+from game.render_backend import backend  # Формат поверхностей и пакетный blit
+from game.rules import calculate_score, deal, COMPARE_DELAY, MATCH_DISPLAY_TIME, FIXED_STEP, WIN, LOSE  # Общие правила игры
+
+# Категория каналов микшера для каждого звука игры
+SOUND_CATEGORIES = {"flip": "card", "match": "card", "mismatch": "card",
+                    "win": "result", "lose": "result", "button": "ui"}
+
+def _draw_pattern(surface, pattern, color):
+    """Рисует узор pattern поверх залитой карты"""
+    size = surface.get_width()
+    center = (size // 2, size // 2)
+    line = max(1, size // 12)
+    if pattern == "dot":
+        pygame.draw.circle(surface, color, center, size // 5)
+    elif pattern == "ring":
+        pygame.draw.circle(surface, color, center, size // 3, line)
+    elif pattern == "h_stripes":
+        for y in range(size // 6, size, size // 3):
+            pygame.draw.rect(surface, color, (0, y, size, line))
+    elif pattern == "v_stripes":
+        for x in range(size // 6, size, size // 3):
+            pygame.draw.rect(surface, color, (x, 0, line, size))
+    elif pattern == "diagonal":
+        pygame.draw.line(surface, color, (0, 0), (size, size), line)
+        pygame.draw.line(surface, color, (0, size // 2), (size // 2, size), line)
+        pygame.draw.line(surface, color, (size // 2, 0), (size, size // 2), line)
+    elif pattern == "cross":
+        pygame.draw.line(surface, color, (0, 0), (size, size), line)
+        pygame.draw.line(surface, color, (size, 0), (0, size), line)
+    elif pattern == "checker":
+        cell = max(1, size // 4)
+        for y in range(0, size, cell):
+            for x in range((y // cell) % 2 * cell, size, cell * 2):
+                pygame.draw.rect(surface, color, (x, y, cell, cell))
+    elif pattern == "frame":
+        inset = size // 5
+        pygame.draw.rect(surface, color, (inset, inset, size - 2 * inset, size - 2 * inset), line)
+
 
 class GameScreen:
-    def __init__(self, screen, settings):
+    def __init__(self, screen, settings, seed=None, recorder=None):
         """
         Инициализация игрового экрана.
 
         :param screen: Поверхность Pygame для отображения.
         :param settings: Объект с настройками игры (размер поля, лимиты и т.д.).
+        :param seed: Сид раскладки карт; по умолчанию — случайный.
+        :param recorder: InputRecorder, в который пишутся принятые клики (для повторов).
         """
         self.screen = screen
         self.settings = settings
-        self.cards = []  # Все карточки
-        self.first_card = None  # Первая выбранная карта
-        self.second_card = None  # Вторая выбранная карта
+        self.recorder = recorder
+        # Игровое время — сумма шагов update, а не показания часов: при одинаковых
+        # шагах и кликах партия повторяется в точности
+        self.time = 0.0
+        self.steps = 0  # Сколько шагов update сделано
+        self.seed = random.getrandbits(32) if seed is None else seed  # Сохраняется в журнал партий
+        self.rng = random.Random(self.seed)  # Раскладка и палитра зависят только от сида
+        self.cards = []  # Все карточки (отображение карт модели по тем же индексам)
+        self.model = None  # Состояние поля: открытые/угаданные карты и ходы
+        self.face_atlas = None  # Все лицевые стороны поля одной поверхностью
         self.last_flip_time = 0  # Время последнего переворота
-        self.moves = 0  # Количество сделанных ходов
-        self.font = pygame.font.SysFont(None, 36)  # Шрифт для текстовой информации
+        self.font = get_font(36)  # Шрифт для текстовой информации
         self.remaining_time = settings.time_limit  # Остаток времени
-        self.remaining_moves = settings.max_moves  # Остаток ходов
         self.game_over_type = None  # Статус завершения игры ("Победа", "Проигрыш", "back")
         self.score = 0  # Очки игрока
         self.match_timer = 0  # Таймер для задержки исчезновения совпавших карт
@@ -29,15 +81,21 @@ class GameScreen:
         self.showing_match = False  # Флаг отображения совпадения
         self.match_display_time = 0  # Время отображения совпадения
         self.back_button_rect = pygame.Rect(20, 20, 100, 40)  # Кнопка "Назад"
+        self.hint_index = None  # Карта, подсвеченная подсказкой
+
+        # Состояние для перерисовки только изменившихся областей
+        self.full_redraw = True  # Первый кадр рисуется целиком
+        self.hud_state = {}  # Элемент HUD -> (отображаемое значение, прямоугольник)
+        self.dirty_area = 0  # Площадь (в пикселях), перерисованная в последнем кадре
 
-        # Загрузка звуков
+        # Звуки (загружаются один раз на процесс менеджером ресурсов)
         self.sounds = {
-            'flip': pygame.mixer.Sound(self.settings.sound_flip),
-            'match': pygame.mixer.Sound(self.settings.sound_match),
-            'mismatch': pygame.mixer.Sound(self.settings.sound_mismatch),
-            'win': pygame.mixer.Sound(self.settings.sound_win),
-            'lose': pygame.mixer.Sound(self.settings.sound_lose),
-            'button': pygame.mixer.Sound(self.settings.sound_button)
+            'flip': assets.get_sound(self.settings.sound_flip),
+            'match': assets.get_sound(self.settings.sound_match),
+            'mismatch': assets.get_sound(self.settings.sound_mismatch),
+            'win': assets.get_sound(self.settings.sound_win),
+            'lose': assets.get_sound(self.settings.sound_lose),
+            'button': assets.get_sound(self.settings.sound_button)
         }
 
         # Анимационные переменные
@@ -47,56 +105,154 @@ class GameScreen:
 
         self._generate_cards()  # Генерация игрового поля
 
+    @property
+    def moves(self):
+        """Количество сделанных ходов"""
+        return self.model.moves
+
+    @property
+    def remaining_moves(self):
+        """Остаток ходов"""
+        return self.model.remaining_moves
+
+    @property
+    def first_card(self):
+        """Первая выбранная карта"""
+        return None if self.model.first is None else self.cards[self.model.first]
+
+    @property
+    def second_card(self):
+        """Вторая выбранная карта"""
+        return None if self.model.second is None else self.cards[self.model.second]
+
     def play_sound(self, sound_name):
-        """Воспроизводит звуковой эффект"""
+        """Воспроизводит звуковой эффект на каналах его категории"""
         if sound_name in self.sounds:
-            self.sounds[sound_name].play()
+            audio.play(self.sounds[sound_name], SOUND_CATEGORIES[sound_name])
 
     def show_message(self, text, duration):
         """Показывает временное сообщение на экране"""
         self.message_text = text
         self.message_alpha = 3000
-        self.message_timer = time.time() + duration
+        self.message_timer = self.time + duration
 
     def _generate_cards(self):
         """
         Создание и размещение карточек на игровом поле.
         """
-        images = self._load_images(self.settings.total_cards // 2)  # Генерируем половину пар
-        images *= 2  # Дублируем для пар
-        random.shuffle(images)  # Перемешиваем
-
-        margin = 10
-        card_width = 75
-        card_height = 75
         top_offset = 100
+        card_width, margin = self._card_layout(top_offset)
+        card_height = card_width
+
+        # Раскладка по сиду — общая с безголовой симуляцией
+        hue_offset, styles, faces = deal(self.rng, self.settings.total_cards // 2)
+        images = self._load_images(styles, hue_offset, card_width)
 
-        # Вычисляем отступы для центрирования
-        spacing_x = (self.settings.screen_width - (self.settings.cols * (card_width + margin))) // 2
-        spacing_y = ((self.settings.screen_height - top_offset) - (self.settings.rows * (card_height + margin))) // 2 + top_offset
+        # Вычисляем отступы для центрирования (по своей поверхности: в киоске это часть окна)
+        width, height = self.screen.get_size()
+        spacing_x = (width - (self.settings.cols * (card_width + margin))) // 2
+        spacing_y = ((height - top_offset) - (self.settings.rows * (card_height + margin))) // 2 + top_offset
 
         self.cards = []
+        self.grid = GridIndex(spacing_x, spacing_y, card_width, card_height,
+                              card_width + margin, card_height + margin,
+                              self.settings.rows, self.settings.cols)
 
         # Создание карточек в сетке
-        for row in range(self.settings.rows):
-            for col in range(self.settings.cols):
-                x = spacing_x + col * (card_width + margin)
-                y = spacing_y + row * (card_height + margin)
-                rect = pygame.Rect(x, y, card_width, card_height)
-                image = images.pop()
-                card = Card(rect, image, id=image)  # Создаем объект карты
-                self.cards.append(card)
+        for index, face in enumerate(faces):
+            row, col = divmod(index, self.settings.cols)
+            x = spacing_x + col * (card_width + margin)
+            y = spacing_y + row * (card_height + margin)
+            rect = pygame.Rect(x, y, card_width, card_height)
+            card = Card(rect, images[face], id=face)  # Создаем объект карты
+            self.cards.append(card)
+
+        # Полоса фона шириной с экран и высотой с область карты: ею стираются карты.
+        # Источник берётся с тем же x, что и место на экране, — строки копируются
+        # с одинаковым выравниванием, как из полной копии фона, но без неё
+        strip_height = self.cards[0].dirty_rect.height if self.cards else 1
+        self.erase_strip = backend.prepare(pygame.Surface((self.screen.get_width(), strip_height)))
+        self.erase_strip.fill(self.settings.bg_color)
+        self.animator = CardAnimator(self.cards)
+        self.model = BoardModel(faces, self.settings.max_moves)
+        self.model.subscribe(self._on_board_event)  # Карты следят за изменениями модели
+
+    def _on_board_event(self, event, *indexes):
+        """
+        Реакция отображения на изменения модели поля.
+
+        :param event: "reveal", "match" или "mismatch".
+        :param indexes: Индексы затронутых карт.
+        """
+        cards = [self.cards[index] for index in indexes]
+        if event == "reveal":
+            if self.hint_index is not None:
+                self.show_hint(None)  # Подсказка действует до следующего открытия
+            cards[0].start_flip_animation()
+            self.play_sound('flip')
+            if self.model.pair_ready():
+                self.last_flip_time = self.time
+        elif event == "match":
+            # Совпадение найдено
+            for card in cards:
+                card.mark_matched()
+            self.matched_pairs.append(tuple(cards))
+            self.play_sound('match')
+            self.show_message("Совпадение!", 1.5)
+            self.showing_match = True
+            self.match_display_time = self.time + MATCH_DISPLAY_TIME
+        elif event == "mismatch":
+            # Не совпало
+            for card in cards:
+                card.hide()
+            self.play_sound('mismatch')
+            self.show_message("Не совпало!", 1.5)
+
+    def _card_layout(self, top_offset):
+        """
+        Подбирает размер карты и отступ так, чтобы поле поместилось на поверхность экрана.
+
+        Готовые уровни помещаются с картами 75x75 и отступом 10; для больших
+        полей карты уменьшаются, а отступ не становится меньше запаса карты
+        на пульсацию (иначе соседние карты стирали бы друг друга).
 
-    def _load_images(self, count):
+        :param top_offset: Высота области над полем (счетчики и кнопка "Назад").
+        :return: (размер карты, отступ между картами).
+        """
+        available_width = self.screen.get_width()
+        available_height = self.screen.get_height() - top_offset
+        for size in range(75, 3, -1):
+            margin = max(size * 10 // 75, size // 10 + 2)
+            if (self.settings.cols * (size + margin) - margin <= available_width and
+                    self.settings.rows * (size + margin) - margin <= available_height):
+                return size, margin
+        return 4, 2
+
+    def _load_images(self, styles, hue_offset, size=75):
         """
-        Создает изображения для карт.
+        Создает изображения для карт: сочетания цвета и узора, гарантированно разные.
 
-        :param count: Количество уникальных изображений.
+        Все лицевые стороны рисуются в один атлас в формате экрана и возвращаются
+        его подповерхностями: одна поверхность на поле вместо своей на каждую пару.
+
+        :param styles: Стили лиц (узор, яркость, оттенок) из rules.deal.
+        :param hue_offset: Сдвиг палитры из rules.deal.
+        :param size: Размер стороны карты.
         """
+        count = len(styles)
+        # Почти квадратный атлас без пустых ячеек: столбцов — ближайший к корню делитель count
+        columns = next(c for c in range(max(1, math.ceil(math.sqrt(count))), count + 1) if count % c == 0)
+        rows = count // columns
+        self.face_atlas = backend.prepare(pygame.Surface((columns * size, rows * size)))
         images = []
-        for i in range(count):
-            surface = pygame.Surface((75, 75))
-            surface.fill((random.randint(50, 255), random.randint(50, 255), random.randint(50, 255)))  # Случайный цвет
+        for index, (pattern, shade, hue) in enumerate(styles):
+            value = 0.95 if shade == 0 else 0.6
+            r, g, b = colorsys.hsv_to_rgb((hue_offset + hue / 12) % 1, 0.75, value)
+            color = (int(r * 255), int(g * 255), int(b * 255))
+            ink = (30, 30, 30) if shade == 0 else (235, 235, 235)  # Контрастный цвет узора
+            surface = self.face_atlas.subsurface((index % columns * size, index // columns * size, size, size))
+            surface.fill(color)
+            _draw_pattern(surface, pattern, ink)
             images.append(surface)
         return images
 
@@ -104,13 +260,17 @@ class GameScreen:
         """
         Обработка пользовательских событий: клики мыши, нажатие на кнопку "Назад".
 
-        :param event: Событие Pygame.
+        :param event: Событие Pygame (позиция берётся из самого события).
         """
+        if event.type == pygame.WINDOWEXPOSED:
+            self.full_redraw = True  # Окно перекрывали — рисуем всё заново
+            return
+
         if event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
             # Проверка нажатия на кнопку "Назад"
             if self.back_button_rect.collidepoint(event.pos):
                 self.play_sound('button')
-                self.game_over_type = "back"
+                self.game_over_type = "back"  # Прерванная партия не сохраняется — и в повтор не пишется
                 return
 
         # Если игра завершена — ничего не делаем
@@ -121,64 +281,93 @@ class GameScreen:
             return
 
         # Обработка клика по карточке
-        if (event.type == pygame.MOUSEBUTTONDOWN and not self.second_card and
-                self.remaining_moves > 0):
-            pos = pygame.mouse.get_pos()
-            for card in self.cards:
-                if card.handle_click(pos) and card not in [c for pair in self.matched_pairs for c in pair]:
-                    self.play_sound('flip')
-                    if not self.first_card:
-                        self.first_card = card
-                    elif card != self.first_card:
-                        self.second_card = card
-                        self.moves += 1
-                        self.remaining_moves -= 1
-                        self.last_flip_time = time.time()
-
-    def update(self, remaining_time):
+        if event.type == pygame.MOUSEBUTTONDOWN:
+            index = self.grid.cell_at(event.pos)  # Карта под курсором без перебора всего поля
+            if index is not None:
+                self.click_card(index)
+
+    def click_card(self, index):
+        """
+        Открывает карту по индексу — общий путь для мыши, повторов и ИИ.
+
+        :param index: Индекс карты в self.cards.
+        :return: True, если карта начала переворачиваться.
+        """
+        if self.game_over_type or self.showing_match:
+            return False
+        if self.can_click(index):
+            if self.recorder is not None:
+                self.recorder.record(self.steps, index)
+            return self.model.reveal(index)  # Анимацию и звук запускает _on_board_event
+        return False
+
+    def can_click(self, index, now=None):
+        """
+        Можно ли открыть карту: модель разрешает и карта не переворачивается.
+
+        :param now: Не используется (совместимость с GameEngine для MemoryAI).
+        """
+        return self.model.can_reveal(index) and self.cards[index].can_click()
+
+    def accepts_input(self):
+        """Принимает ли партия клики по картам (для компьютерного игрока)"""
+        return not (self.game_over_type or self.showing_match or self.model.pair_ready())
+
+    def show_hint(self, index):
+        """
+        Подсвечивает карту-подсказку до следующего открытия карты.
+
+        :param index: Индекс карты или None — убрать подсказку.
+        """
+        for hinted in (self.hint_index, index):
+            if hinted is not None:
+                self.cards[hinted]._changed()  # Рамка рисуется вместе с картой
+        self.hint_index = index
+
+    def _draw_hint(self):
+        if self.hint_index is not None:
+            rect = self.cards[self.hint_index].rect.inflate(4, 4)  # Внутри dirty_rect карты
+            pygame.draw.rect(self.screen, (255, 220, 0), rect, 2)
+
+    def advance(self, dt=FIXED_STEP):
+        """
+        Один шаг игры: оставшееся время считается по игровому времени.
+
+        Игровой цикл и повторы партий вызывают именно его, поэтому время
+        на экране и в подсчёте очков одинаково в игре и при повторе.
+        """
+        self.update(max(self.settings.time_limit - int(self.time), 0), dt)
+
+    def update(self, remaining_time, dt=FIXED_STEP):
         """
         Логика игры: обработка совпадений, проверка условий завершения.
 
         :param remaining_time: Обновленное время (снаружи).
+        :param dt: Шаг игрового времени для анимаций (сек).
         """
         self.remaining_time = remaining_time
+        self.time += dt
+        self.steps += 1
+        now = self.time
 
-        # Обновление анимации всех карт
-        for card in self.cards:
-            card.update_animation()
+        # Обновление анимации всех карт одним шагом
+        self.animator.step(dt)
 
         # Обновление анимации сообщения
-        if self.message_alpha > 0 and time.time() < self.message_timer:
-            self.message_alpha -= 1
+        if self.message_alpha > 0 and now < self.message_timer:
+            self.message_alpha -= 60 * dt  # 1 единица за кадр при 60 FPS
         else:
             self.message_text = ""
 
-        # Обработка совпадения карт
-        if (self.first_card and self.second_card and
+        # Обработка совпадения карт (реакцию на результат рисует _on_board_event)
+        if (self.model.pair_ready() and
                 not self.first_card.animating and not self.second_card.animating):
 
-            if time.time() - self.last_flip_time > 1:
-                if self.first_card.id == self.second_card.id:
-                    # Совпадение найдено
-                    self.first_card.mark_matched()
-                    self.second_card.mark_matched()
-                    self.matched_pairs.append((self.first_card, self.second_card))
-                    self.play_sound('match')
-                    self.show_message("Совпадение!", 1.5)
-                    self.showing_match = True
-                    self.match_display_time = time.time() + 1
-                else:
-                    # Не совпало
-                    self.first_card.hide()
-                    self.second_card.hide()
-                    self.play_sound('mismatch')
-                    self.show_message("Не совпало!", 1.5)
-
-                self.first_card = None
-                self.second_card = None
+            if now - self.last_flip_time > COMPARE_DELAY:
+                self.model.resolve_pair()
 
         # Запуск исчезновения совпавших карт после задержки
-        if (self.showing_match and time.time() > self.match_display_time and
+        if (self.showing_match and now > self.match_display_time and
                 self.matched_pairs):
 
             for card1, card2 in self.matched_pairs:
@@ -188,14 +377,14 @@ class GameScreen:
             self.matched_pairs = []
             self.showing_match = False
 
-        # Проверка на победу (все карты открыты)
-        if all(card.matched for card in self.cards):
-            self.game_over_type = "Победа!"
+        # Проверка на победу (все карты открыты) — O(1) по счетчику модели
+        if self.model.is_won():
+            self.game_over_type = WIN
             self.play_sound('win')
             self.calculate_score()
         # Проверка на проигрыш (время или ходы закончились)
         elif self.remaining_time <= 0 or self.remaining_moves <= 0:
-            self.game_over_type = "Проигрыш!"
+            self.game_over_type = LOSE
             self.play_sound('lose')
             self.calculate_score(failed=True)
 
@@ -205,41 +394,103 @@ class GameScreen:
 
         :param failed: Булево значение — проиграл ли игрок.
         """
-        base = 10000
-        penalty = self.moves * 30 + (self.settings.time_limit - self.remaining_time) * 30
-        bonus = (self.remaining_moves * self.remaining_time) * 100
-        score = max(0, base - penalty + bonus)
-        if failed:
-            score = int(score * 0.5)
-        self.score = score
+        self.score = calculate_score(self.moves, self.remaining_moves, self.remaining_time,
+                                     self.settings.time_limit, failed)
 
     def draw(self):
         """
         Отрисовка всех элементов на экране: карты, счетчики, кнопки.
-        """
-        self.screen.fill((30, 30, 60))  # Заливка фона
 
-        for card in self.cards:
-            card.draw(self.screen)  # Рисуем карты
+        В режиме settings.render_mode == "dirty" перерисовываются только изменившиеся
+        карты и элементы интерфейса поверх закэшированного фона.
 
-        # Рисуем временное сообщение
-        if self.message_text:
-            text_surface = self.font.render(self.message_text, True, (255, 255, 255))
-            text_surface.set_alpha(self.message_alpha)
-            text_rect = text_surface.get_rect(center=(self.settings.screen_width // 2, 70))
-            self.screen.blit(text_surface, text_rect)
-
-        # Отображаем текст с оставшимися ходами и временем
-        moves_text = self.font.render(f"Ходы: {self.remaining_moves}", True, (255, 255, 255))
-        time_text = self.font.render(f"Время: {self.remaining_time}", True, (255, 255, 255))
-        self.screen.blit(moves_text, (150, 30))
-        self.screen.blit(time_text, (300, 30))
+        :return: Список прямоугольников, которые нужно обновить на дисплее.
+        """
+        if self.settings.render_mode != "dirty" or self.full_redraw:
+            return self._draw_full()
+
+        rects = []
+        changed = [self.cards[index] for index in self.animator.take_changed()]  # Без обхода всего поля
+        changed = [card for card in changed if card.dirty]
+        if changed:
+            started = profiler.start()
+            # Сначала стираем все старые изображения полосой фона, затем рисуем карты одним blits
+            strip = self.erase_strip
+            dirty = [card.dirty_rect for card in changed]
+            self.screen.blits([(strip, rect, (rect.x, 0, rect.width, rect.height)) for rect in dirty],
+                              doreturn=False)
+            backend.blit_many(self.screen, [item for item in map(Card.render_item, changed) if item is not None])
+            if self.hint_index is not None and self.cards[self.hint_index] in changed:
+                self._draw_hint()
+            profiler.stop("card_draw", started, len(changed))
+            rects.extend(dirty)
+        rects.extend(self._draw_hud())
+
+        self.dirty_area = sum(rect.width * rect.height for rect in rects)
+        return rects
+
+    def _draw_full(self):
+        """Полная перерисовка экрана"""
+        self.screen.fill(self.settings.bg_color)  # Заливка фона
+        self.animator.take_changed()  # Все карты рисуются заново
+
+        started = profiler.start()
+        # Рисуем карты одним blits
+        backend.blit_many(self.screen, [item for item in map(Card.render_item, self.cards) if item is not None])
+        self._draw_hint()
+        profiler.stop("card_draw", started, len(self.cards))
 
         # Рисуем кнопку "Назад"
         pygame.draw.rect(self.screen, (200, 50, 50), self.back_button_rect)
-        back_text = self.font.render("Назад", True, (255, 255, 255))
+        back_text = render_text(self.font, "Назад", (255, 255, 255))
         self.screen.blit(back_text, (self.back_button_rect.x + 10, self.back_button_rect.y + 5))
 
+        self.hud_state = {}  # Заставляем HUD нарисоваться заново
+        self._draw_hud()
+
+        self.full_redraw = False
+        rect = self.screen.get_rect()
+        self.dirty_area = rect.width * rect.height
+        return [rect]
+
+    def _draw_hud(self):
+        """
+        Рисует счетчики и временное сообщение, если их значение изменилось.
+
+        :return: Список изменённых прямоугольников.
+        """
+        rects = []
+        message = (self.message_text, min(int(self.message_alpha), 255)) if self.message_text else None
+        items = [
+            ("moves", f"Ходы: {self.remaining_moves}", (150, 30)),
+            ("time", f"Время: {self.remaining_time}", (300, 30)),
+            ("message", message, None),
+        ]
+        for key, value, pos in items:
+            if key in self.hud_state and self.hud_state[key][0] == value:
+                continue  # Ничего не изменилось
+
+            old_rect = self.hud_state[key][1] if key in self.hud_state else None
+            if old_rect:
+                self.screen.fill(self.settings.bg_color, old_rect)  # Стираем старый текст
+
+            new_rect = None
+            if key == "message":
+                # Рисуем временное сообщение
+                if value:
+                    text_surface = render_text(self.font, self.message_text, (255, 255, 255),
+                                               alpha=min(int(self.message_alpha), 255))
+                    new_rect = text_surface.get_rect(center=(self.screen.get_width() // 2, 70))
+                    self.screen.blit(text_surface, new_rect)
+            else:
+                # Отображаем текст с оставшимися ходами и временем
+                text_surface = render_text(self.font, value, (255, 255, 255))
+                new_rect = self.screen.blit(text_surface, pos)
+
+            self.hud_state[key] = (value, new_rect)
+            rects.extend(rect for rect in (old_rect, new_rect) if rect)
+        return rects
+
     def is_game_over(self):
         """
         Проверяет, завершена ли игра.
@@ -248,16 +499,12 @@ class GameScreen:
         """
         return self.game_over_type is not None
 
-    def show_stats_screen(self, time_used):
+    def is_animating(self):
         """
-        Отображает экран статистики после завершения игры.
+        Проверяет, меняется ли что-то на экране без участия игрока.
 
-        :param time_used: Общее время игры.
+        :return: True, если идёт анимация карт, сообщения или ожидание сравнения пары.
         """
-        show_stats_screen(
-            self.screen,
-            self.score,
-            self.game_over_type,
-            self.moves,
-            time_used
-        )
+        if self.message_text or self.model.pair_ready() or self.showing_match:
+            return True
+        return self.animator.is_animating()
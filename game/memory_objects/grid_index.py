@@ -0,0 +1,51 @@
+class GridIndex:
+    """
+    Поиск ячейки регулярной сетки по координатам за O(1).
+
+    Ячейки имеют размер cell_width x cell_height и повторяются с шагом
+    step_x/step_y (шаг = размер + отступ). Клик в отступ между ячейками
+    или за пределами сетки не попадает ни в одну ячейку.
+    """
+
+    def __init__(self, x, y, cell_width, cell_height, step_x, step_y, rows, cols):
+        """
+        :param x: Левый край первой ячейки.
+        :param y: Верхний край первой ячейки.
+        :param cell_width: Ширина ячейки.
+        :param cell_height: Высота ячейки.
+        :param step_x: Расстояние между левыми краями соседних ячеек.
+        :param step_y: Расстояние между верхними краями соседних ячеек.
+        :param rows: Количество строк.
+        :param cols: Количество столбцов.
+        """
+        self.x = x
+        self.y = y
+        self.cell_width = cell_width
+        self.cell_height = cell_height
+        self.step_x = step_x
+        self.step_y = step_y
+        self.rows = rows
+        self.cols = cols
+
+    def cell_at(self, pos):
+        """
+        Возвращает индекс ячейки (row * cols + col) под точкой pos или None.
+
+        :param pos: Координаты (x, y).
+        """
+        dx = pos[0] - self.x
+        dy = pos[1] - self.y
+        if dx < 0 or dy < 0:
+            return None
+        col, offset_x = divmod(dx, self.step_x)
+        row, offset_y = divmod(dy, self.step_y)
+        if (col >= self.cols or row >= self.rows or
+                offset_x >= self.cell_width or offset_y >= self.cell_height):
+            return None
+        return int(row) * self.cols + int(col)
+
+    def cell_rect(self, index):
+        """Координаты (x, y, ширина, высота) ячейки по её индексу"""
+        row, col = divmod(index, self.cols)
+        return (self.x + col * self.step_x, self.y + row * self.step_y,
+                self.cell_width, self.cell_height)
@@ -0,0 +1,92 @@
+import pygame
+from collections import OrderedDict
+from game.render_backend import backend
+
+
+class SpriteCache:
+    """
+    Общий кэш заранее отрисованных спрайтов карт (лицевые стороны, рубашки,
+    кадры переворота и пульсации).
+
+    Ключ — (исходное изображение, ширина, высота, прозрачность). Исходным
+    изображением может быть Surface лицевой стороны или кортеж ("back", цвет)
+    для рубашки. Лицевые стороны уже в формате экрана (атлас GameScreen), поэтому
+    непрозрачный спрайт исходного размера — само изображение, без копии пикселей.
+    При переполнении вытесняются давно не использованные спрайты.
+    """
+
+    def __init__(self, max_size=1024):
+        """
+        :param max_size: Максимальное количество спрайтов в кэше.
+        """
+        self.max_size = max_size
+        self._sprites = OrderedDict()
+        self.hits = 0  # Спрайт найден в кэше
+        self.misses = 0  # Спрайт пришлось отрисовать
+        self.evictions = 0  # Спрайт вытеснен из-за переполнения
+
+    def get(self, image, width, height, alpha=255):
+        """
+        Возвращает спрайт нужного размера и прозрачности, создавая его при промахе.
+
+        :param image: Surface лицевой стороны или ("back", цвет) для рубашки.
+        :param width: Ширина спрайта.
+        :param height: Высота спрайта.
+        :param alpha: Прозрачность (0-255).
+        """
+        key = (image, width, height, alpha)
+        sprite = self._sprites.get(key)
+        if sprite is not None:
+            self.hits += 1
+            self._sprites.move_to_end(key)
+            return sprite
+
+        self.misses += 1
+        sprite = self._render(image, width, height, alpha)
+        self._sprites[key] = sprite
+        if len(self._sprites) > self.max_size:
+            self._sprites.popitem(last=False)
+            self.evictions += 1
+        return sprite
+
+    def _render(self, image, width, height, alpha):
+        """Отрисовывает спрайт, не изменяя исходное изображение"""
+        if isinstance(image, tuple):
+            # Рубашка карты: заливка цветом и белая рамка
+            sprite = pygame.Surface((width, height))
+            sprite.fill(image[1])
+            pygame.draw.rect(sprite, (255, 255, 255), sprite.get_rect(), 2)
+        elif image.get_size() == (width, height):
+            if alpha == 255:
+                return image  # Подповерхность атласа: рисуется как есть
+            sprite = image.copy()
+        else:
+            sprite = pygame.transform.scale(image, (width, height))
+
+        # Спрайт в формате экрана: blit копирует пиксели без преобразования
+        sprite = backend.prepare(sprite)
+        if alpha < 255:
+            sprite.set_alpha(alpha, pygame.RLEACCEL)
+        return sprite
+
+    def clear(self):
+        """Очищает кэш (счетчики сохраняются)"""
+        self._sprites.clear()
+
+    def stats(self):
+        """Счетчики попаданий и промахов"""
+        total = self.hits + self.misses
+        return {
+            "size": len(self._sprites),
+            # Пиксели спрайтов; подповерхности атласов лиц своих пикселей не имеют
+            "bytes": sum(sprite.get_width() * sprite.get_height() * sprite.get_bytesize()
+                         for sprite in self._sprites.values() if sprite.get_parent() is None),
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "hit_rate": self.hits / total if total else 0.0,
+        }
+
+
+# Кэш, общий для всех карт и игровых экранов
+sprite_cache = SpriteCache()
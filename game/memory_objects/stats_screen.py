@@ -1,49 +1,81 @@
 import pygame  # Импортируем библиотеку Pygame для создания графического интерфейса
-import time    # Импортируем модуль time для отслеживания времени
+from game.memory_objects.text_cache import get_font, render_text
+from game.scene_manager import Scene
 
-def show_stats_screen(screen, score, result, moves, time_used):
+class StatsScreen(Scene):
     """
-    Показывает экран с результатами после окончания игры.
+    Экран с результатами после окончания игры.
 
-    :param screen: Поверхность Pygame для отображения.
-    :param score: Финальный счет игрока.
-    :param result: Строка с результатом игры (например, "Победа" или "Поражение").
-    :param moves: Количество ходов, сделанных игроком.
-    :param time_used: Время, затраченное на игру (в секундах).
+    Очки «набегают» за 2 секунды, потом экран статичен и не перерисовывается.
+    Любая клавиша или клик закрывают экран.
     """
 
-    # Создаем список шрифтов разного размера для каждой строки статистики
-    fonts = [pygame.font.SysFont(None, size) for size in [72, 44, 44, 44, 44]]
+    event_types = (pygame.KEYDOWN, pygame.MOUSEBUTTONDOWN, pygame.WINDOWEXPOSED)
 
-    clock = pygame.time.Clock()  # Создаем объект Clock для контроля FPS
-    start = time.time()  # Засекаем начальное время отображения экрана
+    def __init__(self, screen, score, result, moves, time_used):
+        """
+        :param screen: Поверхность Pygame для отображения.
+        :param score: Финальный счет игрока.
+        :param result: Строка с результатом игры (например, "Победа" или "Поражение").
+        :param moves: Количество ходов, сделанных игроком.
+        :param time_used: Время, затраченное на игру (в секундах).
+        """
+        super().__init__()
+        self.screen = screen
+        self.score = score
+        self.result = result
+        self.moves = moves
+        self.time_used = time_used
+        # Создаем список шрифтов разного размера для каждой строки статистики
+        self.fonts = [get_font(size) for size in [72, 44, 44, 44, 44]]
+        self.elapsed = 0.0  # Время с открытия экрана (по часам менеджера)
+        self.progress = 0.0  # Прогресс анимации очков (от 0 до 1 за 2 секунды)
+        self.needs_redraw = True
 
-    while True:
-        screen.fill((20, 20, 50))  # Заливаем экран темно-синим цветом
+    def enter(self):
+        self.needs_redraw = True
+
+    def handle_event(self, event):
+        if event.type == pygame.WINDOWEXPOSED:
+            self.needs_redraw = True
+        else:
+            self.manager.pop()  # Выходим из экрана статистики при любом действии пользователя
 
-        # Вычисляем прогресс анимации появления очков (от 0 до 1 за 2 секунды)
-        progress = min(1.0, (time.time() - start) / 2)
+    def update(self, dt):
+        if self.progress < 1.0:
+            self.elapsed += dt
+            self.progress = min(1.0, self.elapsed / 2)
+            self.needs_redraw = True
+
+    def draw(self):
+        if not self.needs_redraw:
+            return []  # Счёт уже набежал — кадр не меняется
+        self.needs_redraw = False
+        screen = self.screen
+        screen.fill((20, 20, 50))  # Заливаем экран темно-синим цветом
 
         # Формируем список строк для отображения
         lines = [
-            f"{result}",                             # Результат (Победа / Поражение)
-            f"Ходов: {moves}",                       # Количество ходов
-            f"Время: {time_used} сек",               # Время в секундах
-            f"Очки: {int(score * progress)}",        # Плавная анимация увеличения очков
-            "Нажмите любую клавишу для выхода"       # Подсказка пользователю
+            f"{self.result}",                                # Результат (Победа / Поражение)
+            f"Ходов: {self.moves}",                          # Количество ходов
+            f"Время: {self.time_used} сек",                  # Время в секундах
+            f"Очки: {int(self.score * self.progress)}",      # Плавная анимация увеличения очков
+            "Нажмите любую клавишу для выхода"               # Подсказка пользователю
         ]
 
         # Отображаем все строки на экране по центру
-        for i, (line, font) in enumerate(zip(lines, fonts)):
-            text = font.render(line, True, (255, 255, 255))  # Рендерим текст
+        for i, (line, font) in enumerate(zip(lines, self.fonts)):
+            if i == 3 and self.progress < 1.0:
+                text = font.render(line, True, (255, 255, 255))  # Счёт меняется каждый кадр — не кэшируем
+            else:
+                text = render_text(font, line, (255, 255, 255))  # Рендерим текст через кэш
             # Центрируем текст по горизонтали, вертикальное положение зависит от индекса
             screen.blit(text, text.get_rect(center=(screen.get_width() // 2, 150 + i * 60)))
+        return None  # Весь экран
 
-        pygame.display.flip()  # Обновляем экран
-
-        # Обработка событий
-        for event in pygame.event.get():
-            if event.type in (pygame.QUIT, pygame.KEYDOWN, pygame.MOUSEBUTTONDOWN):
-                return  # Выходим из экрана статистики при любом действии пользователя
+    def redraw(self):
+        self.needs_redraw = True
 
-        clock.tick(60)  # Ограничиваем частоту обновления до 60 кадров в секунду
+    def is_animating(self):
+        # Пока счёт «набегает» — полный FPS, потом экран статичен и можно простаивать
+        return self.progress < 1.0
@@ -0,0 +1,97 @@
+import pygame
+from collections import OrderedDict
+from game.render_backend import backend
+
+# Реестр шрифтов на весь процесс: (имя, размер) -> Font
+_fonts = {}
+
+
+def get_font(size, name=None):
+    """
+    Возвращает шрифт из общего реестра, загружая его только при первом запросе.
+
+    :param size: Размер шрифта.
+    :param name: Имя системного шрифта (None — шрифт pygame по умолчанию).
+    """
+    key = (name, size)
+    font = _fonts.get(key)
+    if font is None:
+        if name is None:
+            # Встроенный шрифт: SysFont даже для него сначала сканирует системные
+            # шрифты (fc-list), а это сотни миллисекунд на медленных машинах
+            font = pygame.font.Font(None, size)
+        else:
+            font = pygame.font.SysFont(name, size)
+        _fonts[key] = font
+    return font
+
+
+class TextCache:
+    """
+    Кэш отрисованных надписей.
+
+    Ключ — (шрифт, текст, цвет, сглаживание, прозрачность). Неизменившийся
+    текст берётся из кэша, заново рендерится только новый. При переполнении
+    вытесняются давно не использованные надписи.
+    """
+
+    def __init__(self, max_size=256):
+        """
+        :param max_size: Максимальное количество надписей в кэше.
+        """
+        self.max_size = max_size
+        self._surfaces = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def render(self, font, text, color, antialias=True, alpha=255):
+        """
+        Возвращает Surface с надписью. Полученную поверхность нельзя изменять.
+
+        :param font: Шрифт (лучше брать из get_font).
+        :param text: Текст надписи.
+        :param color: Цвет текста.
+        :param antialias: Сглаживание.
+        :param alpha: Прозрачность надписи (0-255).
+        """
+        key = (font, text, color, antialias, alpha)
+        surface = self._surfaces.get(key)
+        if surface is not None:
+            self.hits += 1
+            self._surfaces.move_to_end(key)
+            return surface
+
+        self.misses += 1
+        surface = backend.prepare(font.render(text, antialias, color), alpha=antialias)
+        if alpha < 255:
+            surface.set_alpha(alpha)
+        self._surfaces[key] = surface
+        if len(self._surfaces) > self.max_size:
+            self._surfaces.popitem(last=False)
+            self.evictions += 1
+        return surface
+
+    def clear(self):
+        """Очищает кэш (счетчики сохраняются)"""
+        self._surfaces.clear()
+
+    def stats(self):
+        """Счетчики попаданий и промахов"""
+        total = self.hits + self.misses
+        return {
+            "size": len(self._surfaces),
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "hit_rate": self.hits / total if total else 0.0,
+        }
+
+
+# Кэш, общий для меню, игрового экрана и экрана статистики
+text_cache = TextCache()
+
+
+def render_text(font, text, color, antialias=True, alpha=255):
+    """Отрисовывает надпись через общий кэш"""
+    return text_cache.render(font, text, color, antialias, alpha)
@@ -1,21 +1,76 @@
+import os
+
+SOUNDS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "sounds") # папка со звуками внутри пакета
+MAX_BOARD_SIZE = 20 # наибольшее число строк/столбцов для своей сложности
+# папка для журнала партий (MEMORY_DATA_DIR переопределяет)
+DATA_DIR = os.environ.get("MEMORY_DATA_DIR", os.path.join(os.path.expanduser("~"), ".memory_trainer"))
+
+
 class MemorySettings:
     def __init__(self, difficulty="easy"):
         self.screen_width = 800 # ширина окна
         self.screen_height = 600 # высота окна
         self.bg_color = (30, 30, 60) #цвет заливки
 
-        self.sound_flip = "game/sounds/flip.wav"
-        self.sound_match = "game/sounds/match.wav"
-        self.sound_mismatch = "game/sounds/mismatch.wav"
-        self.sound_win = "game/sounds/win.wav"
-        self.sound_lose = "game/sounds/lose.wav"
-        self.sound_button = "game/sounds/button.wav"
-        self.sound_background = "game/sounds/background.wav"
+        # Частота кадров
+        self.fps = 60 # целевой FPS во время анимации (0 — без ограничения)
+        self.idle_fps = 5 # FPS в простое, когда ничего не анимируется
+        self.vsync = False # синхронизация с дисплеем вместо ограничения FPS
+        self.idle_wait = True # в простое спать в pygame.event.wait до события
+
+        # Отрисовка: "dirty" — только изменившиеся области, "full" — весь экран каждый кадр
+        self.render_mode = "dirty"
+        # Вывод кадра: "software" — окно pygame.display, "sdl2" — текстура и GPU-рендерер pygame._sdl2
+        self.render_backend = "software"
+
+        self.sound_flip = os.path.join(SOUNDS_DIR, "flip.wav")
+        self.sound_match = os.path.join(SOUNDS_DIR, "match.wav")
+        self.sound_mismatch = os.path.join(SOUNDS_DIR, "mismatch.wav")
+        self.sound_win = os.path.join(SOUNDS_DIR, "win.wav")
+        self.sound_lose = os.path.join(SOUNDS_DIR, "lose.wav")
+        self.sound_button = os.path.join(SOUNDS_DIR, "button.wav")
+        self.sound_background = os.path.join(SOUNDS_DIR, "background.wav")
+        self.audio_frequency = 44100 # частота дискретизации микшера, Гц
+        self.audio_buffer = 512 # буфер микшера в сэмплах: меньше — меньше задержка, но чаще работа
+        self.audio_channels = {"ui": 1, "card": 3, "result": 1} # каналов микшера на категорию звуков
+        self.sound_throttle = 0.05 # тот же звук чаще, чем раз в столько секунд, не повторяется
+
+        # Журнал партий и таблица рекордов
+        self.results_path = os.path.join(DATA_DIR, "results.jsonl")
+        self.leaderboard_size = 10 # сколько лучших результатов хранить по сложности
+        self.replays_dir = os.path.join(DATA_DIR, "replays")
+        self.record_replays = True # сохранять сид и клики каждой партии для повтора
+
+        # Киоск: несколько полей в одном окне (python -m game.kiosk)
+        self.kiosk_boards = 4
+        self.kiosk_restart_delay = 5 # через сколько секунд законченное поле начинается заново
+
+        # Компьютерный игрок (python -m game.kiosk --ai, игрок "ai" в симуляции)
+        self.ai_accuracy = 100 # вероятность (%) запомнить увиденную карту: 100 — идеальная память
+        self.ai_move_delay = 0.3 # пауза между кликами компьютера, сек
+
+        # Сетевая игра (python -m game.server)
+        self.server_host = "127.0.0.1"
+        self.server_port = 47800
+        self.server_broadcast_hz = 20 # рассылок изменений в секунду: чаще — меньше задержка, больше пакетов
+        self.server_max_buffer = 64 * 1024 # байт в очереди клиента, после которых он получает только снимки
+        self.server_restart_delay = 5 # через сколько секунд законченная партия начинается заново
+
+        # Своя сложность (difficulty="custom")
+        self.custom_rows = 20
+        self.custom_cols = 20
+        self.custom_time_limit = None # None — подбирается по количеству пар
+        self.custom_max_moves = None
 
         # Настройки сложности
         self.difficulty = difficulty
         self.set_difficulty(difficulty)
 
+    def sound_paths(self):
+        """Звуковые эффекты игры (для предзагрузки; фоновая музыка идёт потоком)"""
+        return [self.sound_button, self.sound_flip, self.sound_match,
+                self.sound_mismatch, self.sound_win, self.sound_lose]
+
     def set_difficulty(self, difficulty):
         if difficulty == 'easy':
             self.rows = 2
@@ -37,5 +92,16 @@ class MemorySettings:
             self.cols = 8
             self.time_limit = 80
             self.max_moves = 55
+        elif difficulty == 'custom':
+            self.rows = self.custom_rows
+            self.cols = self.custom_cols
+            if not (0 < self.rows <= MAX_BOARD_SIZE and 0 < self.cols <= MAX_BOARD_SIZE):
+                raise ValueError(f"Размер поля должен быть от 1x1 до {MAX_BOARD_SIZE}x{MAX_BOARD_SIZE}")
+            if self.rows * self.cols % 2:
+                raise ValueError("Количество карт должно быть чётным")
+            pairs = self.rows * self.cols // 2
+            # По умолчанию лимиты растут с количеством пар, как у готовых уровней
+            self.time_limit = self.custom_time_limit or 20 + pairs * 3
+            self.max_moves = self.custom_max_moves or pairs * 2 + pairs // 4 + 2
 
         self.total_cards = self.rows * self.cols
\ No newline at end of file
@@ -0,0 +1,177 @@
+import atexit
+import csv
+import json
+import os
+import time
+from collections import deque
+import pygame
+from game.memory_objects.text_cache import get_font
+from game.audio import audio
+
+# Фазы кадра игрового цикла
+PHASES = ("events", "update", "draw", "card_draw", "flip", "frame")
+
+
+class FrameProfiler:
+    """
+    Профилировщик кадров с накладным экраном производительности.
+
+    Замеряет время каждой фазы кадра монотонными счетчиками (perf_counter_ns).
+    Включается переменной окружения MEMORY_PROFILE=1 или клавишей F3 в игре.
+    В конце сессии перцентили по фазам сохраняются в JSON или CSV
+    (путь из MEMORY_PROFILE_OUT, по умолчанию memory_profile.json).
+    """
+
+    def __init__(self, enabled=False, output="memory_profile.json", history=240, max_samples=100000):
+        """
+        :param enabled: Сразу включить замеры и накладной экран.
+        :param output: Файл для сохранения перцентилей в конце сессии.
+        :param history: Сколько последних кадров показывать на гистограмме.
+        :param max_samples: Сколько кадров хранить для перцентилей.
+        """
+        self.enabled = False
+        self.output = output
+        self.recent = deque(maxlen=history)  # Последние времена кадра (мс) для гистограммы
+        self.samples = {phase: deque(maxlen=max_samples) for phase in PHASES}
+        self.cards_drawn = deque(maxlen=max_samples)  # Сколько карт нарисовано за кадр
+        self._current = dict.fromkeys(PHASES, 0)
+        self._cards = 0
+        self._frame_start = 0
+        self._panel = None  # Закэшированная панель накладного экрана
+        self._panel_time = 0
+        self._dump_registered = False
+        if enabled:
+            self.toggle()
+
+    def toggle(self):
+        """Включает или выключает замеры и накладной экран"""
+        self.enabled = not self.enabled
+        self._panel = None
+        if self.enabled and not self._dump_registered:
+            atexit.register(self.dump)  # Сохраняем результаты при выходе из программы
+            self._dump_registered = True
+        return self.enabled
+
+    def begin_frame(self):
+        if self.enabled:
+            self._frame_start = time.perf_counter_ns()
+
+    def start(self):
+        """Засекает начало фазы; результат передаётся в stop"""
+        return time.perf_counter_ns() if self.enabled else 0
+
+    def stop(self, phase, started, count=1):
+        """
+        Добавляет время с момента started к фазе phase текущего кадра.
+
+        :param count: Сколько карт нарисовано за замер (для фазы card_draw).
+        """
+        if self.enabled:
+            self._current[phase] += time.perf_counter_ns() - started
+            if phase == "card_draw":
+                self._cards += count
+
+    def end_frame(self):
+        """Завершает кадр и сохраняет замеры фаз (в миллисекундах)"""
+        if not self.enabled:
+            return
+        self._current["frame"] = time.perf_counter_ns() - self._frame_start
+        for phase, value in self._current.items():
+            self.samples[phase].append(value / 1e6)
+            self._current[phase] = 0
+        self.cards_drawn.append(self._cards)
+        self._cards = 0
+        self.recent.append(self.samples["frame"][-1])
+
+    def draw_overlay(self, screen, fps=0.0):
+        """
+        Рисует панель с FPS, средним временем фаз и гистограммой времени кадра.
+
+        Сама панель перерисовывается 4 раза в секунду, в остальные кадры — только blit.
+
+        :return: Прямоугольник панели или None, если профилировщик выключен.
+        """
+        if not self.enabled:
+            return None
+        now = time.perf_counter()
+        if self._panel is None or now - self._panel_time > 0.25:
+            self._panel = self._render_panel(fps)
+            self._panel_time = now
+        rect = self._panel.get_rect(topright=(screen.get_width() - 5, 5))
+        return screen.blit(self._panel, rect)
+
+    def _render_panel(self, fps):
+        width, height = 230, 100
+        panel = pygame.Surface((width, height))
+        panel.fill((10, 10, 10))
+        font = get_font(18)
+        lines = [f"FPS {fps:5.1f}  кадр {self._mean('frame'):5.2f} мс"]
+        lines.append(f"ev {self._mean('events'):.2f}  upd {self._mean('update'):.2f}  "
+                     f"draw {self._mean('draw'):.2f}")
+        lines.append(f"cards {self._mean('card_draw'):.2f}  flip {self._mean('flip'):.2f}")
+        mixer = audio.stats()
+        if mixer["enabled"]:
+            categories = mixer["categories"].values()
+            lines.append(f"audio {sum(mixer['busy'].values())}/{sum(map(len, audio.channels.values()))}  "
+                         f"merged {sum(c['merged'] for c in categories)}  "
+                         f"stolen {sum(c['stolen'] for c in categories)}")
+        for i, line in enumerate(lines):
+            panel.blit(font.render(line, True, (200, 255, 200)), (5, 3 + i * 15))
+
+        # Гистограмма последних кадров: высота столбца — время кадра, 20 мс = вся высота
+        top, bar_height = 65, 32
+        recent = list(self.recent)[-(width - 10):]
+        for x, value in enumerate(recent):
+            h = min(bar_height, max(1, int(value / 20 * bar_height)))
+            color = (80, 200, 80) if value <= 1000 / 60 else (220, 80, 60)
+            pygame.draw.line(panel, color, (5 + x, top + bar_height), (5 + x, top + bar_height - h))
+        return panel
+
+    def _mean(self, phase):
+        values = self.samples[phase]
+        count = min(len(values), self.recent.maxlen)
+        if not count:
+            return 0.0
+        return sum(values[-i] for i in range(1, count + 1)) / count
+
+    def percentiles(self):
+        """Статистика по каждой фазе за всю сессию: count, mean, p50, p90, p95, p99, max (мс)"""
+        report = {}
+        for phase, values in self.samples.items():
+            if not values:
+                continue
+            ordered = sorted(values)
+            report[phase] = {
+                "count": len(ordered),
+                "mean": sum(ordered) / len(ordered),
+                **{f"p{p}": ordered[min(len(ordered) - 1, len(ordered) * p // 100)] for p in (50, 90, 95, 99)},
+                "max": ordered[-1],
+            }
+        return report
+
+    def dump(self, path=None):
+        """
+        Сохраняет перцентили фаз в JSON или CSV (по расширению файла).
+
+        :return: Путь к файлу или None, если замеров не было.
+        """
+        report = self.percentiles()
+        if not report:
+            return None
+        path = path or self.output
+        if path.endswith(".csv"):
+            with open(path, "w", newline="", encoding="utf-8") as f:
+                writer = csv.writer(f)
+                columns = ["count", "mean", "p50", "p90", "p95", "p99", "max"]
+                writer.writerow(["phase"] + columns)
+                for phase, stats in report.items():
+                    writer.writerow([phase] + [stats[column] for column in columns])
+        else:
+            with open(path, "w", encoding="utf-8") as f:
+                json.dump(report, f, indent=2)
+        return path
+
+
+# Профилировщик, общий для всего процесса
+profiler = FrameProfiler(enabled=os.environ.get("MEMORY_PROFILE") == "1",
+                         output=os.environ.get("MEMORY_PROFILE_OUT", "memory_profile.json"))
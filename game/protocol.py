@@ -0,0 +1,219 @@
+"""
+Двоичный протокол сетевой игры (game.server).
+
+Кадр: длина полезной нагрузки (u16) | тип (u8) | полезная нагрузка.
+Все числа — little-endian.
+
+Клиент -> сервер:
+    HELLO  роль (u8: 0 — игрок, 1 — зритель)
+    CLICK  индекс карты (u16)
+
+Сервер -> клиент:
+    GAME   новая партия: номер (u32), строк (u8), столбцов (u8), лимит времени (u16), лимит ходов (u16)
+    STATE  изменения с прошлой рассылки: шаг игры (u32), время отправки (u32, мкс
+           монотонных часов по модулю 2^32 — для замера задержки), набор полей (u8),
+           затем присутствующие поля по порядку:
+               FIELD_REVEALED — открытые карты: n (u16), n x (индекс u16, лицевая сторона u16);
+                                закрытые карты: n (u16), n x индекс (u16)
+               FIELD_MATCHED  — угаданные карты: n (u16), n x индекс (u16)
+               FIELD_COUNTERS — ходов (u16), осталось ходов (u16), осталось времени (u16)
+               FIELD_RESULT   — итог (u8: RESULTS), очки (u32)
+
+Лицевые стороны передаются только для открытых карт, сид раскладки не передаётся
+вовсе: зритель видит то же, что и игрок на экране. Снимок состояния для нового
+или отставшего клиента — тот же STATE, посчитанный от пустого поля.
+"""
+import struct
+import time
+from game.rules import LOSE, WIN
+
+HELLO, CLICK = 1, 2
+GAME, STATE = 16, 17
+
+PLAYER, SPECTATOR = 0, 1
+
+FIELD_REVEALED = 1
+FIELD_MATCHED = 2
+FIELD_COUNTERS = 4
+FIELD_RESULT = 8
+
+RESULTS = (None, WIN, LOSE, "back")  # Код итога — индекс в кортеже
+
+FRAME_HEADER = struct.Struct("<HB")
+_U16 = struct.Struct("<H")
+_PAIR = struct.Struct("<HH")
+_GAME = struct.Struct("<IBBHH")
+_STATE_HEADER = struct.Struct("<IIB")
+_COUNTERS = struct.Struct("<HHH")
+_RESULT = struct.Struct("<BI")
+
+
+def frame(kind, payload=b""):
+    """Кадр протокола с заголовком"""
+    return FRAME_HEADER.pack(len(payload), kind) + payload
+
+
+def timestamp_us():
+    """Время отправки для STATE: монотонные часы в микросекундах по модулю 2^32"""
+    return int(time.monotonic() * 1e6) & 0xFFFFFFFF
+
+
+def latency_us(sent_us):
+    """Задержка доставки STATE (только в пределах одной машины: часы общие)"""
+    return (timestamp_us() - sent_us) & 0xFFFFFFFF
+
+
+def _read_u16(payload, position):
+    """:return: (значение, позиция после него)"""
+    return _U16.unpack_from(payload, position)[0], position + _U16.size
+
+
+def _bits(mask):
+    """Индексы установленных битов маски по возрастанию"""
+    while mask:
+        low = mask & -mask
+        yield low.bit_length() - 1
+        mask ^= low
+
+
+class BoardState:
+    """
+    Состояние поля, которое видит клиент: открытые и угаданные карты, счётчики, итог.
+
+    Сервер снимает его с BoardModel (capture) и рассылает разницу с прошлой
+    рассылкой (encode_delta); клиент применяет STATE к своей копии (apply).
+    """
+
+    __slots__ = ("revealed", "matched", "faces", "moves", "remaining_moves",
+                 "remaining_time", "result", "score")
+
+    def __init__(self):
+        self.revealed = 0  # Бит i — карта i открыта
+        self.matched = 0  # Бит i — карта i угадана
+        self.faces = {}  # Индекс открытой (или когда-то открытой) карты -> лицевая сторона
+        self.moves = 0
+        self.remaining_moves = 0
+        self.remaining_time = 0
+        self.result = None
+        self.score = 0
+
+    @classmethod
+    def capture(cls, game):
+        """Снимок состояния GameScreen (faces не заполняется: они берутся из game.model)"""
+        state = cls()
+        model = game.model
+        state.revealed = model.revealed
+        state.matched = model.matched
+        state.moves = model.moves
+        state.remaining_moves = model.remaining_moves
+        state.remaining_time = game.remaining_time
+        state.result = game.game_over_type
+        state.score = game.score
+        return state
+
+    def counters(self):
+        return self.moves, self.remaining_moves, self.remaining_time
+
+    def encode_delta(self, old, faces, tick):
+        """
+        Полезная нагрузка STATE: что изменилось по сравнению с old.
+
+        :param old: Предыдущее разосланное состояние (пустое BoardState — для снимка).
+        :param faces: Лицевые стороны всех карт (BoardModel.faces) — для открывшихся карт.
+        :param tick: Номер шага игры.
+        :return: Байты полезной нагрузки или None, если ничего не изменилось.
+        """
+        fields = 0
+        parts = []
+        opened = self.revealed & ~old.revealed
+        closed = old.revealed & ~self.revealed
+        if opened or closed:
+            fields |= FIELD_REVEALED
+            indexes = list(_bits(opened))
+            parts.append(_U16.pack(len(indexes)))
+            parts.extend(_PAIR.pack(index, faces[index]) for index in indexes)
+            indexes = list(_bits(closed))
+            parts.append(_U16.pack(len(indexes)))
+            parts.extend(_U16.pack(index) for index in indexes)
+        matched = self.matched & ~old.matched
+        if matched:
+            fields |= FIELD_MATCHED
+            indexes = list(_bits(matched))
+            parts.append(_U16.pack(len(indexes)))
+            parts.extend(_U16.pack(index) for index in indexes)
+        if self.counters() != old.counters():
+            fields |= FIELD_COUNTERS
+            parts.append(_COUNTERS.pack(*self.counters()))
+        if self.result != old.result or self.score != old.score:
+            fields |= FIELD_RESULT
+            parts.append(_RESULT.pack(RESULTS.index(self.result), self.score))
+        if not fields:
+            return None
+        return _STATE_HEADER.pack(tick, timestamp_us(), fields) + b"".join(parts)
+
+    def apply(self, payload):
+        """
+        Применяет полезную нагрузку STATE.
+
+        :return: (шаг игры, время отправки в мкс).
+        """
+        tick, sent_us, fields = _STATE_HEADER.unpack_from(payload)
+        position = _STATE_HEADER.size
+        if fields & FIELD_REVEALED:
+            count, position = _read_u16(payload, position)
+            for _ in range(count):
+                index, face = _PAIR.unpack_from(payload, position)
+                position += _PAIR.size
+                self.revealed |= 1 << index
+                self.faces[index] = face
+            count, position = _read_u16(payload, position)
+            for _ in range(count):
+                index, position = _read_u16(payload, position)
+                self.revealed &= ~(1 << index)
+        if fields & FIELD_MATCHED:
+            count, position = _read_u16(payload, position)
+            for _ in range(count):
+                index, position = _read_u16(payload, position)
+                self.matched |= 1 << index
+        if fields & FIELD_COUNTERS:
+            self.moves, self.remaining_moves, self.remaining_time = _COUNTERS.unpack_from(payload, position)
+            position += _COUNTERS.size
+        if fields & FIELD_RESULT:
+            code, self.score = _RESULT.unpack_from(payload, position)
+            self.result = RESULTS[code]
+        return tick, sent_us
+
+
+def encode_hello(role):
+    """Полезная нагрузка HELLO"""
+    return bytes([role])
+
+
+def encode_click(index):
+    """Полезная нагрузка CLICK"""
+    return _U16.pack(index)
+
+
+def decode_hello(payload):
+    """:return: Роль клиента из HELLO или None, если кадр некорректен"""
+    if len(payload) != 1 or payload[0] not in (PLAYER, SPECTATOR):
+        return None
+    return payload[0]
+
+
+def decode_click(payload):
+    """:return: Индекс карты из CLICK или None, если кадр некорректен"""
+    if len(payload) != _U16.size:
+        return None
+    return _U16.unpack(payload)[0]
+
+
+def encode_game(game_id, settings):
+    """Полезная нагрузка GAME"""
+    return _GAME.pack(game_id, settings.rows, settings.cols, settings.time_limit, settings.max_moves)
+
+
+def decode_game(payload):
+    """:return: Словарь game_id, rows, cols, time_limit, max_moves"""
+    game_id, rows, cols, time_limit, max_moves = _GAME.unpack(payload)
+    return {"game_id": game_id, "rows": rows, "cols": cols, "time_limit": time_limit, "max_moves": max_moves}
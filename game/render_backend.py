@@ -0,0 +1,122 @@
+import pygame
+
+try:
+    from pygame._sdl2.video import Window, Renderer, Texture
+except ImportError:  # Старый pygame без _sdl2 — только программная отрисовка
+    Window = Renderer = Texture = None
+
+
+class RenderBackend:
+    """
+    Вывод кадров на экран.
+
+    Все экраны рисуют на обычную поверхность screen, а кадр показывает present:
+        "software" — screen и есть окно pygame.display, present — display.update/flip;
+        "sdl2"     — screen — внеэкранная поверхность, изменившиеся области
+                     загружаются в текстуру и выводятся GPU-рендерером pygame._sdl2
+                     (масштабирование и vsync — на видеокарте).
+    Если _sdl2 недоступен или рендерер не создаётся, используется "software".
+
+    prepare приводит поверхности к формату screen один раз при создании, чтобы
+    blit не конвертировал пиксели на каждом кадре.
+    """
+
+    def __init__(self):
+        self.name = None  # "software" или "sdl2" после create_screen
+        self.screen = None
+        self._window = None
+        self._renderer = None
+        self._texture = None
+
+    def create_screen(self, settings, title="Memory Game"):
+        """
+        Создаёт окно и поверхность для рисования.
+
+        :param settings: MemorySettings (размер окна, vsync, render_backend).
+        :param title: Заголовок окна.
+        :return: Поверхность, на которой рисуют все экраны.
+        """
+        size = (settings.screen_width, settings.screen_height)
+        if settings.render_backend == "sdl2" and Renderer is not None:
+            try:
+                self._window = Window(title, size=size)
+                self._renderer = Renderer(self._window, vsync=settings.vsync)
+                self._texture = Texture(self._renderer, size, streaming=True)
+            except pygame.error:
+                self._window = self._renderer = self._texture = None  # Нет GPU — рисуем программно
+            else:
+                self.name = "sdl2"
+                self.screen = pygame.Surface(size, 0, 32)
+                return self.screen
+
+        self.name = "software"
+        self.screen = None
+        if settings.vsync:
+            try:
+                self.screen = pygame.display.set_mode(size, pygame.SCALED, vsync=1)
+            except pygame.error:
+                settings.vsync = False  # Драйвер не поддерживает vsync — ограничиваем FPS сами
+        if self.screen is None:
+            self.screen = pygame.display.set_mode(size)
+        pygame.display.set_caption(title)
+        return self.screen
+
+    def present(self, rects=None):
+        """
+        Показывает кадр.
+
+        :param rects: Изменившиеся прямоугольники; None — весь экран.
+        """
+        if rects is not None and not rects:
+            return  # Кадр не изменился
+        if self._renderer is None:
+            if rects is None:
+                pygame.display.flip()
+            else:
+                pygame.display.update(rects)
+            return
+
+        if rects is None:
+            self._texture.update(self.screen)
+        else:
+            bounds = self.screen.get_rect()
+            for rect in rects:
+                rect = bounds.clip(rect)
+                if rect.width and rect.height:
+                    self._texture.update(self.screen.subsurface(rect), rect)
+        self._renderer.clear()
+        self._renderer.blit(self._texture)
+        self._renderer.present()
+
+    def prepare(self, surface, alpha=False):
+        """
+        Приводит поверхность к формату экрана.
+
+        :param alpha: У поверхности попиксельная прозрачность (текст) — convert_alpha.
+        :return: Новая поверхность или исходная, если экрана ещё нет (безголовый режим).
+        """
+        if pygame.display.get_surface() is None:
+            if self._renderer is None:
+                return surface
+            # У окна _sdl2 нет display-поверхности, convert недоступен: копируем в формат screen
+            if alpha:
+                converted = pygame.Surface(surface.get_size(), pygame.SRCALPHA, 32)
+            else:
+                converted = pygame.Surface(surface.get_size(), 0, self.screen)
+            converted.blit(surface, (0, 0))
+            return converted
+        if alpha:
+            return surface.convert_alpha()
+        return surface.convert()
+
+    @staticmethod
+    def blit_many(target, sequence):
+        """Рисует пачку (поверхность, позиция) одним вызовом"""
+        if hasattr(target, "fblits"):
+            target.fblits(sequence)  # pygame-ce: без создания списка прямоугольников
+        else:
+            target.blits(sequence, doreturn=False)
+
+
+# Вывод кадров, общий для всех экранов
+backend = RenderBackend()
@@ -0,0 +1,267 @@
+"""
+Запись и повтор партий.
+
+Партия полностью определяется сидом раскладки и последовательностью принятых
+кликов с номерами шагов игры (FIXED_STEP), на которых они случились: логика
+GameScreen идёт фиксированными шагами и не читает системные часы.
+
+Файл повтора (.mtr):
+    MTR1 | длина заголовка (varint) | заголовок JSON | zlib(поток событий)
+Заголовок хранит сид, размер поля и лимиты, а также итог партии (результат,
+очки, ходы, время) для проверки. Поток событий — пары varint
+(шагов с прошлого события, карта + 1; 0 зарезервирован). Прерванные кнопкой
+«Назад» партии не сохраняются, поэтому в повторе только клики по картам.
+
+Пример запуска (из корня репозитория):
+    python -m game.replay play ~/.memory_trainer/replays/1700000000-42.mtr
+    python -m game.replay verify ~/.memory_trainer/replays
+"""
+import argparse
+import json
+import os
+import sys
+import time
+import zlib
+import pygame
+from game.audio import audio
+from game.memory_settings import MemorySettings
+from game.memory_objects.game_screen import GameScreen
+from game.render_backend import backend
+from game.rules import FIXED_STEP
+
+MAGIC = b"MTR1"
+HEADER_FIELDS = ("seed", "difficulty", "rows", "cols", "time_limit", "max_moves")
+
+
+class ReplayError(ValueError):
+    """Файл повтора испорчен или не является повтором"""
+
+
+def _write_varint(buffer, value):
+    while value >= 0x80:
+        buffer.append(value & 0x7F | 0x80)
+        value >>= 7
+    buffer.append(value)
+
+
+def _read_varint(data, position):
+    """:return: (значение, позиция после него)"""
+    value = shift = 0
+    while True:
+        if position >= len(data):
+            raise ReplayError("Обрывается посреди числа")
+        byte = data[position]
+        position += 1
+        value |= (byte & 0x7F) << shift
+        if byte < 0x80:
+            return value, position
+        shift += 7
+
+
+class InputRecorder:
+    """Копит принятые клики партии: (номер шага, индекс карты)"""
+
+    def __init__(self):
+        self.events = []
+
+    def record(self, step, index):
+        self.events.append((step, index))
+
+
+class Replay:
+    """Сид, параметры поля, события и заявленный итог одной партии"""
+
+    def __init__(self, header, events):
+        """
+        :param header: Словарь: seed, difficulty, rows, cols, time_limit, max_moves,
+                       а после партии — result, score, moves, time_used.
+        :param events: Список (номер шага, индекс карты).
+        """
+        self.header = header
+        self.events = events
+
+    @classmethod
+    def from_game(cls, game, recorder):
+        """Повтор законченной партии GameScreen"""
+        settings = game.settings
+        header = {"seed": game.seed, "difficulty": settings.difficulty,
+                  "rows": settings.rows, "cols": settings.cols,
+                  "time_limit": settings.time_limit, "max_moves": settings.max_moves,
+                  "result": game.game_over_type, "score": game.score,
+                  "moves": game.moves, "time_used": int(game.time)}
+        return cls(header, list(recorder.events))
+
+    def settings(self):
+        """MemorySettings с тем же полем и лимитами, что были в партии"""
+        header = self.header
+        settings = MemorySettings(header["difficulty"])
+        settings.rows, settings.cols = header["rows"], header["cols"]
+        settings.time_limit, settings.max_moves = header["time_limit"], header["max_moves"]
+        settings.total_cards = settings.rows * settings.cols
+        return settings
+
+    def encode(self):
+        """Байты файла повтора: шаги — разностями, поток событий — сжат zlib"""
+        body = bytearray()
+        previous = 0
+        for step, index in self.events:
+            _write_varint(body, step - previous)
+            _write_varint(body, index + 1)
+            previous = step
+        header = json.dumps(self.header, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+        prefix = bytearray(MAGIC)
+        _write_varint(prefix, len(header))
+        return bytes(prefix) + header + zlib.compress(bytes(body), 9)
+
+    @classmethod
+    def decode(cls, data):
+        """
+        Повтор из байтов файла.
+
+        :raises ReplayError: Не файл повтора, испорчены заголовок или поток событий.
+        """
+        if not data.startswith(MAGIC):
+            raise ReplayError("Не файл повтора")
+        length, position = _read_varint(data, len(MAGIC))
+        try:
+            header = json.loads(data[position:position + length].decode("utf-8"))
+            body = zlib.decompress(data[position + length:])
+        except (ValueError, zlib.error) as error:  # JSON, UTF-8 или сжатие
+            raise ReplayError(f"Испорчен заголовок или поток событий: {error}") from error
+        if (not isinstance(header, dict) or any(field not in header for field in HEADER_FIELDS) or
+                not all(isinstance(header[field], int) for field in ("rows", "cols", "time_limit", "max_moves"))):
+            raise ReplayError("В заголовке нет параметров поля")
+        total = header["rows"] * header["cols"]
+
+        events = []
+        step = position = 0
+        while position < len(body):
+            delta, position = _read_varint(body, position)
+            code, position = _read_varint(body, position)
+            if not 0 < code <= total:
+                raise ReplayError(f"Карта {code - 1} вне поля")
+            step += delta
+            events.append((step, code - 1))
+        return cls(header, events)
+
+    def save(self, path):
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        with open(path, "wb") as f:
+            f.write(self.encode())
+        return path
+
+    @classmethod
+    def load(cls, path):
+        with open(path, "rb") as f:
+            return cls.decode(f.read())
+
+
+class ReplayPlayer:
+    """Подаёт записанные события в GameScreen перед шагами с их номерами"""
+
+    def __init__(self, replay):
+        self.replay = replay
+        self.position = 0
+
+    def apply(self, game):
+        """Выполняет события, назначенные на текущий шаг игры (вызывать перед game.advance)"""
+        events = self.replay.events
+        while self.position < len(events) and events[self.position][0] <= game.steps:
+            index = events[self.position][1]
+            self.position += 1
+            game.click_card(index)
+
+
+def replay_fast(replay, screen=None):
+    """
+    Проигрывает партию без отрисовки, так быстро, как возможно.
+
+    :param screen: Поверхность для GameScreen (по умолчанию — внеэкранная, дисплей не нужен).
+    :return: Словарь с result, score, moves, time_used, как в заголовке повтора.
+    """
+    settings = replay.settings()
+    screen = screen or pygame.Surface((settings.screen_width, settings.screen_height))
+    game = GameScreen(screen, settings, seed=replay.header["seed"])
+    player = ReplayPlayer(replay)
+    # Предел шагов: лимит времени плюс запас на доигрывание анимаций
+    limit = int((settings.time_limit + 10) / FIXED_STEP)
+    while not game.is_game_over() and game.steps < limit:
+        player.apply(game)  # Как в игровом цикле: клики, затем шаг
+        game.advance(FIXED_STEP)
+    return {"result": game.game_over_type, "score": game.score,
+            "moves": game.moves, "time_used": int(game.time)}
+
+
+def verify(paths):
+    """
+    Повторяет партии и сравнивает итог с заявленным в заголовке.
+
+    Испорченный или нечитаемый файл не останавливает проверку: он попадает
+    в список битых, и проверка идёт дальше.
+
+    :return: (список (путь, заявлено, получено) для несовпавших партий,
+              список (путь, ошибка) для файлов, которые не удалось прочитать).
+    """
+    mismatches = []
+    broken = []
+    for path in paths:
+        try:
+            replay = Replay.load(path)
+        except (OSError, ReplayError) as error:
+            broken.append((path, error))
+            continue
+        outcome = replay_fast(replay)
+        claimed = {key: replay.header.get(key) for key in outcome}
+        if outcome != claimed:
+            mismatches.append((path, claimed, outcome))
+    return mismatches, broken
+
+
+def _replay_files(paths):
+    for path in paths:
+        if os.path.isdir(path):
+            for name in sorted(os.listdir(path)):
+                if name.endswith(".mtr"):
+                    yield os.path.join(path, name)
+        else:
+            yield path
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Повтор и проверка записанных партий")
+    commands = parser.add_subparsers(dest="command", required=True)
+    play = commands.add_parser("play", help="Показать партию в реальном времени")
+    play.add_argument("path")
+    check = commands.add_parser("verify", help="Перепроверить очки партий без отрисовки")
+    check.add_argument("paths", nargs="+", help="Файлы .mtr или папки с ними")
+    args = parser.parse_args(argv)
+
+    if args.command == "play":
+        from game.memory_game import start_memory_game  # Игровой цикл сам импортирует этот модуль
+        try:
+            replay = Replay.load(args.path)
+        except (OSError, ReplayError) as error:
+            parser.error(f"{args.path}: {error}")
+        settings = replay.settings()
+        pygame.init()
+        screen = backend.create_screen(settings, "Повтор партии")
+        audio.setup(settings)  # Без меню каналы категорий некому зарезервировать
+        start_memory_game(screen, settings.difficulty, replay=replay)
+        pygame.quit()
+        return 0
+
+    pygame.font.init()  # Шрифты нужны GameScreen, дисплей — нет
+    paths = list(_replay_files(args.paths))
+    start = time.perf_counter()
+    mismatches, broken = verify(paths)
+    elapsed = time.perf_counter() - start
+    for path, claimed, outcome in mismatches:
+        print(f"{path}: заявлено {claimed}, получено {outcome}")
+    for path, error in broken:
+        print(f"{path}: не читается: {error}")
+    print(f"партий: {len(paths)}, не совпало: {len(mismatches)}, битых файлов: {len(broken)}, {elapsed:.2f} с")
+    return 1 if mismatches or broken else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
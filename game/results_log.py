@@ -0,0 +1,424 @@
+"""
+Журнал сыгранных партий и таблица рекордов.
+
+Каждая законченная партия дописывается в конец файла одной строкой JSON
+(сложность, победа, ходы, время, очки, сид). Запись на диск (fsync) идёт
+пачками: раз в sync_every партий или раз в sync_interval секунд.
+
+Рядом с журналом лежит индекс (<журнал>.index): лучшие top_n результатов
+и счётчики партий по каждой сложности и смещение, до которого журнал уже
+учтён. В памяти индекс обновляется при каждой записи, на диск сохраняется
+вместе с журналом; меню получает рекорд за O(1), а при запуске дочитывается
+только хвост журнала после смещения.
+
+В один журнал могут писать несколько процессов (меню, киоск, сервер на одном
+results_path): запись, сохранение индекса и сжатие идут под блокировкой файла
+<журнал>.lock, и перед ними каждый процесс дочитывает строки, дописанные
+другими, — индекс всегда соответствует файлу.
+
+Испорченная строка журнала (ручная правка, сбой диска) пропускается с
+предупреждением: игра запускается, остальные партии учитываются. Если на
+испорченную строку указывает смещение индекса, индекс отбрасывается и журнал
+учитывается заново с начала.
+
+Сжатие журнала на миллионы строк:
+    python -m game.results_log --compact --keep 1000
+"""
+import argparse
+import atexit
+import bisect
+import json
+import logging
+import os
+import time
+from collections import deque
+from contextlib import contextmanager
+from game.memory_settings import MemorySettings
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+    import msvcrt
+
+logger = logging.getLogger(__name__)
+
+# Поля, без которых строку журнала не учесть
+ENTRY_FIELDS = ("d", "w", "m", "t", "s", "seed", "ts")
+SUMMARY_FIELDS = ("sum", "n", "w", "s")
+
+
+def leaderboard_key(settings):
+    """Ключ таблицы рекордов: сложность, а для своего поля — ещё и его размер"""
+    if settings.difficulty == "custom":
+        return f"custom-{settings.rows}x{settings.cols}"
+    return settings.difficulty
+
+
+def _parse(line):
+    """Запись журнала из строки или None, если строка испорчена"""
+    try:
+        record = json.loads(line)
+    except ValueError:  # Не JSON или не UTF-8
+        return None
+    if not isinstance(record, dict):
+        return None
+    fields = SUMMARY_FIELDS if "sum" in record else ENTRY_FIELDS
+    if any(field not in record for field in fields):
+        return None
+    return record
+
+
+def _lock_file(f):
+    """Ждёт исключительную блокировку открытого файла f"""
+    if fcntl is not None:
+        fcntl.flock(f.fileno(), fcntl.LOCK_EX)
+        return
+    f.seek(0)
+    while True:
+        try:
+            msvcrt.locking(f.fileno(), msvcrt.LK_LOCK, 1)  # Сам ждёт около 10 с, затем OSError
+            return
+        except OSError:
+            pass
+
+
+def _unlock_file(f):
+    if fcntl is not None:
+        fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+    else:
+        f.seek(0)
+        msvcrt.locking(f.fileno(), msvcrt.LK_UNLCK, 1)
+
+
+def _entry_id(entry):
+    """Неизменные поля записи — по ним рекорд находится в журнале при сжатии"""
+    return entry["d"], entry["ts"], entry["seed"], entry["s"], entry["m"], entry["t"]
+
+
+class ResultsLog:
+    """
+    Журнал партий с пакетной записью на диск и индексом рекордов.
+
+    Строка журнала — партия: {"d": сложность, "w": 1/0, "m": ходы, "t": время (сек),
+    "s": очки, "seed": сид поля, "ts": время окончания (unix), "r": файл повтора}. После сжатия
+    в журнале появляются и итоговые строки {"sum": сложность, "n": партий,
+    "w": побед, "s": сумма очков} вместо удалённых партий.
+    """
+
+    def __init__(self, path, top_n=10, sync_every=16, sync_interval=5.0):
+        """
+        :param path: Файл журнала (каталог создаётся при первой записи).
+        :param top_n: Сколько лучших результатов хранить по каждой сложности.
+        :param sync_every: Через сколько записей сбрасывать журнал на диск.
+        :param sync_interval: Через сколько секунд с последнего сброса сбрасывать журнал.
+        """
+        self.path = path
+        self.index_path = path + ".index"
+        self.top_n = top_n
+        self.sync_every = sync_every
+        self.sync_interval = sync_interval
+        self.leaders = {}  # Сложность -> лучшие записи по убыванию очков
+        self.totals = {}  # Сложность -> {"n": партий, "w": побед, "s": сумма очков}
+        self._keys = {}  # Сложность -> отрицательные очки лидеров (для bisect)
+        self._offset = 0  # Сколько байт журнала уже учтено в индексе
+        self._inode = None  # Файл журнала, до _offset которого всё учтено (сжатие заменяет файл)
+        self._file = None
+        self._lock = None  # Открытый <журнал>.lock
+        self._pending = 0  # Записей, ещё не сброшенных на диск
+        self._last_sync = time.monotonic()
+        self._load()
+        atexit.register(self.close)
+
+    def record(self, difficulty, won, moves, time_used, score, seed, replay=None):
+        """
+        Дописывает партию в журнал и обновляет рекорды.
+
+        :param replay: Имя файла повтора партии (в папке повторов), если он записан.
+
+        :return: Место в таблице рекордов (с 1) или None, если результат в неё не попал.
+        """
+        entry = {"d": difficulty, "w": int(bool(won)), "m": moves, "t": time_used,
+                 "s": score, "seed": seed, "ts": int(time.time())}
+        if replay:
+            entry["r"] = replay
+        line = (json.dumps(entry, separators=(",", ":"), ensure_ascii=False) + "\n").encode("utf-8")
+        with self._locked():
+            self._catch_up()  # Сначала партии других процессов: смещение и рекорды — как в файле
+            if self._file is None:
+                self._file = open(self.path, "ab")
+                self._inode = os.fstat(self._file.fileno()).st_ino
+            self._file.write(line)
+            self._file.flush()  # До снятия блокировки: другие процессы видят строку целиком
+            self._offset += len(line)
+            place = self._add(entry)
+        self._pending += 1
+
+        if self._pending >= self.sync_every or time.monotonic() - self._last_sync >= self.sync_interval:
+            self.sync()
+        return place
+
+    def sync(self):
+        """Сбрасывает журнал на диск (fsync) и сохраняет индекс"""
+        if self._pending:
+            with self._locked():
+                if self._file is not None:
+                    os.fsync(self._file.fileno())
+                self._catch_up()  # Индекс общий: в нём и партии других процессов
+                self._save_index()
+        self._pending = 0
+        self._last_sync = time.monotonic()
+
+    def close(self):
+        self.sync()
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+        if self._lock is not None:
+            self._lock.close()
+            self._lock = None
+
+    def best(self, difficulty):
+        """Лучшая запись по сложности или None — O(1)"""
+        leaders = self.leaders.get(difficulty)
+        return leaders[0] if leaders else None
+
+    def leaderboard(self, difficulty):
+        """Лучшие записи по сложности (по убыванию очков)"""
+        return list(self.leaders.get(difficulty, ()))
+
+    def _add(self, entry):
+        """Учитывает запись партии в счётчиках и рекордах; возвращает место или None"""
+        difficulty = entry["d"]
+        totals = self.totals.setdefault(difficulty, {"n": 0, "w": 0, "s": 0})
+        totals["n"] += 1
+        totals["w"] += entry["w"]
+        totals["s"] += entry["s"]
+
+        keys = self._keys.setdefault(difficulty, [])
+        leaders = self.leaders.setdefault(difficulty, [])
+        place = bisect.bisect_right(keys, -entry["s"])  # При равенстве выше тот, кто раньше
+        if place >= self.top_n:
+            return None
+        keys.insert(place, -entry["s"])
+        leaders.insert(place, entry)
+        if len(leaders) > self.top_n:
+            keys.pop()
+            leaders.pop()
+        return place + 1
+
+    def _add_summary(self, summary):
+        totals = self.totals.setdefault(summary["sum"], {"n": 0, "w": 0, "s": 0})
+        for field in ("n", "w", "s"):
+            totals[field] += summary[field]
+
+    def _load(self):
+        """Читает индекс и дочитывает журнал после учтённого смещения"""
+        if not os.path.exists(self.path):
+            return  # Партий ещё нет (каталог создаётся при первой записи)
+        with self._locked():
+            try:
+                with open(self.index_path, encoding="utf-8") as f:
+                    index = json.load(f)
+            except (OSError, ValueError):
+                index = None
+            size = os.path.getsize(self.path)
+
+            changed = False
+            if index and index.get("top_n") == self.top_n and index["offset"] <= size:
+                self.totals = index["totals"]
+                for difficulty, leaders in index["leaders"].items():
+                    self.leaders[difficulty] = leaders
+                    self._keys[difficulty] = [-entry["s"] for entry in leaders]
+                self._offset = index["offset"]
+                if not self._index_fits():
+                    logger.warning("%s: индекс не совпадает с журналом, журнал учитывается заново", self.index_path)
+                    self._reset()
+                    changed = True
+            changed = self._scan() or changed
+            if changed:
+                self._save_index()
+
+    @contextmanager
+    def _locked(self):
+        """Блокировка журнала между процессами, пишущими в один файл"""
+        if self._lock is None:
+            os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+            self._lock = open(self.path + ".lock", "ab")
+        _lock_file(self._lock)
+        try:
+            yield
+        finally:
+            _unlock_file(self._lock)
+
+    def _catch_up(self):
+        """
+        Дочитывает строки, дописанные другими процессами (вызывать под блокировкой).
+
+        Если журнал сжат или удалён другим процессом, он учитывается заново с начала.
+        """
+        try:
+            stat = os.stat(self.path)
+        except FileNotFoundError:
+            stat = None
+        if self._inode is not None and (stat is None or stat.st_ino != self._inode or stat.st_size < self._offset):
+            if self._file is not None:
+                self._file.close()  # Дописывать нужно уже в новый файл
+                self._file = None
+            self._inode = None
+            self._reset()
+        return self._scan()
+
+    def _reset(self):
+        """Забывает учтённое: журнал будет учтён с начала"""
+        self.leaders = {}
+        self.totals = {}
+        self._keys = {}
+        self._offset = 0
+
+    def _index_fits(self):
+        """Смещение индекса — начало целой строки журнала (или его конец)"""
+        if not self._offset:
+            return True
+        with open(self.path, "rb") as f:
+            f.seek(self._offset - 1)
+            if f.read(1) != b"\n":
+                return False
+            line = f.readline()
+        return not line.endswith(b"\n") or _parse(line) is not None  # Конец или недописанная строка — в порядке
+
+    def _scan(self):
+        """
+        Учитывает строки журнала после self._offset.
+
+        Недописанная последняя строка (сбой во время записи) отбрасывается,
+        испорченные строки пропускаются с предупреждением.
+
+        :return: Сколько строк учтено.
+        """
+        if not os.path.exists(self.path):
+            return 0
+        count = 0
+        with open(self.path, "rb") as f:
+            self._inode = os.fstat(f.fileno()).st_ino
+            f.seek(self._offset)
+            for line in f:
+                if not line.endswith(b"\n"):
+                    break
+                record = _parse(line)
+                if record is None:
+                    logger.warning("%s: пропущена испорченная строка (байт %d)", self.path, self._offset)
+                    self._offset += len(line)
+                    continue
+                self._offset += len(line)
+                if "sum" in record:
+                    self._add_summary(record)
+                else:
+                    self._add(record)
+                count += 1
+        if os.path.getsize(self.path) > self._offset:
+            with open(self.path, "rb+") as f:
+                f.truncate(self._offset)  # Следующая запись начнётся с новой строки
+        return count
+
+    def _save_index(self):
+        """Сохраняет индекс атомарно: через временный файл и os.replace"""
+        index = {"offset": self._offset, "top_n": self.top_n,
+                 "leaders": self.leaders, "totals": self.totals}
+        temp_path = self.index_path + ".tmp"
+        with open(temp_path, "w", encoding="utf-8") as f:
+            json.dump(index, f, ensure_ascii=False, separators=(",", ":"))
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(temp_path, self.index_path)
+
+    def compact(self, keep_recent=1000):
+        """
+        Сжимает журнал: оставляет рекорды и keep_recent последних партий,
+        остальные партии сворачивает в итоговые строки по сложностям.
+
+        Журнал читается потоком, в памяти — только последние keep_recent строк,
+        так что сжатие подходит для журналов на миллионы записей. Счётчики
+        и рекорды после сжатия не меняются. Испорченные строки переносятся
+        в <журнал>.bad, а не теряются.
+
+        :return: (строк было, строк стало).
+        """
+        self.close()
+        if not os.path.exists(self.path):
+            return 0, 0
+
+        with self._locked():
+            self._catch_up()  # Партии других процессов тоже сжимаются, а не теряются
+            leader_ids = {_entry_id(entry) for leaders in self.leaders.values() for entry in leaders}
+            summaries = {}
+            recent = deque()
+            before = after = 0
+            bad = 0
+            temp_path = self.path + ".tmp"
+            with open(self.path, "rb") as source, open(temp_path, "wb") as target:
+                for line in source:
+                    before += 1
+                    record = _parse(line) if line.endswith(b"\n") else None  # Без \n — недописана
+                    if record is None:
+                        with open(self.path + ".bad", "ab") as rejected:
+                            rejected.write(line.rstrip(b"\n") + b"\n")
+                        bad += 1
+                        continue
+                    if "sum" in record:
+                        summary = summaries.setdefault(record["sum"], {"n": 0, "w": 0, "s": 0})
+                        for field in ("n", "w", "s"):
+                            summary[field] += record[field]
+                        continue
+                    recent.append((line, record))
+                    if len(recent) <= keep_recent:
+                        continue
+                    line, record = recent.popleft()  # Партия вышла из числа последних
+                    if _entry_id(record) in leader_ids:
+                        target.write(line)
+                        after += 1
+                    else:
+                        summary = summaries.setdefault(record["d"], {"n": 0, "w": 0, "s": 0})
+                        summary["n"] += 1
+                        summary["w"] += record["w"]
+                        summary["s"] += record["s"]
+                for line, _ in recent:
+                    target.write(line)
+                    after += 1
+                for difficulty, summary in summaries.items():
+                    target.write((json.dumps({"sum": difficulty, **summary}, separators=(",", ":"),
+                                             ensure_ascii=False) + "\n").encode("utf-8"))
+                    after += 1
+                target.flush()
+                os.fsync(target.fileno())
+            os.replace(temp_path, self.path)
+            if bad:
+                logger.warning("%s: испорченных строк перенесено в %s.bad: %d", self.path, self.path, bad)
+
+            self._offset = os.path.getsize(self.path)
+            self._inode = os.stat(self.path).st_ino
+            self._save_index()
+            return before, after
+
+
+def main(argv=None):
+    settings = MemorySettings()
+    parser = argparse.ArgumentParser(description="Журнал партий и таблица рекордов")
+    parser.add_argument("--path", default=settings.results_path)
+    parser.add_argument("--compact", action="store_true", help="Сжать журнал")
+    parser.add_argument("--keep", type=int, default=1000, help="Сколько последних партий оставить при сжатии")
+    args = parser.parse_args(argv)
+
+    log = ResultsLog(args.path, top_n=settings.leaderboard_size)
+    if args.compact:
+        before, after = log.compact(args.keep)
+        print(f"строк: {before} -> {after}")
+    for difficulty in sorted(log.totals):
+        totals = log.totals[difficulty]
+        best = log.best(difficulty)
+        print(f"{difficulty:<16} партий {totals['n']:>8}  побед {totals['w']:>8}  "
+              f"рекорд {best['s'] if best else '-'}")
+
+
+if __name__ == "__main__":
+    main()
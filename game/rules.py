@@ -0,0 +1,76 @@
+import math
+
+# Скорости анимаций карт (в секунду; при 60 FPS это прежние 0.2 рад, 0.01 и 5 за кадр)
+FLIP_SPEED = 12.0  # Угол переворота, рад/с
+PULSE_SPEED = 0.6  # Изменение масштаба пульсации, 1/с
+FADE_SPEED = 300.0  # Уменьшение прозрачности при исчезновении, ед./с
+FIXED_STEP = 1 / 60  # Фиксированный шаг обновления логики и анимаций (сек)
+
+# Длительности, общие для игрового экрана и безголовой симуляции (в секундах, кроме FLIP_STEPS)
+FLIP_STEPS = math.ceil((math.pi / 2) / (FLIP_SPEED * FIXED_STEP))  # Переворот: 8 шагов по FIXED_STEP
+COMPARE_DELAY = 1  # Пауза после второго хода перед сравнением пары
+MATCH_DISPLAY_TIME = 1  # Сколько показывается совпавшая пара перед исчезновением
+
+# Результаты игры
+WIN = "Победа!"
+LOSE = "Проигрыш!"
+
+# Узоры лицевых сторон (первый — однотонная карта); у каждого 12 оттенков x 2 яркости
+FACE_PATTERNS = ("solid", "dot", "ring", "h_stripes", "v_stripes", "diagonal", "cross", "checker", "frame")
+
+
+def deal(rng, pairs):
+    """
+    Раскладка поля по сиду: палитра, стили лицевых сторон и порядок карт.
+
+    GameScreen и безголовая симуляция берут раскладку только отсюда, поэтому
+    одинаковый сид даёт у них одинаковое поле.
+
+    :param rng: random.Random с сидом партии.
+    :param pairs: Количество пар (не больше len(FACE_PATTERNS) * 24).
+    :return: (сдвиг палитры, стили лиц [(узор, яркость, оттенок)] по номерам,
+        номера лиц карт по порядку: слева направо, сверху вниз).
+    """
+    hue_offset = rng.random()  # Случайный сдвиг палитры для разнообразия
+    # Сначала однотонные карты, затем — с узорами: на небольших полях карты различаются только цветом
+    styles = []
+    for pattern in FACE_PATTERNS:
+        tier = [(pattern, shade, hue) for shade in (0, 1) for hue in range(12)]
+        rng.shuffle(tier)
+        styles.extend(tier)
+    if pairs > len(styles):
+        raise ValueError(f"Не больше {len(styles)} разных изображений")
+    faces = list(range(pairs)) * 2  # Номера лицевых сторон, по два на пару
+    rng.shuffle(faces)
+    faces.reverse()  # Карты исторически раздаются с конца списка — сиды прежних партий в силе
+    return hue_offset, styles[:pairs], faces
+
+
+# Коэффициенты подсчёта очков (подбираются через python -m game.tuner)
+SCORE_WEIGHTS = {
+    "base": 10000,  # Очки за партию до штрафов
+    "move_penalty": 30,  # Штраф за каждый ход
+    "time_penalty": 30,  # Штраф за каждую потраченную секунду
+    "bonus": 100,  # Бонус за (оставшиеся ходы x оставшееся время)
+    "fail_factor": 0.5,  # Доля очков при проигрыше
+}
+
+
+def calculate_score(moves, remaining_moves, remaining_time, time_limit, failed=False, weights=SCORE_WEIGHTS):
+    """
+    Подсчет очков в зависимости от результата и затраченных ресурсов.
+
+    :param moves: Количество сделанных ходов.
+    :param remaining_moves: Оставшиеся ходы.
+    :param remaining_time: Оставшееся время (сек).
+    :param time_limit: Лимит времени уровня (сек).
+    :param failed: Булево значение — проиграл ли игрок.
+    :param weights: Коэффициенты подсчёта (по умолчанию SCORE_WEIGHTS).
+    """
+    base = weights["base"]
+    penalty = moves * weights["move_penalty"] + (time_limit - remaining_time) * weights["time_penalty"]
+    bonus = (remaining_moves * remaining_time) * weights["bonus"]
+    score = max(0, base - penalty + bonus)
+    if failed:
+        score = int(score * weights["fail_factor"])
+    return score
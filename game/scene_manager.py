@@ -0,0 +1,172 @@
+import pygame
+from game.frame_scheduler import FrameScheduler
+from game.game_clock import GameClock
+from game.input_manager import input_manager
+from game.profiler import profiler
+from game.render_backend import backend
+
+
+class Scene:
+    """
+    Экран игры в стеке SceneManager (меню, партия, статистика).
+
+    Пока сцена наверху стека, она получает события типов event_types,
+    а каждый кадр — update и draw. Переходы — manager.push/pop/replace.
+    """
+
+    event_types = ()  # Типы событий, которые получает handle_event
+
+    def __init__(self):
+        self.manager = None  # Заполняется при push
+
+    def enter(self):
+        """Сцена стала верхней (после push или pop сцены над ней)"""
+
+    def leave(self):
+        """Сцена перестала быть верхней (push сверху, pop или replace)"""
+
+    def handle_event(self, event):
+        """Событие одного из event_types"""
+
+    def update(self, dt):
+        """
+        Логика сцены за кадр.
+
+        :param dt: Прошедшее время кадра (сек) по общим часам менеджера.
+        """
+
+    def draw(self):
+        """
+        Рисует сцену.
+
+        :return: Изменившиеся прямоугольники; None — весь экран.
+        """
+        return None
+
+    def redraw(self):
+        """Следующий draw должен нарисовать экран целиком (панель профилировщика убрана)"""
+
+    def is_animating(self):
+        """Меняется ли экран без ввода (иначе кадры идут с idle_fps)"""
+        return False
+
+
+class SceneManager:
+    """
+    Единый цикл игры со стеком сцен.
+
+    Один цикл, одни часы (GameClock), один FrameScheduler и одна раздача событий
+    на все экраны: меню кладёт партию на стек, партия заменяет себя статистикой,
+    статистика снимается и открывает меню. Закрытие окна очищает стек, и run
+    возвращает управление — без exit() изнутри экранов.
+    """
+
+    def __init__(self, screen, settings):
+        """
+        :param screen: Поверхность для рисования (backend.create_screen).
+        :param settings: MemorySettings (частота кадров для планировщика).
+        """
+        self.screen = screen
+        self.settings = settings
+        self.scheduler = FrameScheduler(settings)
+        self.clock = GameClock()
+        self.stack = []
+
+    @property
+    def top(self):
+        return self.stack[-1] if self.stack else None
+
+    def push(self, scene):
+        """Кладёт сцену поверх текущей"""
+        self._leave_top()
+        scene.manager = self
+        self.stack.append(scene)
+        self._enter_top()
+
+    def pop(self):
+        """Снимает верхнюю сцену и возвращает к предыдущей"""
+        self._leave_top()
+        self.stack.pop()
+        self._enter_top()
+
+    def replace(self, scene):
+        """Заменяет верхнюю сцену (партия -> статистика)"""
+        self._leave_top()
+        self.stack.pop()
+        scene.manager = self
+        self.stack.append(scene)
+        self._enter_top()
+
+    def quit(self):
+        """Снимает все сцены: run завершится после текущего кадра"""
+        self._leave_top()
+        self.stack.clear()
+
+    def _enter_top(self):
+        scene = self.top
+        if scene is None:
+            return
+        input_manager.subscribe(scene.handle_event, scene.event_types)
+        scene.enter()
+        self.clock.sync()  # Время до перехода (загрузка поля) не попадает в новую сцену
+
+    def _leave_top(self):
+        scene = self.top
+        if scene is not None:
+            input_manager.unsubscribe(scene.handle_event)
+            scene.leave()
+
+    def run(self, scene=None):
+        """
+        Цикл кадров, пока стек не пуст.
+
+        :param scene: Первая сцена (например, MainMenu).
+        """
+        input_manager.install()  # Пропускаем в очередь только нужные игре события
+        if scene is not None:
+            self.push(scene)
+        while self.stack:
+            self.frame()
+
+    def frame(self):
+        """Один кадр: события, логика, отрисовка верхней сцены и ожидание следующего кадра"""
+        profiler.begin_frame()
+
+        # Общие события — здесь, остальные уходят подписанной верхней сцене
+        started = profiler.start()
+        events = input_manager.poll()
+        for event in events:
+            if event.type == pygame.QUIT:
+                self.quit()  # Окно закрыто — выходим из всех экранов
+                return
+            if event.type == pygame.KEYDOWN and event.key == pygame.K_F3:
+                if not profiler.toggle() and self.top:
+                    self.top.redraw()  # Стираем панель профилировщика
+        input_manager.dispatch(events)
+        profiler.stop("events", started)
+
+        started = profiler.start()
+        dt = self.clock.tick()
+        if self.top:
+            self.top.update(dt)
+        profiler.stop("update", started)
+        scene = self.top
+        if scene is None:
+            return
+
+        started = profiler.start()
+        rects = scene.draw()
+        profiler.stop("draw", started)
+
+        overlay_rect = profiler.draw_overlay(self.screen, self.scheduler.get_fps())
+        if overlay_rect and rects is not None:
+            rects.append(overlay_rect)
+
+        # Обновляем окно — только переданные прямоугольники
+        started = profiler.start()
+        backend.present(rects)
+        profiler.stop("flip", started)
+        profiler.end_frame()
+
+        # Ждём следующего кадра; без анимации — реже
+        self.scheduler.tick(animating=scene.is_animating())
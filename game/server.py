@@ -0,0 +1,268 @@
+"""
+Сетевая игра: сервер партии для игроков и зрителей по локальной сети.
+
+Сервер ведёт партию по правилам GameScreen (без окна, как при проверке
+повторов): игроки присылают клики, все клиенты получают изменения
+состояния протокола game.protocol — открытые и угаданные карты, счётчики
+и итог, а не кадры. Рассылка идёт settings.server_broadcast_hz раз в секунду:
+изменения за несколько шагов игры сливаются в один STATE, который кодируется
+один раз и пишется всем клиентам без ожидания каждого. Клиент, чей буфер
+отправки переполнен, пропускает рассылки и потом получает снимок заново.
+
+Пример запуска (из корня репозитория):
+    python -m game.server serve --difficulty hard --port 47800
+    python -m game.server watch --host 192.168.0.10 --port 47800
+"""
+import argparse
+import asyncio
+import random
+import sys
+import pygame
+from game import protocol
+from game.game_clock import GameClock
+from game.memory_settings import MemorySettings
+from game.memory_objects.game_screen import GameScreen
+from game.protocol import BoardState
+from game.rules import FIXED_STEP
+
+
+async def read_frame(reader):
+    """:return: (тип, полезная нагрузка) следующего кадра"""
+    header = await reader.readexactly(protocol.FRAME_HEADER.size)
+    length, kind = protocol.FRAME_HEADER.unpack(header)
+    return kind, await reader.readexactly(length)
+
+
+class Connection:
+    """Клиент на стороне сервера"""
+
+    def __init__(self, writer, role):
+        self.writer = writer
+        self.role = role
+        self.needs_snapshot = False  # Пропустил рассылки — нужен снимок с GAME
+
+
+class GameServer:
+    """Партия, игроки и зрители одного процесса сервера"""
+
+    def __init__(self, settings, difficulty="easy", seed=None, host=None, port=None):
+        """
+        :param settings: MemorySettings (адрес, частота рассылки, буфер, задержка перезапуска).
+        :param difficulty: Сложность партий.
+        :param seed: Сид для сидов партий.
+        :param host: Адрес (по умолчанию settings.server_host).
+        :param port: Порт (по умолчанию settings.server_port; 0 — любой свободный).
+        """
+        self.settings = settings
+        self.difficulty = difficulty
+        self.host = settings.server_host if host is None else host
+        self.port = settings.server_port if port is None else port
+        self.rng = random.Random(seed)
+        self.connections = []
+        self.game = None
+        self.game_id = 0
+        self.sent = None  # Последнее разосланное состояние
+        self.finished_at = None  # Время сервера, когда партия закончилась
+        self.clock = None
+        self._server = None
+        self._task = None
+        # Счётчики для нагрузочного теста
+        self.broadcasts = 0  # Рассылок STATE
+        self.frames_sent = 0  # Кадров записано клиентам
+        self.bytes_sent = 0
+        self.skipped = 0  # Рассылок пропущено из-за переполненного буфера клиента
+
+    async def start(self):
+        """Открывает сокет и запускает цикл партии; возвращает фактический порт"""
+        pygame.font.init()  # Шрифты нужны GameScreen, дисплей — нет
+        self._new_game()
+        loop = asyncio.get_running_loop()
+        self.clock = GameClock(time_source=loop.time)
+        self._server = await asyncio.start_server(self._serve, self.host, self.port)
+        self.port = self._server.sockets[0].getsockname()[1]
+        self._task = asyncio.create_task(self._run())
+        return self.port
+
+    async def close(self):
+        self._task.cancel()
+        self._server.close()
+        for connection in self.connections:
+            connection.writer.close()
+        await self._server.wait_closed()
+
+    def _new_game(self):
+        settings = MemorySettings(self.difficulty)
+        screen = pygame.Surface((settings.screen_width, settings.screen_height))
+        self.game = GameScreen(screen, settings, seed=self.rng.getrandbits(32))
+        self.game_id += 1
+        self.sent = BoardState.capture(self.game)
+        self.finished_at = None
+        for connection in self.connections:
+            connection.needs_snapshot = True  # Новая партия — всем GAME и снимок
+
+    def _snapshot(self):
+        """GAME и полное текущее состояние — для нового или отставшего клиента"""
+        game = protocol.frame(protocol.GAME, protocol.encode_game(self.game_id, self.game.settings))
+        payload = self.sent.encode_delta(BoardState(), self.game.model.faces, self.game.steps)
+        return game + (protocol.frame(protocol.STATE, payload) if payload else b"")
+
+    async def _serve(self, reader, writer):
+        connection = None
+        try:
+            kind, payload = await read_frame(reader)
+            role = protocol.decode_hello(payload) if kind == protocol.HELLO else None
+            if role is None:
+                return  # Не клиент игры — отключаем
+            connection = Connection(writer, role)
+            self._write(connection, self._snapshot())
+            self.connections.append(connection)
+            while True:
+                kind, payload = await read_frame(reader)
+                if kind != protocol.CLICK:
+                    continue
+                index = protocol.decode_click(payload)
+                if index is None:
+                    return  # Испорченный кадр — отключаем клиента
+                if connection.role == protocol.PLAYER and self.finished_at is None:
+                    if index < self.game.model.total:  # Индекс приходит из сети — проверяем
+                        self.game.click_card(index)
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass  # Клиент отключился
+        except asyncio.CancelledError:
+            pass  # Сервер останавливается: соединение просто закрывается
+        finally:
+            if connection in self.connections:
+                self.connections.remove(connection)
+            writer.close()
+
+    async def _run(self):
+        """Шаги партии и рассылка изменений с частотой server_broadcast_hz"""
+        interval = 1 / self.settings.server_broadcast_hz
+        while True:
+            await asyncio.sleep(interval)
+            self.clock.tick()
+            for _ in range(self.clock.steps(FIXED_STEP)):
+                if self.finished_at is None:
+                    self.game.advance(FIXED_STEP)
+                    if self.game.is_game_over():
+                        self.finished_at = self.clock.now()
+            self.broadcast()
+            if (self.finished_at is not None and
+                    self.clock.now() - self.finished_at >= self.settings.server_restart_delay):
+                self._new_game()
+
+    def broadcast(self):
+        """Рассылает изменения с прошлой рассылки всем клиентам одним и тем же кадром"""
+        state = BoardState.capture(self.game)
+        payload = state.encode_delta(self.sent, self.game.model.faces, self.game.steps)
+        delta = protocol.frame(protocol.STATE, payload) if payload else None
+        self.sent = state
+        snapshot = None
+        if delta:
+            self.broadcasts += 1
+        for connection in self.connections:
+            if connection.writer.transport.get_write_buffer_size() > self.settings.server_max_buffer:
+                connection.needs_snapshot = True  # Клиент не успевает читать — догонит снимком
+                self.skipped += 1
+            elif connection.needs_snapshot:
+                snapshot = snapshot or self._snapshot()  # Кодируется один раз на всех отставших
+                connection.needs_snapshot = False
+                self._write(connection, snapshot)
+            elif delta:
+                self._write(connection, delta)
+
+    def _write(self, connection, data):
+        connection.writer.write(data)  # Без await: медленный клиент не задерживает остальных
+        self.frames_sent += 1
+        self.bytes_sent += len(data)
+
+
+class GameClient:
+    """
+    Клиент сервера: копия состояния партии из кадров GAME и STATE.
+
+    Годится и для проверки сервера на этой же машине, и как основа зрителя.
+    """
+
+    def __init__(self, role=protocol.SPECTATOR):
+        self.role = role
+        self.game = None  # Параметры партии из GAME
+        self.state = BoardState()
+        self.reader = None
+        self.writer = None
+
+    async def connect(self, host, port):
+        self.reader, self.writer = await asyncio.open_connection(host, port)
+        self.writer.write(protocol.frame(protocol.HELLO, protocol.encode_hello(self.role)))
+        await self.writer.drain()
+
+    async def click(self, index):
+        self.writer.write(protocol.frame(protocol.CLICK, protocol.encode_click(index)))
+        await self.writer.drain()
+
+    async def receive(self):
+        """
+        Читает и применяет один кадр.
+
+        :return: (тип кадра, время отправки STATE в мкс или None).
+        """
+        kind, payload = await read_frame(self.reader)
+        if kind == protocol.GAME:
+            self.game = protocol.decode_game(payload)
+            self.state = BoardState()  # Новая партия или снимок после отставания
+            return kind, None
+        if kind == protocol.STATE:
+            _, sent_us = self.state.apply(payload)
+            return kind, sent_us
+        return kind, None
+
+    async def close(self):
+        self.writer.close()
+        await self.writer.wait_closed()
+
+
+async def _watch(host, port):
+    client = GameClient()
+    await client.connect(host, port)
+    while True:
+        kind, _ = await client.receive()
+        state = client.state
+        if kind == protocol.GAME:
+            print(f"партия {client.game['game_id']}: {client.game['rows']}x{client.game['cols']}")
+        else:
+            print(f"ходов {state.moves}, время {state.remaining_time}, открыто {bin(state.revealed).count('1')}, "
+                  f"угадано {bin(state.matched).count('1')}" + (f", {state.result} {state.score}" if state.result else ""))
+
+
+async def _serve(settings, difficulty, host, port, seed):
+    server = GameServer(settings, difficulty, seed, host, port)
+    port = await server.start()
+    print(f"сервер {server.host}:{port}, сложность {difficulty}")
+    await asyncio.Event().wait()  # До Ctrl+C
+
+
+def main(argv=None):
+    settings = MemorySettings()
+    parser = argparse.ArgumentParser(description="Сетевая игра: сервер и зритель")
+    commands = parser.add_subparsers(dest="command", required=True)
+    serve = commands.add_parser("serve", help="Запустить сервер партии")
+    serve.add_argument("--difficulty", default="easy")
+    serve.add_argument("--seed", type=int, default=None)
+    watch = commands.add_parser("watch", help="Смотреть партию в консоли")
+    for command in (serve, watch):
+        command.add_argument("--host", default=settings.server_host)
+        command.add_argument("--port", type=int, default=settings.server_port)
+    args = parser.parse_args(argv)
+
+    try:
+        if args.command == "serve":
+            asyncio.run(_serve(settings, args.difficulty, args.host, args.port, args.seed))
+        else:
+            asyncio.run(_watch(args.host, args.port))
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
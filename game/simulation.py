@@ -0,0 +1,406 @@
+"""
+Безголовая симуляция игры на память.
+
+Повторяет правила GameScreen (сравнение пар, лимиты ходов и времени, подсчёт
+очков), но работает без дисплея и звука, на подставном времени и синтетических
+кликах. Используется для нагрузочной проверки подсчёта очков и подбора
+параметров сложности.
+
+Раскладка поля берётся из rules.deal, как у GameScreen: одинаковый сид даёт
+одинаковое поле. Время тоже считается как у GameScreen — шагами FIXED_STEP:
+переворот длится FLIP_STEPS шагов, пауза сравнения и показ пары отсчитываются
+по той же сумме шагов, что копит GameScreen.time. Поэтому те же клики на тех
+же шагах дают тот же итог, что и game.replay.replay_fast. Шаги, на которых
+ничего не происходит, GameEngine не проделывает, а перескакивает.
+
+Пример запуска:
+    python -m game.simulation --difficulty hard --games 10000 --seed 1
+"""
+import argparse
+import bisect
+import random
+import time
+from collections import OrderedDict
+from game.memory_settings import MemorySettings
+from game.board_model import BoardModel
+from game.memory_ai import MemoryAI
+from game.rules import calculate_score, deal, FIXED_STEP, FLIP_STEPS, COMPARE_DELAY, MATCH_DISPLAY_TIME, WIN, LOSE
+
+
+_step_times = [0.0]  # Игровое время после n шагов: та же сумма FIXED_STEP, что копит GameScreen.time
+
+
+def _extend_step_times(moment):
+    while _step_times[-1] <= moment:
+        _step_times.append(_step_times[-1] + FIXED_STEP)
+
+
+def step_time(steps):
+    """Игровое время GameScreen после steps шагов"""
+    while len(_step_times) <= steps:
+        _step_times.append(_step_times[-1] + FIXED_STEP)
+    return _step_times[steps]
+
+
+def steps_after(moment):
+    """Номер первого шага, после которого игровое время больше moment"""
+    _extend_step_times(moment)
+    return bisect.bisect_right(_step_times, moment)
+
+
+def steps_until(moment):
+    """Номер первого шага, после которого игровое время не меньше moment"""
+    _extend_step_times(moment)
+    return bisect.bisect_left(_step_times, moment)
+
+
+def steps_since(steps, delay):
+    """
+    Номер первого шага, на котором пройдёт больше delay от шага steps.
+
+    Разность считается так же, как в GameScreen (now - last_flip_time > delay):
+    с плавающей точкой она не всегда совпадает со сравнением now > last_flip_time + delay.
+    """
+    start = step_time(steps)
+    found = steps_after(start + delay)
+    while found > steps and step_time(found - 1) - start > delay:
+        found -= 1
+    while step_time(found) - start <= delay:
+        found += 1
+    return found
+
+
+class GameEngine:
+    """
+    Игровые правила без отрисовки.
+
+    Время не берётся из системы: каждый вызов click/update получает текущий
+    момент now (в секундах) от внешних часов. update проделывает шаги
+    GameScreen.advance, закончившиеся к now, а click приходится на текущий шаг.
+    """
+
+    def __init__(self, settings, seed=None, start_time=0.0, recorder=None):
+        """
+        :param settings: Объект MemorySettings с размером поля и лимитами.
+        :param seed: Сид партии (раскладка та же, что у GameScreen с этим сидом).
+        :param start_time: Момент начала игры по подставным часам.
+        :param recorder: InputRecorder, в который пишутся принятые клики (для сверки с GameScreen).
+        """
+        self.settings = settings
+        self.seed = seed
+        self.recorder = recorder
+        self.total_cards = settings.total_cards
+        _, _, faces = deal(random.Random(seed), self.total_cards // 2)
+        self.model = BoardModel(faces, settings.max_moves)  # Общая с GameScreen модель поля
+        self.faces = self.model.faces  # Номер лицевой стороны каждой карты
+
+        # Время считается в шагах GameScreen.advance: на каком шаге что случится
+        self.busy_until = [0] * self.total_cards  # Конец анимации переворота карты
+        self.compare_step = None  # Сравнение открытой пары
+        self.showing_match_until = None  # Конец показа совпадения; до него клики игнорируются
+
+        self.start_time = start_time
+        self.steps = 0  # Сколько шагов GameScreen.advance пройдено
+        self.time = 0.0  # Игровое время после этих шагов
+        self.remaining_time = settings.time_limit
+        # Первый шаг с нулевым остатком времени: остаток считается до прибавления шага
+        self.time_up_step = steps_until(settings.time_limit) + 1
+        self.game_over_type = None
+        self.score = 0
+
+    @property
+    def first(self):
+        return self.model.first
+
+    @property
+    def second(self):
+        return self.model.second
+
+    @property
+    def moves(self):
+        return self.model.moves
+
+    @property
+    def remaining_moves(self):
+        return self.model.remaining_moves
+
+    def can_click(self, index, now=None):
+        """
+        Можно ли сейчас перевернуть карту index.
+
+        :param now: Не используется: состояние уже продвинуто к now вызовом update.
+        """
+        return self.model.can_reveal(index) and self.steps >= self.busy_until[index]
+
+    def accepts_input(self):
+        """Принимает ли игра клики по картам"""
+        return (self.game_over_type is None and self.showing_match_until is None and
+                not self.model.pair_ready() and self.model.remaining_moves > 0)
+
+    def click(self, index, now):
+        """
+        Клик по карте, как в GameScreen.click_card.
+
+        :return: Номер лицевой стороны, если карта перевернулась, иначе None.
+        """
+        if not self.accepts_input() or not self.can_click(index, now):
+            return None
+
+        if self.recorder is not None:
+            self.recorder.record(self.steps, index)
+        self.model.reveal(index)
+        self.busy_until[index] = self.steps + FLIP_STEPS
+        if self.model.pair_ready():
+            # Обе карты должны перевернуться, и пауза отсчитывается от второго клика
+            self.compare_step = max(self.busy_until[self.first], self.busy_until[index],
+                                    steps_since(self.steps, COMPARE_DELAY))
+        return self.faces[index]
+
+    def update(self, now):
+        """Продвигает игру к моменту now; шаги без событий перескакиваются"""
+        target = steps_after(now - self.start_time) - 1
+        while self.game_over_type is None and self.steps < target:
+            self._step(min(target, self._next_event_step()))
+
+    def _step(self, steps):
+        """Шаг номер steps, как GameScreen.advance (предыдущие шаги ничего не меняли)"""
+        self.remaining_time = max(self.settings.time_limit - int(step_time(steps - 1)), 0)
+        self.steps = steps
+        self.time = step_time(steps)
+
+        # Сравнение пары после окончания переворотов и паузы
+        if self.compare_step is not None and steps >= self.compare_step:
+            self.compare_step = None
+            first, second = self.model.first, self.model.second
+            if self.model.resolve_pair():
+                self.showing_match_until = steps_after(self.time + MATCH_DISPLAY_TIME)
+            else:
+                # Карты переворачиваются обратно и пока не кликабельны
+                self.busy_until[first] = self.busy_until[second] = steps + FLIP_STEPS
+
+        if self.showing_match_until is not None and steps >= self.showing_match_until:
+            self.showing_match_until = None
+
+        # Проверка на победу и на проигрыш
+        if self.model.is_won():
+            self.game_over_type = WIN
+            self.score = self._score()
+        elif self.remaining_time <= 0 or self.remaining_moves <= 0:
+            self.game_over_type = LOSE
+            self.score = self._score(failed=True)
+
+    def _score(self, failed=False):
+        return calculate_score(self.moves, self.remaining_moves, self.remaining_time,
+                               self.settings.time_limit, failed)
+
+    def _next_event_step(self):
+        """Ближайший шаг, на котором игра может измениться без участия игрока"""
+        if self.remaining_moves <= 0:
+            return self.steps + 1
+        candidates = [self.time_up_step]
+        if self.compare_step is not None:
+            candidates.append(self.compare_step)
+        if self.showing_match_until is not None:
+            candidates.append(self.showing_match_until)
+        return max(self.steps + 1, min(candidates))
+
+    def next_event_time(self, now):
+        """Ближайший момент, когда состояние игры изменится без участия игрока"""
+        steps = self._next_event_step()
+        steps = min([steps] + [step for step in self.busy_until if step > self.steps])
+        return max(now, self.start_time + step_time(steps))
+
+
+class RandomPlayer:
+    """Игрок без памяти: открывает случайные доступные карты"""
+
+    def __init__(self, rng):
+        self.rng = rng
+
+    def choose(self, engine, now):
+        options = [i for i in range(engine.total_cards) if engine.can_click(i, now)]
+        return self.rng.choice(options) if options else None
+
+    def seen(self, index, face):
+        pass
+
+
+class PerfectPlayer:
+    """Игрок с идеальной памятью: помнит все увиденные карты"""
+
+    def __init__(self, rng):
+        self.rng = rng
+        self.known = {}  # Номер лицевой стороны -> индексы увиденных карт
+        self.pairs = []  # Лицевые стороны, обе карты которых уже видели
+        self.unseen = None  # Индексы ещё не виденных карт
+
+    def choose(self, engine, now):
+        if self.unseen is None:
+            self.unseen = list(range(engine.total_cards))
+
+        if engine.first is not None:
+            # Знаем пару к первой карте — открываем её (или ждём, пока она перевернётся)
+            for index in self.known.get(engine.faces[engine.first], ()):
+                if index != engine.first:
+                    return index if engine.can_click(index, now) else None
+        else:
+            # Знаем обе карты пары — открываем первую из них
+            while self.pairs:
+                first, second = self.known[self.pairs[-1]]
+                if engine.model.is_matched(first):
+                    self.pairs.pop()
+                    continue
+                if engine.can_click(first, now) and engine.can_click(second, now):
+                    return first
+                break
+
+        if self.unseen:
+            # Невиданные карты никогда не бывают открыты или в анимации
+            return self.rng.choice(self.unseen)
+        options = [i for i in range(engine.total_cards) if engine.can_click(i, now)]
+        return self.rng.choice(options) if options else None
+
+    def seen(self, index, face):
+        if self.unseen is not None and index in self.unseen:
+            self.unseen.remove(index)
+            indexes = self.known.setdefault(face, [])
+            indexes.append(index)
+            if len(indexes) == 2:
+                self.pairs.append(face)
+
+
+class LimitedMemoryPlayer:
+    """
+    Игрок с ограниченной памятью: помнит только capacity последних увиденных карт.
+
+    Так моделируется живой игрок: при capacity около размера поля он близок
+    к идеальному, при малой памяти — к случайному.
+    """
+
+    def __init__(self, rng, capacity=8):
+        self.rng = rng
+        self.capacity = capacity
+        self.memory = OrderedDict()  # Индекс карты -> лицевая сторона, от старых к новым
+
+    def choose(self, engine, now):
+        matched = engine.model.is_matched
+        if engine.first is not None:
+            # Помним пару к первой карте — открываем её
+            face = engine.faces[engine.first]
+            for index, known in self.memory.items():
+                if known == face and index != engine.first and not matched(index):
+                    return index if engine.can_click(index, now) else None
+        else:
+            # Помним обе карты одной пары — открываем первую
+            first_seen = {}
+            for index, face in self.memory.items():
+                if matched(index):
+                    continue
+                if face in first_seen:
+                    first = first_seen[face]
+                    if engine.can_click(first, now) and engine.can_click(index, now):
+                        return first
+                else:
+                    first_seen[face] = index
+
+        # Иначе — карта, которой нет в памяти (или любая доступная)
+        options = [i for i in range(engine.total_cards) if engine.can_click(i, now)]
+        fresh = [i for i in options if i not in self.memory]
+        options = fresh or options
+        return self.rng.choice(options) if options else None
+
+    def seen(self, index, face):
+        self.memory[index] = face
+        self.memory.move_to_end(index)
+        if len(self.memory) > self.capacity:
+            self.memory.popitem(last=False)  # Забываем самую давнюю карту
+
+
+PLAYERS = {"random": RandomPlayer, "perfect": PerfectPlayer, "limited": LimitedMemoryPlayer, "ai": MemoryAI}
+
+
+def make_player(spec, rng):
+    """
+    Создаёт игрока по описанию: "perfect", "random", "limited:<память>" или "ai:<точность %>".
+
+    :param spec: Имя из PLAYERS, для "limited" и "ai" — с параметром через двоеточие.
+    :param rng: Генератор случайных чисел игрока.
+    """
+    name, _, argument = spec.partition(":")
+    if name not in PLAYERS:
+        raise ValueError(f"Неизвестный игрок: {spec}")
+    return PLAYERS[name](rng, int(argument)) if argument else PLAYERS[name](rng)
+
+
+def simulate_game(settings, seed, player="perfect", click_interval=0.3, recorder=None):
+    """
+    Разыгрывает одну партию на подставных часах.
+
+    :param settings: Объект MemorySettings.
+    :param seed: Зерно для раскладки и решений игрока.
+    :param player: Описание игрока для make_player или готовый объект игрока.
+    :param click_interval: Время между кликами игрока (сек).
+    :param recorder: InputRecorder для кликов партии (см. GameEngine).
+    :return: Отыгранный GameEngine.
+    """
+    rng = random.Random(seed)
+    engine = GameEngine(settings, seed=rng.random(), recorder=recorder)
+    if isinstance(player, str):
+        player = make_player(player, rng)
+
+    now = 0.0
+    while engine.game_over_type is None:
+        index = player.choose(engine, now) if engine.accepts_input() else None
+        if index is not None:
+            face = engine.click(index, now)
+            player.seen(index, face)
+            now += click_interval
+        else:
+            now = max(now + 1e-3, engine.next_event_time(now))
+        engine.update(now)
+    return engine
+
+
+def run_batch(difficulty, games, seed=0, player="perfect", click_interval=0.3):
+    """
+    Разыгрывает серию партий и собирает статистику.
+
+    :return: Словарь с количеством побед, средним счётом и скоростью симуляции.
+    """
+    settings = MemorySettings(difficulty)
+    started = time.perf_counter()
+    wins = 0
+    scores = []
+    for i in range(games):
+        engine = simulate_game(settings, seed * 1000003 + i, player, click_interval)
+        wins += engine.game_over_type == WIN
+        scores.append(engine.score)
+    elapsed = time.perf_counter() - started
+    return {
+        "difficulty": difficulty,
+        "player": player if isinstance(player, str) else type(player).__name__,
+        "games": games,
+        "wins": wins,
+        "win_rate": wins / games if games else 0.0,
+        "mean_score": sum(scores) / games if games else 0.0,
+        "max_score": max(scores, default=0),
+        "games_per_second": games / elapsed if elapsed else 0.0,
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Безголовая симуляция игры на память")
+    parser.add_argument("--difficulty", default="easy", choices=["easy", "medium", "hard", "insane"])
+    parser.add_argument("--games", type=int, default=1000)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--player", default="perfect", help="perfect, random, limited:<память> или ai:<точность %%>")
+    parser.add_argument("--click-interval", type=float, default=0.3)
+    args = parser.parse_args(argv)
+
+    stats = run_batch(args.difficulty, args.games, args.seed, args.player, args.click_interval)
+    for key, value in stats.items():
+        print(f"{key}: {value}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,264 @@
+"""
+Подбор лимитов сложности и коэффициентов подсчёта очков.
+
+Перебирает сетку time_limit x max_moves для каждой сложности и модели игрока
+и разыгрывает партии безголовой симуляцией на всех ядрах (ProcessPoolExecutor).
+Коэффициенты очков не влияют на ход партии, поэтому их сетка считается по тем
+же партиям без повторной симуляции.
+
+Результаты пишутся в JSONL по мере готовности ячеек сетки: одна строка на
+(сложность, лимиты, игрок, коэффициенты) с долей побед и распределением очков.
+
+Пример запуска (из корня репозитория):
+    python -m game.tuner --difficulty hard --time-limits 40:80:10 --max-moves 25:45:5 \\
+        --players perfect,limited:8,random,ai:80 --games 2000 --output sweep.jsonl
+
+Модели игроков (--players): perfect, random, limited:<память> и ai:<точность %>.
+"""
+import argparse
+import itertools
+import json
+import math
+import os
+import sys
+import time
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from game.memory_settings import MemorySettings
+from game.rules import SCORE_WEIGHTS, WIN, calculate_score
+from game.simulation import simulate_game
+
+
+def parse_values(text, cast=int):
+    """
+    Значения параметра из командной строки: "30,40,50" или диапазон "30:60:10" (включительно).
+    """
+    if ":" in text:
+        start, stop, step = (cast(part) for part in text.split(":"))
+        count = int(math.floor((stop - start) / step + 1e-9)) + 1
+        return [start + i * step for i in range(count)]
+    return [cast(part) for part in text.split(",")]
+
+
+class ScoreStats:
+    """Распределение очков без хранения самих очков: сумма, квадраты, гистограмма"""
+
+    def __init__(self, bin_width):
+        self.bin_width = bin_width
+        self.count = 0
+        self.total = 0
+        self.total_squares = 0
+        self.min = None
+        self.max = None
+        self.histogram = {}  # Нижняя граница корзины -> количество партий
+
+    def add(self, score):
+        self.count += 1
+        self.total += score
+        self.total_squares += score * score
+        self.min = score if self.min is None else min(self.min, score)
+        self.max = score if self.max is None else max(self.max, score)
+        bucket = score // self.bin_width * self.bin_width
+        self.histogram[bucket] = self.histogram.get(bucket, 0) + 1
+
+    def merge(self, other):
+        self.count += other.count
+        self.total += other.total
+        self.total_squares += other.total_squares
+        for bound in (other.min, other.max):
+            if bound is not None:
+                self.min = bound if self.min is None else min(self.min, bound)
+                self.max = bound if self.max is None else max(self.max, bound)
+        for bucket, count in other.histogram.items():
+            self.histogram[bucket] = self.histogram.get(bucket, 0) + count
+
+    def percentile(self, fraction):
+        """Перцентиль по гистограмме (середина корзины — точность bin_width)"""
+        target = fraction * self.count
+        seen = 0
+        for bucket in sorted(self.histogram):
+            seen += self.histogram[bucket]
+            if seen >= target:
+                return bucket + self.bin_width / 2
+        return 0.0
+
+    def summary(self):
+        if not self.count:
+            return {"mean": 0.0, "std": 0.0}
+        mean = self.total / self.count
+        variance = max(0.0, self.total_squares / self.count - mean * mean)
+        return {
+            "mean": mean,
+            "std": math.sqrt(variance),
+            "min": self.min,
+            "max": self.max,
+            "p10": self.percentile(0.1),
+            "p50": self.percentile(0.5),
+            "p90": self.percentile(0.9),
+            "histogram": {str(bucket): self.histogram[bucket] for bucket in sorted(self.histogram)},
+        }
+
+
+def run_chunk(difficulty, time_limit, max_moves, player, first_seed, games, weight_sets, bin_width):
+    """
+    Разыгрывает games партий одной ячейки сетки (выполняется в процессе-работнике).
+
+    :return: Словарь с победами, суммами ходов и времени и ScoreStats на каждый набор коэффициентов.
+    """
+    settings = MemorySettings(difficulty)
+    settings.time_limit = time_limit
+    settings.max_moves = max_moves
+
+    wins = moves = time_used = 0
+    stats = [ScoreStats(bin_width) for _ in weight_sets]
+    for seed in range(first_seed, first_seed + games):
+        engine = simulate_game(settings, seed, player)
+        won = engine.game_over_type == WIN
+        wins += won
+        moves += engine.moves
+        time_used += time_limit - engine.remaining_time
+        for weights, score_stats in zip(weight_sets, stats):
+            score_stats.add(calculate_score(engine.moves, engine.remaining_moves, engine.remaining_time,
+                                            time_limit, not won, weights))
+    return {"games": games, "wins": wins, "moves": moves, "time_used": time_used, "scores": stats}
+
+
+class Cell:
+    """Ячейка сетки: сумма результатов её порций, пока не готовы все"""
+
+    def __init__(self, key, chunks, weight_sets, bin_width):
+        self.key = key  # (сложность, time_limit, max_moves, игрок)
+        self.remaining_chunks = chunks
+        self.weight_sets = weight_sets
+        self.games = self.wins = self.moves = self.time_used = 0
+        self.scores = [ScoreStats(bin_width) for _ in weight_sets]
+
+    def add(self, result):
+        self.remaining_chunks -= 1
+        self.games += result["games"]
+        self.wins += result["wins"]
+        self.moves += result["moves"]
+        self.time_used += result["time_used"]
+        for stats, chunk_stats in zip(self.scores, result["scores"]):
+            stats.merge(chunk_stats)
+
+    def rows(self):
+        """Строки результата: по одной на набор коэффициентов"""
+        difficulty, time_limit, max_moves, player = self.key
+        for weights, stats in zip(self.weight_sets, self.scores):
+            yield {
+                "difficulty": difficulty,
+                "time_limit": time_limit,
+                "max_moves": max_moves,
+                "player": player,
+                "weights": weights,
+                "games": self.games,
+                "win_rate": self.wins / self.games if self.games else 0.0,
+                "mean_moves": self.moves / self.games if self.games else 0.0,
+                "mean_time_used": self.time_used / self.games if self.games else 0.0,
+                "score": stats.summary(),
+            }
+
+
+def sweep(difficulties, time_limits, max_moves, players, weight_sets, games, output,
+          workers=None, chunk=250, seed=0, bin_width=500, progress=None):
+    """
+    Перебирает сетку параметров и пишет строки результата в output по мере готовности ячеек.
+
+    Все ячейки разыгрывают одни и те же сиды партий, так что различия между
+    ячейками не тонут в случайном шуме.
+
+    :param output: Открытый на запись текстовый файл (JSONL).
+    :param workers: Количество процессов (по умолчанию — все ядра; 0 — в этом процессе).
+    :param chunk: Партий в одной задаче работника.
+    :param progress: Функция, вызываемая с (готово ячеек, всего ячеек) после каждой ячейки.
+    :return: Количество разыгранных партий.
+    """
+    keys = list(itertools.product(difficulties, time_limits, max_moves, players))
+    chunks = math.ceil(games / chunk)
+    cells = {key: Cell(key, chunks, weight_sets, bin_width) for key in keys}
+    tasks = ((key, seed * 1000003 + start, min(chunk, games - start))
+             for key in keys for start in range(0, games, chunk))
+    done = 0
+
+    def finish(key, result):
+        nonlocal done
+        cell = cells[key]
+        cell.add(result)
+        if cell.remaining_chunks:
+            return
+        for row in cell.rows():
+            output.write(json.dumps(row, ensure_ascii=False) + "\n")
+        output.flush()  # Ячейка готова — сразу на диск
+        del cells[key]
+        done += 1
+        if progress:
+            progress(done, len(keys))
+
+    if workers == 0:
+        for key, first_seed, count in tasks:
+            finish(key, run_chunk(*key, first_seed, count, weight_sets, bin_width))
+        return games * len(keys)
+
+    workers = workers or os.cpu_count() or 1
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        pending = {}
+        for key, first_seed, count in tasks:
+            # В очереди — не больше нескольких задач на ядро: память не растёт с размером сетки
+            if len(pending) >= workers * 4:
+                finished, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in finished:
+                    finish(pending.pop(future), future.result())
+            future = executor.submit(run_chunk, *key, first_seed, count, weight_sets, bin_width)
+            pending[future] = key
+        while pending:
+            finished, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in finished:
+                finish(pending.pop(future), future.result())
+    return games * len(keys)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Перебор лимитов сложности и коэффициентов очков")
+    parser.add_argument("--difficulty", default="easy,medium,hard,insane", help="Сложности через запятую")
+    parser.add_argument("--time-limits", help="Лимиты времени: 30,40 или 30:60:10 (по умолчанию — из настроек)")
+    parser.add_argument("--max-moves", help="Лимиты ходов: 20,25 или 20:40:5 (по умолчанию — из настроек)")
+    parser.add_argument("--players", default="perfect,limited:8,random",
+                        help="Модели игроков: perfect, random, limited:<память>, ai:<точность %%>")
+    for name, value in SCORE_WEIGHTS.items():
+        parser.add_argument("--" + name.replace("_", "-"), default=str(value),
+                            help=f"Значения коэффициента {name} (по умолчанию {value})")
+    parser.add_argument("--games", type=int, default=1000, help="Партий на ячейку сетки")
+    parser.add_argument("--chunk", type=int, default=250, help="Партий в одной задаче работника")
+    parser.add_argument("--workers", type=int, default=None, help="Процессов (по умолчанию — все ядра)")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--bin-width", type=int, default=500, help="Ширина корзины гистограммы очков")
+    parser.add_argument("--output", default="sweep.jsonl")
+    args = parser.parse_args(argv)
+
+    difficulties = args.difficulty.split(",")
+    players = args.players.split(",")
+    weight_values = [parse_values(getattr(args, name), type(value)) for name, value in SCORE_WEIGHTS.items()]
+    weight_sets = [dict(zip(SCORE_WEIGHTS, values)) for values in itertools.product(*weight_values)]
+
+    total_games = 0
+    started = time.perf_counter()
+    with open(args.output, "w", encoding="utf-8") as output:
+        for difficulty in difficulties:
+            # Сетки лимитов по умолчанию — значения из настроек этой сложности
+            defaults = MemorySettings(difficulty)
+            time_limits = parse_values(args.time_limits) if args.time_limits else [defaults.time_limit]
+            max_moves = parse_values(args.max_moves) if args.max_moves else [defaults.max_moves]
+
+            def progress(done, total, difficulty=difficulty):
+                print(f"\r{difficulty}: {done}/{total} ячеек", end="", flush=True)
+            total_games += sweep([difficulty], time_limits, max_moves, players, weight_sets, args.games,
+                                 output, args.workers, args.chunk, args.seed, args.bin_width, progress)
+            print()
+
+    elapsed = time.perf_counter() - started
+    print(f"партий: {total_games}, {elapsed:.1f} с, {total_games / elapsed:.0f} партий/с -> {args.output}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
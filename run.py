@@ -1,12 +1,23 @@
 import pygame
 from game import MainMenu, MemorySettings
+from game.render_backend import backend
+from game.scene_manager import SceneManager
+
+def init_pygame():
+    """
+    Инициализирует только нужные игре подсистемы pygame.
+
+    Звук (pygame.mixer) включает меню после первого кадра, джойстики и прочее
+    не нужны вовсе.
+    """
+    pygame.display.init()
+    pygame.font.init()
 
 def run_game():
-    pygame.init() # инициализация pygame
+    init_pygame() # инициализация pygame
     settings = MemorySettings() # инициализация настроек
-    screen = pygame.display.set_mode((settings.screen_width, settings.screen_height)) # настройка окна
-    pygame.display.set_caption("Memory Game") # задаем имя окну
-    MainMenu(screen).run() # запускаем отображение
+    screen = backend.create_screen(settings) # окно с заголовком (vsync, формат вывода — из настроек)
+    SceneManager(screen, settings).run(MainMenu(screen, settings)) # один цикл для меню, игры и статистики
     pygame.quit() # выход по окончанию сессии
 
 if __name__ == '__main__':
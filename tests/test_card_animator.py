@@ -0,0 +1,60 @@
+"""
+Тесты пакетной анимации карт: шаг NumPy совпадает с циклом Card.update_animation.
+
+Запуск (из корня репозитория):
+    python -m unittest discover tests
+"""
+import random
+import unittest
+
+import pygame
+
+from game.memory_ai import AIController, MemoryAI
+from game.memory_objects.card_animator import CardAnimator, np
+from game.memory_objects.game_screen import GameScreen
+from game.memory_settings import MemorySettings
+from game.rules import FIXED_STEP
+
+CARD_STATE = ("animation_angle", "animating", "revealed", "matched", "scale", "pulse_direction",
+              "fade_alpha", "fading")
+
+
+def make_game(settings, seed, vectorized):
+    game = GameScreen(pygame.Surface((settings.screen_width, settings.screen_height)), settings, seed=seed)
+    game.animator = CardAnimator(game.cards, vectorized=vectorized)
+    for card in game.cards:
+        card.dirty = False  # Как после первого кадра
+    game.animator.take_changed()
+    return game
+
+
+@unittest.skipIf(np is None, "нужен NumPy")
+class VectorizedMatchesLoopTest(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        pygame.font.init()  # Шрифты нужны GameScreen, дисплей — нет
+
+    def test_seeded_game(self):
+        settings = MemorySettings("insane")
+        games = [make_game(settings, 5, vectorized) for vectorized in (True, False)]
+        self.assertTrue(games[0].animator.vectorized)
+        players = [AIController(game, MemoryAI(random.Random(1)), move_delay=0.2) for game in games]
+        limit = int((settings.time_limit + 10) / FIXED_STEP)
+        while not games[0].is_game_over() and games[0].steps < limit:
+            for game, player in zip(games, players):
+                player.step()
+                game.advance(FIXED_STEP)
+            vector, loop = games
+            for slot, (a, b) in enumerate(zip(vector.cards, loop.cards)):
+                for name in CARD_STATE:
+                    self.assertEqual(getattr(a, name), getattr(b, name), (vector.steps, slot, name))
+            self.assertEqual(vector.animator.is_animating(), loop.animator.is_animating(), vector.steps)
+            self.assertEqual(vector.animator.take_changed(), loop.animator.take_changed(), vector.steps)
+            for card in vector.cards + loop.cards:
+                card.dirty = False  # Как после отрисовки
+        self.assertTrue(games[0].is_game_over())
+        self.assertEqual((games[0].score, games[0].steps), (games[1].score, games[1].steps))
+
+
+if __name__ == "__main__":
+    unittest.main()
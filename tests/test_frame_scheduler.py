@@ -0,0 +1,40 @@
+"""
+Тесты планировщика кадров: ожидание события в простое не меняет порядок событий.
+
+Запуск (из корня репозитория):
+    python -m unittest discover tests
+"""
+import os
+import unittest
+
+import pygame
+
+from game.frame_scheduler import FrameScheduler
+from game.memory_settings import MemorySettings
+
+
+class WaitForEventTest(unittest.TestCase):
+    def setUp(self):
+        os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+        pygame.display.init()
+        self.addCleanup(pygame.display.quit)
+        pygame.event.clear()
+        self.scheduler = FrameScheduler(MemorySettings())
+
+    def test_keeps_event_order(self):
+        events = [pygame.event.Event(pygame.MOUSEBUTTONDOWN, pos=(10, 20), button=1),
+                  pygame.event.Event(pygame.MOUSEBUTTONUP, pos=(10, 20), button=1),
+                  pygame.event.Event(pygame.KEYDOWN, key=pygame.K_p, mod=0, unicode="p", scancode=0),
+                  pygame.event.Event(pygame.QUIT)]
+        for event in events:
+            pygame.event.post(event)
+        self.scheduler._wait_for_event(100)
+        self.assertEqual([event.type for event in pygame.event.get()], [event.type for event in events])
+
+    def test_timeout_without_events(self):
+        self.assertGreaterEqual(self.scheduler._wait_for_event(20), 0)
+        self.assertEqual(pygame.event.get(), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,123 @@
+"""
+Тесты двоичного протокола сетевой игры (без pygame и сокетов).
+
+Запуск (из корня репозитория):
+    python -m unittest discover tests
+"""
+import struct
+import unittest
+from types import SimpleNamespace
+
+from game import protocol
+from game.protocol import BoardState
+from game.rules import WIN
+
+
+def make_state(revealed=0, matched=0, moves=0, remaining_moves=0, remaining_time=0, result=None, score=0):
+    state = BoardState()
+    state.revealed = revealed
+    state.matched = matched
+    state.moves = moves
+    state.remaining_moves = remaining_moves
+    state.remaining_time = remaining_time
+    state.result = result
+    state.score = score
+    return state
+
+
+FACES = [index // 2 for index in range(16)]  # Поле 4x4: пары (0, 1), (2, 3), ...
+
+
+class FrameTest(unittest.TestCase):
+    def test_header(self):
+        data = protocol.frame(protocol.CLICK, b"\x05\x00")
+        length, kind = protocol.FRAME_HEADER.unpack_from(data)
+        self.assertEqual((length, kind), (2, protocol.CLICK))
+        self.assertEqual(data[protocol.FRAME_HEADER.size:], b"\x05\x00")
+
+    def test_empty_payload(self):
+        self.assertEqual(protocol.frame(protocol.HELLO), protocol.FRAME_HEADER.pack(0, protocol.HELLO))
+
+
+class ClientFramesTest(unittest.TestCase):
+    def test_hello_round_trip(self):
+        for role in (protocol.PLAYER, protocol.SPECTATOR):
+            self.assertEqual(protocol.decode_hello(protocol.encode_hello(role)), role)
+
+    def test_malformed_hello(self):
+        for payload in (b"", b"\x00\x00", b"\x02", b"\xff"):
+            self.assertIsNone(protocol.decode_hello(payload), payload)
+
+    def test_click_round_trip(self):
+        for index in (0, 1, 399, 0xFFFF):
+            self.assertEqual(protocol.decode_click(protocol.encode_click(index)), index)
+
+    def test_malformed_click(self):
+        for payload in (b"", b"\x01", b"\x01\x00\x00", b"\x01\x00\x00\x00"):
+            self.assertIsNone(protocol.decode_click(payload), payload)
+
+
+class BoardStateTest(unittest.TestCase):
+    def round_trip(self, client, old, new, tick=1):
+        payload = new.encode_delta(old, FACES, tick)
+        self.assertIsNotNone(payload)
+        self.assertEqual(client.apply(payload)[0], tick)
+        return payload
+
+    def assertSameBoard(self, client, server):
+        for name in ("revealed", "matched", "moves", "remaining_moves", "remaining_time", "result", "score"):
+            self.assertEqual(getattr(client, name), getattr(server, name), name)
+
+    def test_no_changes(self):
+        state = make_state(revealed=0b11, moves=1)
+        self.assertIsNone(state.encode_delta(make_state(revealed=0b11, moves=1), FACES, 5))
+        self.assertIsNone(BoardState().encode_delta(BoardState(), FACES, 0))
+
+    def test_snapshot(self):
+        server = make_state(revealed=1 << 4, matched=0b11, moves=3, remaining_moves=17, remaining_time=40)
+        client = BoardState()
+        self.round_trip(client, BoardState(), server, tick=120)
+        self.assertSameBoard(client, server)
+        self.assertEqual(client.faces, {4: FACES[4]})
+
+    def test_game_sequence(self):
+        client = BoardState()
+        steps = [
+            make_state(revealed=1 << 2, moves=1, remaining_time=60),
+            make_state(revealed=1 << 2 | 1 << 5, moves=2, remaining_time=59),
+            make_state(moves=2, remaining_time=58),  # Не пара — обе карты закрылись
+            make_state(revealed=1 << 0 | 1 << 1, moves=4, remaining_time=57),
+            make_state(matched=0b11, moves=4, remaining_time=56),
+            make_state(matched=0xFFFF, moves=20, remaining_time=30, result=WIN, score=1234),
+        ]
+        old = BoardState()
+        for tick, state in enumerate(steps, start=1):
+            self.round_trip(client, old, state, tick)
+            self.assertSameBoard(client, state)
+            old = state
+        self.assertEqual(client.faces, {index: FACES[index] for index in (0, 1, 2, 5)})
+
+    def test_sent_time(self):
+        payload = make_state(moves=1).encode_delta(BoardState(), FACES, 7)
+        self.assertLess(protocol.latency_us(BoardState().apply(payload)[1]), 10 ** 6)  # Часы общие: меньше секунды
+
+    def test_truncated_state(self):
+        payload = make_state(revealed=0b1010, matched=0b11, moves=2, result=WIN).encode_delta(BoardState(), FACES, 1)
+        for length in (0, protocol._STATE_HEADER.size - 1, protocol._STATE_HEADER.size + 1, len(payload) - 1):
+            with self.assertRaises(struct.error, msg=length):
+                BoardState().apply(payload[:length])
+
+
+class GameFrameTest(unittest.TestCase):
+    def test_round_trip(self):
+        settings = SimpleNamespace(rows=20, cols=20, time_limit=600, max_moves=1000)
+        self.assertEqual(protocol.decode_game(protocol.encode_game(7, settings)),
+                         {"game_id": 7, "rows": 20, "cols": 20, "time_limit": 600, "max_moves": 1000})
+
+    def test_malformed(self):
+        with self.assertRaises(struct.error):
+            protocol.decode_game(b"\x01\x00")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,82 @@
+"""
+Тесты файлов повторов: кодирование, испорченные файлы и пакетная проверка.
+
+Запуск (из корня репозитория):
+    python -m unittest discover tests
+"""
+import os
+import shutil
+import tempfile
+import unittest
+import zlib
+
+import pygame
+
+from game.replay import MAGIC, Replay, ReplayError, replay_fast, verify
+
+HEADER = {"seed": 42, "difficulty": "easy", "rows": 2, "cols": 4, "time_limit": 30, "max_moves": 10}
+
+
+def encode_header(data):
+    return MAGIC + bytes([len(data)]) + data
+
+
+class ReplayCodecTest(unittest.TestCase):
+    def test_round_trip(self):
+        events = [(0, 3), (1, 7), (130, 0), (20000, 5)]  # Разности шагов и в один, и в несколько байт
+        replay = Replay(dict(HEADER, result="Победа!", score=1234), events)
+        decoded = Replay.decode(replay.encode())
+        self.assertEqual(decoded.events, events)
+        self.assertEqual(decoded.header, replay.header)
+
+    def test_empty_events(self):
+        self.assertEqual(Replay.decode(Replay(HEADER, []).encode()).events, [])
+
+    def test_corrupt_files(self):
+        good = Replay(HEADER, [(5, 1), (9, 2)]).encode()
+        header_end = good.index(b"}") + 1
+        corrupt = {
+            "пусто": b"",
+            "не повтор": b"PK\x03\x04",
+            "мусор после сигнатуры": MAGIC + b"garbage",
+            "обрезан заголовок": good[:header_end - 3],
+            "обрезаны события": good[:-3],
+            "незавершённое число": MAGIC + b"\x80",
+            "заголовок не JSON": encode_header(b"{oops") + zlib.compress(b""),
+            "заголовок без поля": encode_header(b'{"seed":1}') + zlib.compress(b""),
+            "событие 0": good[:header_end] + zlib.compress(b"\x01\x00"),
+            "карта вне поля": good[:header_end] + zlib.compress(b"\x01\x09"),
+            "число обрывается в событиях": good[:header_end] + zlib.compress(b"\x01\x80"),
+        }
+        for name, data in corrupt.items():
+            with self.subTest(name), self.assertRaises(ReplayError):
+                Replay.decode(data)
+
+
+class VerifyTest(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        pygame.font.init()  # Шрифты нужны GameScreen, дисплей — нет
+
+    def setUp(self):
+        self.dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.dir)
+
+    def test_bad_file_does_not_stop_batch(self):
+        replay = Replay(dict(HEADER), [])
+        replay.header.update(replay_fast(replay))  # Партия без кликов: проигрыш по времени
+        good = replay.save(os.path.join(self.dir, "good.mtr"))
+        wrong = Replay(dict(replay.header, score=replay.header["score"] + 1), [])
+        wrong = wrong.save(os.path.join(self.dir, "wrong.mtr"))
+        bad = os.path.join(self.dir, "bad.mtr")
+        with open(bad, "wb") as f:
+            f.write(MAGIC + b"garbage")
+        missing = os.path.join(self.dir, "missing.mtr")
+
+        mismatches, broken = verify([bad, good, missing, wrong])
+        self.assertEqual([path for path, _, _ in mismatches], [wrong])
+        self.assertEqual([path for path, _ in broken], [bad, missing])
+
+
+if __name__ == "__main__":
+    unittest.main()
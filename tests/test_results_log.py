@@ -0,0 +1,151 @@
+"""
+Тесты журнала партий: испорченные строки и несколько процессов на одном журнале.
+
+Запуск (из корня репозитория):
+    python -m unittest discover tests
+"""
+import json
+import multiprocessing
+import os
+import shutil
+import tempfile
+import unittest
+
+from game.results_log import ResultsLog
+
+
+def entry_line(difficulty, score, seed=0):
+    entry = {"d": difficulty, "w": 1, "m": 10, "t": 20, "s": score, "seed": seed, "ts": 0}
+    return (json.dumps(entry, separators=(",", ":")) + "\n").encode("utf-8")
+
+
+def write_games(path, difficulty, count):
+    """Процесс-писатель: count партий в общий журнал"""
+    log = ResultsLog(path, top_n=3, sync_every=4)
+    for seed in range(count):
+        log.record(difficulty, seed % 2, 10, 20, seed, seed)
+    log.close()
+
+
+class ResultsLogTest(unittest.TestCase):
+    def setUp(self):
+        self.dir = tempfile.mkdtemp()
+        self.path = os.path.join(self.dir, "results.jsonl")
+
+    def tearDown(self):
+        shutil.rmtree(self.dir)
+
+    def open_log(self):
+        log = ResultsLog(self.path, top_n=3, sync_every=1)
+        self.addCleanup(log.close)
+        return log
+
+    def append(self, data):
+        with open(self.path, "ab") as f:
+            f.write(data)
+
+    def test_corrupt_line_is_skipped(self):
+        self.append(entry_line("easy", 100) + b'{"d":"easy",\n' + b"\xff\xfe\n" + b"[1]\n" + entry_line("easy", 300))
+        with self.assertLogs("game.results_log", "WARNING") as logs:
+            log = self.open_log()
+        self.assertEqual(len(logs.records), 3)
+        self.assertEqual(log.totals["easy"]["n"], 2)
+        self.assertEqual([entry["s"] for entry in log.leaderboard("easy")], [300, 100])
+        log.record("easy", True, 1, 1, 200, 1)
+        self.assertEqual([entry["s"] for entry in log.leaderboard("easy")], [300, 200, 100])
+
+    def test_torn_last_line(self):
+        self.append(entry_line("easy", 100) + b'{"d":"easy",')
+        log = self.open_log()
+        self.assertEqual(log.totals["easy"]["n"], 1)
+        log.record("easy", True, 1, 1, 50, 1)
+        log.close()
+        with open(self.path, "rb") as f:
+            lines = f.read().splitlines()
+        self.assertEqual(len(lines), 2)  # Недописанная строка отброшена, новая — с начала строки
+        self.assertEqual(json.loads(lines[1])["s"], 50)
+        self.assertEqual(ResultsLog(self.path, top_n=3).totals["easy"]["n"], 2)
+
+    def test_index_pointing_at_corrupt_line(self):
+        log = self.open_log()
+        log.record("easy", True, 1, 1, 100, 1)
+        log.record("hard", True, 1, 1, 200, 2)
+        log.close()
+        with open(self.path, "rb") as f:
+            data = f.read()
+        first = data.index(b"\n") + 1
+        with open(self.path, "wb") as f:  # Вторая строка испорчена, индекс указывает на её середину
+            f.write(data[:first] + b'{"d":"hard","s"' + b"\n" + entry_line("hard", 300))
+        with open(self.path + ".index", encoding="utf-8") as f:
+            index = json.load(f)
+        index["offset"] = first + 3
+        with open(self.path + ".index", "w", encoding="utf-8") as f:
+            json.dump(index, f)
+        with self.assertLogs("game.results_log", "WARNING"):
+            log = ResultsLog(self.path, top_n=3)
+        self.assertEqual({difficulty: totals["n"] for difficulty, totals in log.totals.items()},
+                         {"easy": 1, "hard": 1})
+        self.assertEqual(log.best("hard")["s"], 300)
+
+    def test_compact_moves_corrupt_lines_aside(self):
+        self.append(entry_line("easy", 100) + b"garbage\n" + entry_line("easy", 200, seed=1))
+        with self.assertLogs("game.results_log", "WARNING"):
+            log = self.open_log()
+            self.assertEqual(log.compact(keep_recent=1), (3, 2))
+        with open(self.path + ".bad", "rb") as f:
+            self.assertEqual(f.read(), b"garbage\n")
+        reopened = ResultsLog(self.path, top_n=3)
+        self.assertEqual(reopened.totals["easy"]["n"], 2)
+        self.assertEqual(reopened.best("easy")["s"], 200)
+
+
+    def assertTotals(self, log, expected):
+        self.assertEqual({difficulty: totals["n"] for difficulty, totals in log.totals.items()}, expected)
+
+    def test_two_writers(self):
+        first = ResultsLog(self.path, top_n=3)
+        second = ResultsLog(self.path, top_n=3)
+        for seed in range(3):
+            first.record("easy", True, 1, 1, 100 + seed, seed)
+            second.record("hard", True, 1, 1, 200 + seed, seed)
+        self.assertEqual(second.best("easy")["s"], 102)  # Рекорды другого процесса видны при записи
+        first.close()
+        second.close()
+        reopened = ResultsLog(self.path, top_n=3)
+        self.assertTotals(reopened, {"easy": 3, "hard": 3})
+        self.assertEqual([entry["s"] for entry in reopened.leaderboard("hard")], [202, 201, 200])
+        os.remove(self.path + ".index")
+        self.assertTotals(ResultsLog(self.path, top_n=3), {"easy": 3, "hard": 3})
+
+    def test_writer_after_compaction_by_another(self):
+        first = ResultsLog(self.path, top_n=1, sync_every=1)
+        second = ResultsLog(self.path, top_n=1, sync_every=1)
+        for seed in range(5):
+            first.record("easy", True, 1, 1, seed, seed)
+        second.record("easy", True, 1, 1, 100, 99)
+        first.compact(keep_recent=1)
+        second.record("easy", True, 1, 1, 50, 100)  # Пишет уже в сжатый файл
+        first.record("easy", True, 1, 1, 60, 101)
+        first.close()
+        second.close()
+        reopened = ResultsLog(self.path, top_n=1)
+        self.assertTotals(reopened, {"easy": 8})
+        self.assertEqual(reopened.best("easy")["s"], 100)
+
+    def test_concurrent_processes(self):
+        workers = [multiprocessing.Process(target=write_games, args=(self.path, difficulty, 200))
+                   for difficulty in ("easy", "hard")]
+        for worker in workers:
+            worker.start()
+        for worker in workers:
+            worker.join()
+            self.assertEqual(worker.exitcode, 0)
+        log = ResultsLog(self.path, top_n=3)
+        self.assertTotals(log, {"easy": 200, "hard": 200})
+        self.assertEqual([entry["s"] for entry in log.leaderboard("easy")], [199, 198, 197])
+        with open(self.path, "rb") as f:
+            self.assertEqual(len(f.read().splitlines()), 400)
+
+
+if __name__ == "__main__":
+    unittest.main()
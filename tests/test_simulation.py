@@ -0,0 +1,50 @@
+"""
+Тесты безголовой симуляции: GameEngine играет по тем же шагам, что и GameScreen.
+
+Запуск (из корня репозитория):
+    python -m unittest discover tests
+"""
+import unittest
+
+import pygame
+
+from game.memory_settings import MemorySettings
+from game.replay import InputRecorder, Replay, replay_fast
+from game.simulation import simulate_game, step_time, steps_since
+
+PLAYERS = ("perfect", "random", "limited:4", "ai:70")
+
+
+class StepTimeTest(unittest.TestCase):
+    def test_steps_since_matches_game_screen_comparison(self):
+        for steps in range(0, 5000, 7):
+            found = steps_since(steps, 1)
+            start = step_time(steps)
+            self.assertTrue(step_time(found) - start > 1)
+            self.assertFalse(step_time(found - 1) - start > 1)
+
+
+class EngineMatchesGameScreenTest(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        pygame.font.init()  # Шрифты нужны GameScreen, дисплей — нет
+
+    def test_same_clicks_same_result(self):
+        # Клики симуляции, повторённые на GameScreen, дают тот же итог до очка и секунды
+        for difficulty in ("easy", "hard", "insane"):
+            settings = MemorySettings(difficulty)
+            for player in PLAYERS:
+                for seed in range(3):
+                    with self.subTest(difficulty=difficulty, player=player, seed=seed):
+                        recorder = InputRecorder()
+                        engine = simulate_game(settings, seed, player, recorder=recorder)
+                        header = {"seed": engine.seed, "difficulty": difficulty,
+                                  "rows": settings.rows, "cols": settings.cols,
+                                  "time_limit": settings.time_limit, "max_moves": settings.max_moves}
+                        expected = {"result": engine.game_over_type, "score": engine.score,
+                                    "moves": engine.moves, "time_used": int(engine.time)}
+                        self.assertEqual(replay_fast(Replay(header, recorder.events)), expected)
+
+
+if __name__ == "__main__":
+    unittest.main()